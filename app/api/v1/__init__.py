@@ -1,7 +1,7 @@
 """API v1 라우터 통합"""
 
 from fastapi import APIRouter
-from app.api.v1 import market, stocks, ai, news
+from app.api.v1 import market, stocks, ai, news, batch
 
 router = APIRouter(prefix="/api/v1")
 
@@ -9,3 +9,4 @@ router.include_router(market.router)
 router.include_router(stocks.router)
 router.include_router(ai.router)
 router.include_router(news.router)
+router.include_router(batch.router)
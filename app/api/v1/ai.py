@@ -1,10 +1,15 @@
 """AI API 라우터"""
 
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException
+from pydantic_core import to_json
+from app.core.broadcast import SSE_HEADERS, EventStreamResponse, sse_frame
+from app.core.etag import ConditionalGetRoute
 from app.models.schemas import APIResponse
 from app.services.ai_service import AIService
 
-router = APIRouter(prefix="/ai", tags=["ai"])
+router = APIRouter(prefix="/ai", tags=["ai"], route_class=ConditionalGetRoute)
 
 
 @router.get("/market-briefing")
@@ -12,10 +17,33 @@ async def get_market_briefing() -> APIResponse:
     """마켓 브리핑 생성"""
     try:
         data = await AIService.get_market_briefing()
-        return APIResponse.success_response(data)
+        return APIResponse.encoded_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=str(e),
         )
 
+
+@router.get("/market-briefing/stream", response_class=EventStreamResponse)
+async def stream_market_briefing() -> EventStreamResponse:
+    """마켓 브리핑 스트리밍 (SSE)
+
+    - `token`: 생성 중인 모델 출력 조각 `{"delta": "..."}` (이어 붙이면 브리핑 JSON)
+    - `briefing`: 완성된 MarketBriefingResponse (마지막 이벤트)
+    - `error`: 생성 실패 `{"message": "..."}`
+
+    이미 생성된 브리핑이 있으면 token 없이 briefing 이벤트만 보낸다.
+    """
+    return EventStreamResponse(_briefing_events(), headers=SSE_HEADERS)
+
+
+async def _briefing_events() -> AsyncIterator[bytes]:
+    try:
+        async for event in AIService.stream_market_briefing():
+            if isinstance(event, str):
+                yield sse_frame("token", to_json({"delta": event}))
+            else:
+                yield sse_frame("briefing", to_json(event))
+    except Exception as e:
+        yield sse_frame("error", to_json({"message": str(e)}))
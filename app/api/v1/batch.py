@@ -0,0 +1,131 @@
+"""배치 API 라우터"""
+
+import asyncio
+import inspect
+from typing import Any, Optional
+from urllib.parse import quote, urlsplit
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_return_annotation, solve_dependencies
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic_core import to_json
+from starlette.routing import Match
+
+from app.core.admission import admission
+from app.core.config import settings
+from app.core.responses import EncodedPayload, PreEncodedJSONResponse
+from app.models.batch import BatchRequest, BatchResponse
+from app.models.schemas import APIResponse
+
+V1_PREFIX = "/api/v1"
+
+router = APIRouter(tags=["batch"])
+
+
+@router.post("/batch")
+async def batch(payload: BatchRequest, request: Request) -> APIResponse[BatchResponse]:
+    """여러 v1 GET 요청을 프로세스 내부에서 동시에 실행"""
+    tasks = [asyncio.create_task(_dispatch(request, path)) for path in payload.paths]
+    done, pending = await asyncio.wait(tasks, timeout=settings.batch_timeout)
+    for task in pending:
+        task.cancel()
+
+    results = []
+    for path, task in zip(payload.paths, tasks):
+        if task not in done:
+            status, body = 504, _error_body("TIMEOUT", "배치 처리 시간 초과")
+        elif task.cancelled() or task.exception() is not None:
+            # 개별 요청 실패는 해당 항목만 500으로 처리 (배치 전체는 성공)
+            error = "요청이 취소되었습니다" if task.cancelled() else str(task.exception())
+            status, body = 500, _error_body("INTERNAL_ERROR", error)
+        else:
+            status, body = task.result()
+        results.append(
+            b'{"path":%b,"status":%d,"body":%b}' % (to_json(path), status, body)
+        )
+
+    data = b'{"results":[' + b",".join(results) + b"]}"
+    return PreEncodedJSONResponse(EncodedPayload(None, data))
+
+
+async def _dispatch(request: Request, path: str) -> tuple[int, bytes]:
+    """단일 경로 실행 (HTTP 스택을 거치지 않고 엔드포인트 직접 호출)"""
+    parts = urlsplit(path)
+    if parts.scheme or parts.netloc or not parts.path.startswith("/"):
+        return 400, _error_body("BAD_REQUEST", "v1 기준 상대 경로만 허용됩니다")
+
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": request.url.scheme,
+        "path": V1_PREFIX + parts.path,
+        "root_path": "",
+        # 인코딩되지 않은 한글 검색어 등은 퍼센트 인코딩 (이미 인코딩된 값은 유지)
+        "query_string": quote(parts.query, safe="=&%+/:,;").encode("ascii"),
+        "headers": [],
+        "app": request.app,
+    }
+    route = _match_route(request, scope)
+    if route is None:
+        return 404, _error_body("NOT_FOUND", f"경로를 찾을 수 없습니다: {parts.path}")
+    if not _returns_json(route):
+        # 스트리밍 핸들러는 호출 시점에 구독을 시작하므로 실행 전에 거절
+        return 400, _error_body("BAD_REQUEST", f"JSON 응답 경로만 허용됩니다: {parts.path}")
+
+    # 하위 요청도 단독 요청과 같은 속도 제한/라우트별 동시 실행 제한을 적용
+    limiter = None
+    if settings.admission_enabled:
+        limiter, rejection = await admission.enter(scope, admission.client_key(request.scope))
+        if rejection is not None:
+            return rejection.status, _error_body(rejection.code, rejection.message)
+    try:
+        values, errors, *_ = await solve_dependencies(
+            request=Request(scope),
+            dependant=route.dependant,
+            dependency_overrides_provider=request.app,
+        )
+        if errors:
+            details = {"errors": [{"loc": e["loc"], "msg": e["msg"]} for e in errors]}
+            return 422, _error_body("VALIDATION_ERROR", "요청 파라미터 오류", details)
+
+        raw = await route.dependant.call(**values)
+    except HTTPException as e:
+        return e.status_code, _error_body("HTTP_ERROR", str(e.detail))
+    except Exception as e:
+        return 500, _error_body("INTERNAL_ERROR", str(e))
+    finally:
+        if limiter is not None:
+            limiter.release()
+
+    if isinstance(raw, Response):
+        return raw.status_code, raw.body
+    return 200, to_json(raw)
+
+
+def _match_route(request: Request, scope: dict[str, Any]) -> Optional[APIRoute]:
+    for route in request.app.router.routes:
+        if not isinstance(route, APIRoute) or not route.path.startswith(V1_PREFIX):
+            continue
+        match, child_scope = route.matches(scope)
+        if match is Match.FULL:
+            scope.update(child_scope)
+            return route
+    return None
+
+
+def _returns_json(route: APIRoute) -> bool:
+    """JSON 응답 라우트 여부 (response_class와 엔드포인트 반환 타입으로 판단, SSE 등 스트리밍 제외)"""
+    response_class = route.response_class
+    if isinstance(response_class, DefaultPlaceholder):
+        response_class = response_class.value
+    if not issubclass(response_class, JSONResponse):
+        return False
+    returns = get_typed_return_annotation(route.endpoint)
+    return not (inspect.isclass(returns) and issubclass(returns, StreamingResponse))
+
+
+def _error_body(code: str, message: str, details: Optional[dict[str, Any]] = None) -> bytes:
+    return to_json(APIResponse.error_response(code, message, details))
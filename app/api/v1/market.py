@@ -3,10 +3,12 @@
 from fastapi import APIRouter, Query, HTTPException
 from typing import Literal
 from app.models.market import SegmentType
+from app.core.broadcast import EventStreamResponse, event_stream_response
+from app.core.etag import ConditionalGetRoute
 from app.models.schemas import APIResponse
-from app.services.market_service import MarketService
+from app.services.market_service import MarketService, summary_topic
 
-router = APIRouter(prefix="/market", tags=["market"])
+router = APIRouter(prefix="/market", tags=["market"], route_class=ConditionalGetRoute)
 
 
 @router.get("/summary")
@@ -16,7 +18,7 @@ async def get_market_summary(
     """마켓 요약 조회"""
     try:
         data = await MarketService.get_market_summary(seg)
-        return APIResponse.success_response(data)
+        return APIResponse.encoded_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -24,6 +26,22 @@ async def get_market_summary(
         )
 
 
+@router.get("/summary/stream", response_class=EventStreamResponse)
+async def stream_market_summary(
+    seg: SegmentType = Query(..., description="세그먼트 (KR|US|CRYPTO|COMMO)")
+) -> EventStreamResponse:
+    """마켓 요약 실시간 구독 (SSE)"""
+    try:
+        # 최신 요약을 준비해 두어 구독 직후 첫 이벤트로 전달
+        await MarketService.get_market_summary(seg)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e),
+        )
+    return event_stream_response(summary_topic(seg))
+
+
 @router.get("/sectors")
 async def get_market_sectors(
     seg: SegmentType = Query(..., description="세그먼트 (KR|US|CRYPTO|COMMO)")
@@ -31,7 +49,7 @@ async def get_market_sectors(
     """마켓 섹터 조회"""
     try:
         data = await MarketService.get_market_sectors(seg)
-        return APIResponse.success_response(data)
+        return APIResponse.encoded_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -46,7 +64,7 @@ async def get_market_flow(
     """마켓 자금 흐름 조회"""
     try:
         data = await MarketService.get_market_flow(seg)
-        return APIResponse.success_response(data)
+        return APIResponse.encoded_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
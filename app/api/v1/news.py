@@ -1,22 +1,54 @@
 """뉴스 API 라우터"""
 
+from typing import Optional
 from fastapi import APIRouter, Path, Query, HTTPException
+from app.core.broadcast import EventStreamResponse, event_stream_response
+from app.core.etag import ConditionalGetRoute
 from app.models.schemas import APIResponse
-from app.services.news_service import NewsService
+from app.services.news_service import BREAKING_TOPIC, NewsService
 
-router = APIRouter(prefix="/news", tags=["news"])
+router = APIRouter(prefix="/news", tags=["news"], route_class=ConditionalGetRoute)
 
 
 @router.get("/list")
 async def get_news_list(
     category: str = Query(default="전체", description="카테고리"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
-    limit: int = Query(default=20, ge=1, le=100, description="페이지당 개수")
+    limit: int = Query(default=20, ge=1, le=100, description="페이지당 개수"),
+    cursor: Optional[str] = Query(default=None, description="다음 페이지 커서 (next_cursor)"),
 ) -> APIResponse:
     """뉴스 리스트 조회"""
     try:
-        data = await NewsService.get_news_list(category, page, limit)
-        return APIResponse.success_response(data)
+        data = await NewsService.get_news_list(category, page, limit, cursor)
+        return APIResponse.encoded_response(data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e),
+        )
+
+
+@router.get("/search")
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    category: str = Query(default="전체", description="카테고리"),
+    limit: int = Query(default=20, ge=1, le=100, description="페이지당 개수"),
+    cursor: Optional[str] = Query(default=None, description="다음 페이지 커서 (next_cursor)"),
+) -> APIResponse:
+    """뉴스 검색 (제목/요약/태그)"""
+    try:
+        data = await NewsService.search_news(q, category, limit, cursor)
+        return APIResponse.encoded_response(data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -31,7 +63,7 @@ async def get_breaking_news(
     """속보 뉴스 조회"""
     try:
         data = await NewsService.get_breaking_news(limit)
-        return APIResponse.success_response(data)
+        return APIResponse.trusted_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -39,6 +71,12 @@ async def get_breaking_news(
         )
 
 
+@router.get("/breaking/stream", response_class=EventStreamResponse)
+async def stream_breaking_news() -> EventStreamResponse:
+    """속보 뉴스 실시간 구독 (SSE)"""
+    return event_stream_response(BREAKING_TOPIC)
+
+
 @router.get("/{news_id}")
 async def get_news_detail(
     news_id: str = Path(..., description="뉴스 ID")
@@ -46,7 +84,12 @@ async def get_news_detail(
     """뉴스 상세 조회"""
     try:
         data = await NewsService.get_news_detail(news_id)
-        return APIResponse.success_response(data)
+        return APIResponse.encoded_response(data)
+    except LookupError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -2,10 +2,11 @@
 
 from fastapi import APIRouter, Query, HTTPException
 from app.models.stocks import MarketType
+from app.core.etag import ConditionalGetRoute
 from app.models.schemas import APIResponse
 from app.services.stocks_service import StocksService
 
-router = APIRouter(prefix="/stocks", tags=["stocks"])
+router = APIRouter(prefix="/stocks", tags=["stocks"], route_class=ConditionalGetRoute)
 
 
 @router.get("/popular")
@@ -16,7 +17,7 @@ async def get_popular_stocks(
     """인기 주식 조회"""
     try:
         data = await StocksService.get_popular_stocks(market, limit)
-        return APIResponse.success_response(data)
+        return APIResponse.encoded_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -32,7 +33,7 @@ async def get_surging_stocks(
     """급등 주식 조회"""
     try:
         data = await StocksService.get_surging_stocks(limit, mix)
-        return APIResponse.success_response(data)
+        return APIResponse.trusted_response(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
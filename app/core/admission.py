@@ -0,0 +1,411 @@
+"""요청 수락 제어 (라우트별 동시 실행 제한, 과부하 시 부하 차단, 클라이언트별 요청 속도 제한)
+
+- /health, /ready, /metrics 등 운영 경로는 제한 없이 통과
+- /api/v1 요청은 라우트별 동시 실행 슬롯을 얻어야 실행되고, 슬롯이 없으면 짧은 대기열에서
+  ADMISSION_QUEUE_TIMEOUT까지만 기다린다. 대기열이 가득 차거나 시간을 넘기면 바로 503
+- 무거운 라우트(AI 브리핑, 배치, 큰 뉴스 목록/검색)는 슬롯이 적고, 전체 처리 중 요청이
+  ADMISSION_SHED_THRESHOLD를 넘으면 대기 없이 먼저 거절한다
+- 클라이언트(IP)별 토큰 버킷으로 초당 요청 수를 제한 (초과 시 429, 기본 꺼짐)
+- 배치 API의 하위 요청도 각각 같은 기준(속도 제한, 라우트별 슬롯)으로 수락한다
+"""
+
+import asyncio
+import ipaddress
+import logging
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, NamedTuple, Optional
+from urllib.parse import parse_qsl
+
+from fastapi.routing import APIRoute
+from pydantic_core import to_json
+from starlette.datastructures import Headers
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.broadcast import is_event_stream
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+
+# 제한 없이 통과시키는 운영 경로
+CRITICAL_PATHS = frozenset({"/", "/health", "/ready", "/metrics"})
+
+# 이 개수 이상을 요청하는 뉴스 목록/검색은 무거운 요청으로 분류
+HEAVY_NEWS_LIMIT = 50
+
+# 무거운 요청이 소모하는 토큰 수 (일반 요청은 1)
+HEAVY_COST = 4.0
+
+admission_rejected = registry.counter(
+    "admission_rejected_total", "수락 제어로 거절된 요청 수 (라우트/사유별)"
+)
+admission_queue_wait = registry.histogram(
+    "admission_queue_wait_seconds", "동시 실행 슬롯 대기 시간 (라우트별)"
+)
+
+
+class Rejection(NamedTuple):
+    """거절 응답 (상태 코드, Retry-After 초, 오류 코드, 메시지)"""
+
+    status: int
+    retry_after: float
+    code: str
+    message: str
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self, cost: float = 1.0) -> float:
+        """토큰 소모 (성공하면 0, 부족하면 다시 시도할 때까지 남은 초)"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class ConcurrencyLimiter:
+    """동시 실행 수 제한 + bounded 대기열
+
+    슬롯이 비면 대기 순서대로 넘겨준다 (release 시 active를 줄이지 않고 그대로 인계).
+    대기열이 가득 찼거나 queue_timeout 안에 슬롯을 받지 못하면 acquire가 사유를 반환한다.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, heavy: bool = False) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.heavy = heavy
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> Optional[str]:
+        """슬롯 획득 (성공하면 None, 실패하면 거절 사유)"""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return None
+        if len(self._waiters) >= self.queue_size:
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait((waiter,), timeout=timeout)
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소: 이미 받은 슬롯이면 다음 대기자에게 넘김
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+        if waiter.done():
+            return None
+        self._discard(waiter)
+        return "queue_timeout"
+
+    def release(self) -> None:
+        """슬롯 반환 (대기자가 있으면 인계)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+class AdmissionController:
+    """라우트 분류, 동시 실행 슬롯, 클라이언트별 토큰 버킷"""
+
+    def __init__(
+        self,
+        heavy_routes: dict[str, Optional[Callable[[Scope], bool]]],
+        heavy_concurrency: int,
+        heavy_queue: int,
+        default_concurrency: int,
+        default_queue: int,
+        queue_timeout: float,
+        shed_threshold: int,
+        rate_limit: float,
+        rate_burst: float,
+        max_clients: int,
+        trust_forwarded: bool,
+        trusted_proxies: frozenset[str] = frozenset(),
+    ) -> None:
+        self.heavy_routes = heavy_routes
+        self.queue_timeout = queue_timeout
+        self.shed_threshold = shed_threshold
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.max_clients = max_clients
+        self.trust_forwarded = trust_forwarded
+        self.trusted_proxies = trusted_proxies
+        # 주소 범위(CIDR)로 지정된 신뢰 프록시
+        self._trusted_networks = tuple(
+            ipaddress.ip_network(entry, strict=False) for entry in trusted_proxies if "/" in entry
+        )
+        # 무거운 라우트는 각자 슬롯을 갖고, 나머지 /api/v1 라우트는 공용 슬롯을 사용
+        self.limiters = {
+            path: ConcurrencyLimiter(path, heavy_concurrency, heavy_queue, heavy=True)
+            for path in heavy_routes
+        }
+        self.default = ConcurrencyLimiter("default", default_concurrency, default_queue)
+        self._buckets: dict[str, TokenBucket] = {}
+        if rate_limit > 0 and not (trust_forwarded and trusted_proxies):
+            # 프록시 뒤에서는 연결 주소가 모두 프록시이므로 전체 클라이언트가 버킷 하나를 공유
+            logger.warning(
+                "요청 속도 제한이 연결 주소 기준으로 동작합니다. 프록시 뒤라면 "
+                "TRUST_FORWARDED_FOR/TRUSTED_PROXIES를 설정하세요"
+            )
+
+    @property
+    def in_flight(self) -> int:
+        """슬롯을 점유 중인 요청 수"""
+        return self.default.active + sum(limiter.active for limiter in self.limiters.values())
+
+    def classify(self, scope: Scope) -> ConcurrencyLimiter:
+        """요청 → 동시 실행 제한 대상 (조건부 무거운 라우트는 조건을 만족할 때만)"""
+        path = scope["path"]
+        if path in self.heavy_routes:
+            condition = self.heavy_routes[path]
+            if condition is None or condition(scope):
+                return self.limiters[path]
+        return self.default
+
+    async def enter(
+        self, scope: Scope, client: Optional[str] = None, streaming: bool = False
+    ) -> tuple[Optional[ConcurrencyLimiter], Optional[Rejection]]:
+        """요청 수락 → (반환할 슬롯, 거절 사유)
+
+        속도 제한 후 동시 실행 슬롯을 얻는다. SSE 스트림(streaming)은 속도 제한만 적용해 슬롯이 없다.
+        client가 없으면 scope에서 클라이언트 키를 구한다 (배치 하위 요청은 원 요청의 키 사용).
+        """
+        limiter = self.classify(scope)
+        labels = (("route", limiter.name),)
+
+        cost = HEAVY_COST if limiter.heavy else 1.0
+        wait = self.throttle(client or self.client_key(scope), cost)
+        if wait > 0:
+            admission_rejected.inc(labels + (("reason", "rate_limited"),))
+            return None, Rejection(
+                429, wait, "RATE_LIMITED", "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요"
+            )
+
+        if streaming:
+            return None, None
+
+        reason = await self.admit(limiter)
+        if reason is not None:
+            admission_rejected.inc(labels + (("reason", reason),))
+            return None, Rejection(
+                503,
+                settings.admission_retry_after,
+                "OVERLOADED",
+                "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요",
+            )
+        return limiter, None
+
+    async def admit(self, limiter: ConcurrencyLimiter) -> Optional[str]:
+        """슬롯 획득 (거절 시 사유: shed | queue_full | queue_timeout)"""
+        if limiter.heavy and self.in_flight >= self.shed_threshold:
+            # 전체가 붐비면 무거운 요청은 대기시키지 않고 먼저 차단
+            return "shed"
+        started = time.perf_counter()
+        reason = await limiter.acquire(self.queue_timeout)
+        if reason is None:
+            admission_queue_wait.observe(time.perf_counter() - started, (("route", limiter.name),))
+        return reason
+
+    def throttle(self, client: str, cost: float) -> float:
+        """클라이언트 요청 속도 확인 (허용하면 0, 아니면 재시도까지 남은 초)"""
+        if self.rate_limit <= 0:
+            return 0.0
+        bucket = self._buckets.pop(client, None)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_limit, self.rate_burst)
+        # dict 삽입 순서 = 최근 사용 순서 (오래 안 쓴 클라이언트부터 제거)
+        self._buckets[client] = bucket
+        while len(self._buckets) > self.max_clients:
+            del self._buckets[next(iter(self._buckets))]
+        return bucket.take(cost)
+
+    def client_key(self, scope: Scope) -> str:
+        """속도 제한 키 (신뢰 프록시를 거친 요청이면 X-Forwarded-For의 클라이언트 주소)"""
+        client = scope.get("client")
+        peer = client[0] if client else "unknown"
+        if self.trust_forwarded and self.is_trusted(peer):
+            forwarded = Headers(scope=scope).get("x-forwarded-for")
+            if forwarded:
+                # 클라이언트가 보낸 앞쪽 값은 위조할 수 있으므로 뒤(가까운 프록시)에서부터
+                # 신뢰 프록시가 아닌 첫 주소를 사용
+                for address in reversed(forwarded.split(",")):
+                    address = address.strip()
+                    if address and not self.is_trusted(address):
+                        return address
+        return peer
+
+    def is_trusted(self, address: str) -> bool:
+        """신뢰 프록시 주소 여부 (TRUSTED_PROXIES의 주소 또는 CIDR 범위)"""
+        if address in self.trusted_proxies:
+            return True
+        if not self._trusted_networks:
+            return False
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self._trusted_networks)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """limiter별 현재 상태"""
+        return {
+            limiter.name: {
+                "active": limiter.active,
+                "queued": limiter.queued,
+                "limit": limiter.limit,
+                "heavy": limiter.heavy,
+            }
+            for limiter in (self.default, *self.limiters.values())
+        }
+
+
+def _large_limit(scope: Scope) -> bool:
+    for key, value in parse_qsl(scope["query_string"].decode("latin-1")):
+        if key == "limit":
+            return value.isdigit() and int(value) >= HEAVY_NEWS_LIMIT
+    return False
+
+
+# 무거운 라우트 (경로 → 추가 조건, None이면 항상)
+HEAVY_ROUTES: dict[str, Optional[Callable[[Scope], bool]]] = {
+    f"{API_PREFIX}/ai/market-briefing": None,
+    f"{API_PREFIX}/batch": None,
+    f"{API_PREFIX}/news/list": _large_limit,
+    f"{API_PREFIX}/news/search": _large_limit,
+}
+
+admission = AdmissionController(
+    heavy_routes=HEAVY_ROUTES,
+    heavy_concurrency=settings.admission_heavy_concurrency,
+    heavy_queue=settings.admission_heavy_queue,
+    default_concurrency=settings.admission_default_concurrency,
+    default_queue=settings.admission_default_queue,
+    queue_timeout=settings.admission_queue_timeout,
+    shed_threshold=settings.admission_shed_threshold,
+    rate_limit=settings.rate_limit_per_second,
+    rate_burst=settings.rate_limit_burst,
+    max_clients=settings.rate_limit_max_clients,
+    trust_forwarded=settings.trust_forwarded_for,
+    trusted_proxies=frozenset(
+        address.strip() for address in settings.trusted_proxies.split(",") if address.strip()
+    ),
+)
+
+
+def _reject_body(code: str, message: str) -> bytes:
+    """공통 실패 응답 포맷 (APIResponse.error_response와 같은 구조)"""
+    return to_json(
+        {
+            "success": False,
+            "data": None,
+            "error": {"code": code, "message": message, "details": None},
+            "meta": {
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "version": "v1",
+            },
+        }
+    )
+
+
+async def _reject(send: Send, rejection: Rejection) -> None:
+    status, retry_after, code, message = rejection
+    body = _reject_body(code, message)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+                (b"cache-control", b"no-store"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """/api/v1 요청 수락 제어 (순수 ASGI)
+
+    거절 응답은 라우팅/핸들러를 거치지 않고 바로 보낸다 (503/429 + Retry-After).
+    SSE 스트림은 오래 연결되므로 동시 실행 슬롯 대신 연결 시 속도 제한만 적용한다.
+    스트리밍 라우트는 response_class가 EventStreamResponse인 라우트로, 첫 요청 때 앱에서 찾는다.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController = admission) -> None:
+        self.app = app
+        self.controller = controller
+        self._streaming_routes: Optional[list[APIRoute]] = None
+
+    def _is_streaming(self, scope: Scope) -> bool:
+        routes = self._streaming_routes
+        if routes is None:
+            routes = self._streaming_routes = [
+                route
+                for route in scope["app"].router.routes
+                if isinstance(route, APIRoute) and is_event_stream(route)
+            ]
+        return any(route.matches(scope)[0] is Match.FULL for route in routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            not settings.admission_enabled
+            or scope["type"] != "http"
+            or path in CRITICAL_PATHS
+            or not path.startswith(API_PREFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limiter, rejection = await self.controller.enter(
+            scope, streaming=self._is_streaming(scope)
+        )
+        if rejection is not None:
+            await _reject(send, rejection)
+            return
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -0,0 +1,174 @@
+"""Server-Sent Events 브로드캐스트 허브"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_FRAME = b": ping\n\n"
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+class EventStreamResponse(StreamingResponse):
+    """SSE 응답 (라우트의 response_class로 지정해 스트리밍 라우트임을 표시)"""
+
+    media_type = "text/event-stream"
+
+
+def is_event_stream(route: APIRoute) -> bool:
+    """response_class가 EventStreamResponse인 SSE 라우트 여부"""
+    response_class = getattr(route.response_class, "value", route.response_class)
+    return isinstance(response_class, type) and issubclass(response_class, EventStreamResponse)
+
+
+def sse_frame(event: str, data: bytes) -> bytes:
+    """SSE 이벤트 프레임 (data는 한 줄 JSON)"""
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + data + b"\n\n"
+
+
+class Subscription:
+    """구독 연결 (연결별 bounded 큐)"""
+
+    __slots__ = ("topic", "queue", "closed")
+
+    def __init__(self, topic: str, queue_size: int) -> None:
+        self.topic = topic
+        self.queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def offer(self, frame: bytes) -> bool:
+        """프레임 적재 (큐가 가득 차면 False)"""
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self) -> None:
+        """대기 중 프레임을 버리고 스트림 종료 신호 전달"""
+        if self.closed:
+            return
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class BroadcastHub:
+    """토픽별 SSE 팬아웃
+
+    업데이트는 토픽당 한 번만 SSE 프레임으로 직렬화하고 같은 바이트를
+    모든 구독자 큐에 넣는다. 큐가 가득 찬(느린) 구독자는 끊는다.
+    하트비트는 허브 단일 타이머로 전체 구독자에게 보낸다.
+    """
+
+    def __init__(self, queue_size: int, heartbeat_interval: float) -> None:
+        self.queue_size = queue_size
+        self.heartbeat_interval = heartbeat_interval
+        self.evictions = 0
+        self._topics: dict[str, set[Subscription]] = {}
+        self._latest: dict[str, tuple[Optional[str], bytes]] = {}
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        """구독자 수"""
+        if topic is not None:
+            return len(self._topics.get(topic, ()))
+        return sum(len(subs) for subs in self._topics.values())
+
+    def subscribe(self, topic: str) -> Subscription:
+        """토픽 구독 (최신 프레임이 있으면 바로 전달)"""
+        sub = Subscription(topic, self.queue_size)
+        self._topics.setdefault(topic, set()).add(sub)
+        latest = self._latest.get(topic)
+        if latest is not None:
+            sub.offer(latest[1])
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        """구독 해제"""
+        subs = self._topics.get(sub.topic)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._topics[sub.topic]
+
+    def publish(self, topic: str, data: bytes, version: Optional[str] = None) -> int:
+        """업데이트 발행 (같은 version이면 무시, 전달된 구독자 수 반환)"""
+        latest = self._latest.get(topic)
+        if version is not None and latest is not None and latest[0] == version:
+            return 0
+
+        frame = sse_frame(topic, data)
+        self._latest[topic] = (version, frame)
+
+        delivered = 0
+        for sub in list(self._topics.get(topic, ())):
+            if sub.offer(frame):
+                delivered += 1
+            else:
+                self._evict(sub)
+        return delivered
+
+    async def stream(self, sub: Subscription) -> AsyncIterator[bytes]:
+        """구독 큐를 SSE 바이트 스트림으로 변환"""
+        try:
+            while True:
+                frame = await sub.queue.get()
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            self.unsubscribe(sub)
+
+    def start(self) -> None:
+        """하트비트 시작"""
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.get_running_loop().create_task(self._run_heartbeat())
+
+    async def stop(self) -> None:
+        """하트비트 중지 및 전체 구독 종료"""
+        task, self._heartbeat = self._heartbeat, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for subs in list(self._topics.values()):
+            for sub in list(subs):
+                sub.close()
+        self._topics.clear()
+
+    async def _run_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for subs in list(self._topics.values()):
+                for sub in list(subs):
+                    if not sub.offer(HEARTBEAT_FRAME):
+                        self._evict(sub)
+
+    def _evict(self, sub: Subscription) -> None:
+        self.evictions += 1
+        logger.debug("evicting slow SSE subscriber on %s", sub.topic)
+        self.unsubscribe(sub)
+        sub.close()
+
+
+hub = BroadcastHub(
+    queue_size=settings.sse_queue_size,
+    heartbeat_interval=settings.sse_heartbeat_interval,
+)
+
+
+def event_stream_response(topic: str) -> EventStreamResponse:
+    """토픽 구독 SSE 응답"""
+    sub = hub.subscribe(topic)
+    return EventStreamResponse(hub.stream(sub), headers=SSE_HEADERS)
@@ -0,0 +1,147 @@
+"""인메모리 캐시 (stale-while-revalidate)"""
+
+import asyncio
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+Loader = Callable[[], Awaitable[Any]]
+UpdateListener = Callable[[Hashable, Any], None]
+
+
+@dataclass
+class CacheStats:
+    """캐시 카운터"""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+
+
+class SWRCache:
+    """키별 TTL 캐시
+
+    - TTL 이내: 캐시 값을 그대로 반환
+    - TTL 경과 후 stale_ttl 이내: 기존 값을 반환하고 백그라운드 갱신을 1회만 실행
+    - 그 이후(또는 미존재): 업스트림 조회, 동시 요청은 하나의 조회로 합침
+
+    max_entries를 주면 가장 오래 사용되지 않은 키부터 제거한다 (LRU).
+    무효화 시 진행 중인 조회는 기다리던 요청에만 결과를 돌려주고 캐시에는 저장하지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        stale_ttl: float,
+        on_update: Optional[UpdateListener] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.on_update = on_update
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats = CacheStats()
+
+    async def get(self, key: Hashable, loader: Loader) -> Any:
+        """캐시 조회 (없으면 loader로 채움)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self.max_entries is not None:
+                # 최근 사용 순서 유지 (dict 삽입 순서 = LRU 순서)
+                self._entries[key] = self._entries.pop(key)
+            age = time.monotonic() - entry.stored_at
+            if age < self.ttl:
+                self._stats.hits += 1
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self._stats.stale_hits += 1
+                if key not in self._inflight:
+                    self._start_refresh(key, loader)
+                return entry.value
+
+        self._stats.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_refresh(key, loader)
+        else:
+            self._stats.coalesced += 1
+        # 대기 중인 요청이 취소되어도 공유 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """만료 여부와 무관하게 저장된 값 반환"""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 직접 저장"""
+        if self.max_entries is not None:
+            self._entries.pop(key, None)
+        self._entries[key] = _Entry(value=value, stored_at=time.monotonic())
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                evicted = next(iter(self._entries))
+                del self._entries[evicted]
+                self._stats.evictions += 1
+                self._on_removed(evicted)
+        if self.on_update is not None:
+            self.on_update(key, value)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """키(또는 전체) 무효화 (진행 중인 조회 결과도 저장하지 않음)"""
+        if key is None:
+            removed = list(self._entries)
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            removed = [key] if self._entries.pop(key, None) is not None else []
+            self._inflight.pop(key, None)
+        for removed_key in removed:
+            self._on_removed(removed_key)
+
+    def stats(self) -> Dict[str, int]:
+        """카운터 스냅샷"""
+        return asdict(self._stats)
+
+    def _on_removed(self, key: Hashable) -> None:
+        """LRU 제거/무효화로 키가 빠졌을 때 호출 (하위 클래스의 키별 상태 정리용)"""
+
+    def _start_refresh(self, key: Hashable, loader: Loader) -> asyncio.Task:
+        self._stats.refreshes += 1
+        task = asyncio.get_running_loop().create_task(self._refresh(key, loader))
+        self._inflight[key] = task
+        task.add_done_callback(self._on_refresh_done)
+        return task
+
+    async def _refresh(self, key: Hashable, loader: Loader) -> Any:
+        try:
+            value = await loader()
+            if self._owns_refresh(key):
+                self.set(key, value)
+            return value
+        finally:
+            if self._owns_refresh(key):
+                del self._inflight[key]
+
+    def _owns_refresh(self, key: Hashable) -> bool:
+        """현재 태스크가 키의 진행 중인 조회인지 (무효화로 분리되었으면 False)"""
+        return self._inflight.get(key) is asyncio.current_task()
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        # 백그라운드 갱신 실패는 기존 값을 유지하고 카운트만 증가
+        if not task.cancelled() and task.exception() is not None:
+            self._stats.refresh_errors += 1
@@ -0,0 +1,190 @@
+"""응답 압축 (gzip/brotli)"""
+
+import struct
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from typing import Any, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+# 압축하지 않는 Content-Type (스트리밍/이미 압축된 형식)
+_SKIP_MEDIA_PREFIXES = ("text/event-stream", "image/", "video/", "audio/")
+
+
+@dataclass
+class CompressionStats:
+    """압축 카운터"""
+
+    compressed: int = 0
+    precompressed_hits: int = 0
+    skipped_small: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+
+
+stats = CompressionStats()
+
+
+def compression_stats() -> dict[str, Any]:
+    """압축 카운터 스냅샷 (ratio = 압축 후 / 압축 전)"""
+    snapshot = asdict(stats)
+    snapshot["ratio"] = stats.bytes_out / stats.bytes_in if stats.bytes_in else 0.0
+    return snapshot
+
+
+def choose_encoding(accept_encoding: Optional[str], allow_brotli: bool = True) -> Optional[str]:
+    """Accept-Encoding 협상 → "br" | "gzip" | None"""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    wildcard = weights.get("*", 0.0)
+    if allow_brotli and brotli is not None and weights.get("br", wildcard) > 0:
+        return "br"
+    if weights.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def deflate_segment(data: bytes) -> bytes:
+    """raw deflate 세그먼트 (sync flush로 끝나 다른 세그먼트와 이어 붙일 수 있음)"""
+    compressor = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def gzip_spliced(prefix: bytes, body: bytes, body_deflated: bytes, suffix: bytes) -> bytes:
+    """미리 압축한 body 세그먼트 앞뒤에 prefix/suffix를 이어 하나의 gzip 스트림 생성
+
+    body의 deflate 결과는 재사용하고 요청마다 바뀌는 짧은 prefix/suffix만 압축한다.
+    """
+    start = time.thread_time()
+    head = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    tail = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = zlib.crc32(suffix, zlib.crc32(body, zlib.crc32(prefix)))
+    size = len(prefix) + len(body) + len(suffix)
+    compressed = b"".join(
+        (
+            _GZIP_HEADER,
+            head.compress(prefix),
+            head.flush(zlib.Z_SYNC_FLUSH),
+            body_deflated,
+            tail.compress(suffix),
+            tail.flush(zlib.Z_FINISH),
+            struct.pack("<II", crc, size & 0xFFFFFFFF),
+        )
+    )
+    _record(size, len(compressed), time.thread_time() - start)
+    stats.precompressed_hits += 1
+    return compressed
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 전체 압축"""
+    start = time.thread_time()
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=settings.brotli_quality)
+    else:
+        compressor = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+        compressed = compressor.compress(body) + compressor.flush()
+    _record(len(body), len(compressed), time.thread_time() - start)
+    return compressed
+
+
+def mark_encoded(headers: MutableHeaders, encoding: str, length: int) -> None:
+    """압축 응답 헤더 설정 (ETag는 표현이 달라지므로 weak로 변경)"""
+    headers["Content-Encoding"] = encoding
+    headers["Content-Length"] = str(length)
+    headers.add_vary_header("Accept-Encoding")
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+def _record(size_in: int, size_out: int, cpu: float) -> None:
+    stats.compressed += 1
+    stats.bytes_in += size_in
+    stats.bytes_out += size_out
+    stats.cpu_seconds += cpu
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 기반 응답 압축
+
+    단일 청크 응답 중 minimum_size 이상만 압축한다. 스트리밍(SSE 등) 응답과
+    이미 Content-Encoding이 지정된 응답(사전 압축 경로)은 그대로 전달한다.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "")
+                passthrough = "content-encoding" in headers or media_type.startswith(
+                    _SKIP_MEDIA_PREFIXES
+                )
+                if passthrough:
+                    await send(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            assert start_message is not None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # 스트리밍 응답/작은 응답은 압축하지 않음
+                if not message.get("more_body", False):
+                    stats.skipped_small += 1
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers = MutableHeaders(raw=start_message["headers"])
+            mark_encoded(headers, encoding, len(compressed))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
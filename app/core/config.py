@@ -13,9 +13,57 @@ class Settings(BaseSettings):
     supabase_service_role_key: Optional[str] = Field(
         default=None, alias="SUPABASE_SERVICE_ROLE_KEY"
     )
+    supabase_max_connections: int = Field(default=20, alias="SUPABASE_MAX_CONNECTIONS")
+    supabase_max_keepalive: int = Field(default=10, alias="SUPABASE_MAX_KEEPALIVE")
+    supabase_timeout: float = Field(default=5.0, alias="SUPABASE_TIMEOUT")
+    supabase_max_concurrency: int = Field(default=16, alias="SUPABASE_MAX_CONCURRENCY")
 
     # OpenAI 설정 (선택적)
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
+    openai_model: str = Field(default="gpt-4o-mini", alias="OPENAI_MODEL")
+
+    # 뉴스 저장소 설정
+    news_retention_hours: float = Field(default=72.0, alias="NEWS_RETENTION_HOURS")
+    news_breaking_size: int = Field(default=50, alias="NEWS_BREAKING_SIZE")
+    # 검색 순위 최신성 반감기 (시간, 제목 일치 가중치도 이 시간만큼의 최신성으로 환산)
+    news_search_half_life_hours: float = Field(default=6.0, alias="NEWS_SEARCH_HALF_LIFE_HOURS")
+    # 수집 시 유사 기사 병합 기준 (제목+요약 토큰 자카드 유사도, 0이면 병합하지 않음)
+    news_dedupe_threshold: float = Field(default=0.9, ge=0.0, le=1.0, alias="NEWS_DEDUPE_THRESHOLD")
+
+    # SSE 설정
+    sse_queue_size: int = Field(default=16, alias="SSE_QUEUE_SIZE")
+    sse_heartbeat_interval: float = Field(default=15.0, alias="SSE_HEARTBEAT_INTERVAL")
+
+    # 응답 압축 설정
+    compression_min_size: int = Field(default=1024, alias="COMPRESSION_MIN_SIZE")
+    gzip_level: int = Field(default=6, alias="GZIP_LEVEL")
+    brotli_quality: int = Field(default=4, alias="BROTLI_QUALITY")
+
+    # 배치 API 설정
+    batch_max_requests: int = Field(default=20, alias="BATCH_MAX_REQUESTS")
+    batch_timeout: float = Field(default=3.0, alias="BATCH_TIMEOUT")
+
+    # 마켓 브리핑 갱신 설정 (초)
+    briefing_check_interval: float = Field(default=60.0, alias="BRIEFING_CHECK_INTERVAL")
+    briefing_max_age: float = Field(default=900.0, alias="BRIEFING_MAX_AGE")
+    # 입력 해시별 브리핑 캐시 (개수, 생성 중 워커 간 락 유지 시간)
+    briefing_cache_size: int = Field(default=64, alias="BRIEFING_CACHE_SIZE")
+    briefing_lock_ttl: float = Field(default=60.0, alias="BRIEFING_LOCK_TTL")
+    # 프롬프트 입력 토큰 예산 (근사치)
+    briefing_input_token_budget: int = Field(default=1500, alias="BRIEFING_INPUT_TOKEN_BUDGET")
+    # OpenAI 키가 없을 때 가짜 토큰 생성기의 토큰 간격 (초, 스트리밍 확인용)
+    briefing_fake_token_delay: float = Field(default=0.0, alias="BRIEFING_FAKE_TOKEN_DELAY")
+
+    # 업스트림 데이터 제공자 설정 (URL이 없으면 Mock 데이터 사용)
+    upstream_base_url: Optional[str] = Field(default=None, alias="UPSTREAM_BASE_URL")
+    upstream_max_connections: int = Field(default=50, alias="UPSTREAM_MAX_CONNECTIONS")
+    upstream_max_per_host: int = Field(default=10, alias="UPSTREAM_MAX_PER_HOST")
+    upstream_connect_timeout: float = Field(default=1.0, alias="UPSTREAM_CONNECT_TIMEOUT")
+    upstream_read_timeout: float = Field(default=3.0, alias="UPSTREAM_READ_TIMEOUT")
+    upstream_retries: int = Field(default=2, alias="UPSTREAM_RETRIES")
+    upstream_retry_budget_ratio: float = Field(default=0.2, alias="UPSTREAM_RETRY_BUDGET_RATIO")
+    upstream_breaker_threshold: int = Field(default=5, alias="UPSTREAM_BREAKER_THRESHOLD")
+    upstream_breaker_reset: float = Field(default=30.0, alias="UPSTREAM_BREAKER_RESET")
 
     # 애플리케이션 설정
     environment: Literal["development", "staging", "production"] = Field(
@@ -23,6 +71,54 @@ class Settings(BaseSettings):
     )
     debug: bool = Field(default=False, alias="DEBUG")
 
+    # 멀티 워커 설정 (2 이상이면 워커 간 공유 메모리 스냅샷 사용)
+    web_concurrency: int = Field(default=1, ge=1, alias="WEB_CONCURRENCY")
+    snapshot_path: Optional[str] = Field(default=None, alias="SNAPSHOT_PATH")
+    snapshot_size_mb: int = Field(default=16, alias="SNAPSHOT_SIZE_MB")
+    snapshot_takeover_interval: float = Field(default=2.0, alias="SNAPSHOT_TAKEOVER_INTERVAL")
+    snapshot_poll_interval: float = Field(default=0.5, gt=0, alias="SNAPSHOT_POLL_INTERVAL")
+
+    # 응답 모델 설정 (false면 저장소 데이터도 검증 후 응답 모델 생성)
+    trusted_models: bool = Field(default=True, alias="TRUSTED_MODELS")
+
+    # 수락 제어 (라우트별 동시 실행 슬롯/대기열, 대기 제한 시간(초), 무거운 요청 우선 차단 기준)
+    admission_enabled: bool = Field(default=True, alias="ADMISSION_ENABLED")
+    admission_heavy_concurrency: int = Field(default=4, alias="ADMISSION_HEAVY_CONCURRENCY")
+    admission_heavy_queue: int = Field(default=8, alias="ADMISSION_HEAVY_QUEUE")
+    admission_default_concurrency: int = Field(default=64, alias="ADMISSION_DEFAULT_CONCURRENCY")
+    admission_default_queue: int = Field(default=128, alias="ADMISSION_DEFAULT_QUEUE")
+    admission_queue_timeout: float = Field(default=0.5, alias="ADMISSION_QUEUE_TIMEOUT")
+    admission_shed_threshold: int = Field(default=48, alias="ADMISSION_SHED_THRESHOLD")
+    admission_retry_after: float = Field(default=1.0, alias="ADMISSION_RETRY_AFTER")
+
+    # 클라이언트별 요청 속도 제한 (초당 요청 수, 0이면 제한 없음 / 순간 허용량 / 추적 클라이언트 수)
+    # 프록시 뒤에서는 TRUST_FORWARDED_FOR/TRUSTED_PROXIES 없이 켜면 전체가 한 클라이언트로 묶임
+    rate_limit_per_second: float = Field(default=0.0, alias="RATE_LIMIT_PER_SECOND")
+    rate_limit_burst: float = Field(default=40.0, alias="RATE_LIMIT_BURST")
+    rate_limit_max_clients: int = Field(default=10000, alias="RATE_LIMIT_MAX_CLIENTS")
+    # 프록시 뒤에서 X-Forwarded-For로 클라이언트 주소 결정 (TRUSTED_PROXIES에서 온 요청만, 쉼표 구분, CIDR 가능)
+    trust_forwarded_for: bool = Field(default=False, alias="TRUST_FORWARDED_FOR")
+    trusted_proxies: str = Field(default="127.0.0.1,::1", alias="TRUSTED_PROXIES")
+
+    # 시작 워밍업 제한 시간 (초, 0이면 워밍업 없이 바로 ready)
+    warmup_timeout: float = Field(default=15.0, alias="WARMUP_TIMEOUT")
+
+    # 수집 스케줄러 설정 (초)
+    market_poll_interval: float = Field(default=5.0, alias="MARKET_POLL_INTERVAL")
+    stocks_poll_interval: float = Field(default=5.0, alias="STOCKS_POLL_INTERVAL")
+    news_poll_interval: float = Field(default=30.0, alias="NEWS_POLL_INTERVAL")
+    scheduler_jitter: float = Field(default=0.1, alias="SCHEDULER_JITTER")
+    scheduler_max_backoff: float = Field(default=300.0, alias="SCHEDULER_MAX_BACKOFF")
+    scheduler_shutdown_timeout: float = Field(default=5.0, alias="SCHEDULER_SHUTDOWN_TIMEOUT")
+
+    # 마켓 캐시 설정 (초)
+    market_cache_ttl: float = Field(default=5.0, alias="MARKET_CACHE_TTL")
+    market_cache_stale_ttl: float = Field(default=60.0, alias="MARKET_CACHE_STALE_TTL")
+
+    # 워커 간 공유 캐시 설정 (REDIS_URL이 없으면 워커별 인메모리 캐시만 사용)
+    redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
+    cache_lock_ttl: float = Field(default=5.0, alias="CACHE_LOCK_TTL")
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,22 @@
+"""불투명(opaque) 페이지 커서"""
+
+import base64
+import json
+
+
+def encode_cursor(*key: object) -> str:
+    """정렬 키를 URL-safe 문자열 커서로 인코딩"""
+    raw = json.dumps(key, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple:
+    """커서를 정렬 키로 디코딩 (형식 오류 시 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("잘못된 커서입니다") from e
+    if not isinstance(key, list) or len(key) != size:
+        raise ValueError("잘못된 커서입니다")
+    return tuple(key)
@@ -0,0 +1,93 @@
+"""ETag 기반 조건부 GET"""
+
+import hashlib
+import json
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic_core import to_json
+
+from app.core.responses import EncodedPayload, PreEncodedJSONResponse
+
+# 내용이 같아도 매번 바뀌는 필드 (ETag 계산에서 제외)
+VOLATILE_KEYS = frozenset({"updated_at"})
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def compute_etag(data: Any) -> str:
+    """data(JSON 호환 값)의 strong ETag"""
+    digest = hashlib.blake2b(to_json(_strip_volatile(data)), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def payload_etag(payload: EncodedPayload) -> str:
+    """사전 인코딩 payload의 ETag (payload별 1회 계산)"""
+    if payload.etag is None:
+        payload.etag = compute_etag(json.loads(payload.body))
+    return payload.etag
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """If-None-Match 헤더와 비교 (weak 비교)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def response_etag(response: Response) -> Optional[str]:
+    """응답의 data 부분으로 ETag 계산"""
+    if isinstance(response, PreEncodedJSONResponse):
+        return payload_etag(response.payload)
+    if not response.media_type or "json" not in response.media_type:
+        return None
+    try:
+        body = json.loads(response.body)
+    except (AttributeError, ValueError):
+        return None
+    if not isinstance(body, dict) or not body.get("success"):
+        return None
+    return compute_etag(body.get("data"))
+
+
+class ConditionalGetRoute(APIRoute):
+    """GET 성공 응답에 ETag를 붙이고 If-None-Match 일치 시 304 반환
+
+    ETag는 data만으로 계산하므로 meta.timestamp나 압축 여부에 따라 본문 바이트가 달라도 같다.
+    그래서 항상 weak ETag(W/"...")로 보내고, 200(압축 포함)과 304가 같은 값을 갖는다.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def conditional_handler(request: Request) -> Response:
+            response = await handler(request)
+            if request.method != "GET" or response.status_code != 200:
+                return response
+
+            etag = response_etag(response)
+            if etag is None:
+                return response
+
+            headers = {"ETag": "W/" + etag, "Cache-Control": "no-cache"}
+            if etag_matches(etag, request.headers.get("if-none-match")):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+            return response
+
+        return conditional_handler
@@ -0,0 +1,214 @@
+"""요청/서비스 지표 수집 (Prometheus 텍스트 형식)"""
+
+import functools
+import time
+from bisect import bisect_left
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+Labels = tuple[tuple[str, str], ...]
+Sample = tuple[dict[str, str], float]
+# (이름, 타입, 설명, 샘플) 묶음을 반환하는 수집 함수 (스크레이프 시점에 호출)
+Collector = Callable[[], Iterable[tuple[str, str, str, Iterable[Sample]]]]
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """증감 가능한 값"""
+
+    type = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (라벨별 버킷 카운트 + 합계)"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        # 라벨 → [버킷별 카운트..., +Inf 카운트, 합계]
+        self._values: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+        # 버킷 카운트는 비누적으로 저장하고 출력할 때 누적
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        bounds = [*(_format_value(b) for b in self.buckets), "+Inf"]
+        for labels, series in self._values.items():
+            cumulative = 0.0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                le = 'le="' + bound + '"'
+                yield f"{self.name}_bucket{_format_labels(labels, le)} {int(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(labels)} {series[-1]!r}"
+            yield f"{self.name}_count{_format_labels(labels)} {int(cumulative)}"
+
+
+class Registry:
+    """지표 등록소"""
+
+    def __init__(self) -> None:
+        self._metrics: list[Any] = []
+        self._collectors: list[Collector] = []
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(Counter(name, help))
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        return self._register(Gauge(name, help))
+
+    def histogram(
+        self, name: str, help: str, buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help, buckets))
+
+    def add_collector(self, collector: Collector) -> None:
+        """스크레이프 시점 수집 함수 등록 (캐시/스케줄러 등 기존 카운터 노출용)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(
+                        f"{name}{_format_labels(tuple(labels.items()))} {_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Any) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+
+registry = Registry()
+
+http_requests = registry.counter("http_requests_total", "HTTP 요청 수 (라우트/메서드/상태 코드별)")
+http_latency = registry.histogram("http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트별)")
+http_in_flight = registry.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+service_latency = registry.histogram(
+    "service_span_duration_seconds", "서비스 구간 처리 시간 (upstream/cache)"
+)
+service_errors = registry.counter("service_span_errors_total", "서비스 구간 예외 수")
+
+
+def instrument(service: str, operation: str, kind: str) -> Callable[[F], F]:
+    """비동기 서비스 메서드 처리 시간 기록 (kind: upstream | cache)"""
+    labels: Labels = (("service", service), ("operation", operation), ("kind", kind))
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                service_errors.inc(labels)
+                raise
+            finally:
+                service_latency.observe(time.perf_counter() - started, labels)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class MetricsMiddleware:
+    """라우트별 지연 시간/상태 코드/처리 중 요청 수 기록 (순수 ASGI)
+
+    라벨에는 실제 경로 대신 라우트 템플릿(/api/v1/news/{news_id})을 사용해
+    시계열 수가 라우트 수로 제한되도록 한다.
+    """
+
+    def __init__(self, app: ASGIApp, exclude: tuple[str, ...] = ("/metrics",)) -> None:
+        self.app = app
+        self.exclude = exclude
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_in_flight.dec()
+            route = _route_template(scope)
+            http_latency.observe(time.perf_counter() - started, (("route", route),))
+            http_requests.inc(
+                (("route", route), ("method", scope["method"]), ("status", str(status)))
+            )
+
+
+def _route_template(scope: Scope) -> str:
+    route: Optional[Any] = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return "unmatched"
+    return scope.get("root_path", "") + path
@@ -0,0 +1,104 @@
+"""사전 인코딩 JSON 응답"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic_core import to_json
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+from app.core.compression import choose_encoding, deflate_segment, gzip_spliced, mark_encoded
+from app.core.config import settings
+
+
+class EncodedPayload:
+    """한 번 직렬화된 data 바이트"""
+
+    __slots__ = ("data", "body", "etag", "_deflated")
+
+    def __init__(self, data: Any, body: bytes) -> None:
+        self.data = data
+        self.body = body
+        self.etag: Optional[str] = None
+        self._deflated: Optional[bytes] = None
+
+    @property
+    def deflated(self) -> bytes:
+        """body의 raw deflate 세그먼트 (최초 1회만 압축)"""
+        if self._deflated is None:
+            self._deflated = deflate_segment(self.body)
+        return self._deflated
+
+
+class PayloadEncoder:
+    """객체 단위 직렬화 결과 재사용 (LRU)
+
+    캐시에서 같은 객체가 반복 반환되면 직렬화는 최초 1회만 수행한다.
+    id() 재사용을 막기 위해 원본 객체 참조를 함께 보관한다.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, EncodedPayload]" = OrderedDict()
+
+    def encode(self, data: Any) -> EncodedPayload:
+        """data 직렬화 (캐시된 객체면 기존 바이트 반환)"""
+        key = id(data)
+        payload = self._entries.get(key)
+        if payload is not None and payload.data is data:
+            self._entries.move_to_end(key)
+            return payload
+
+        payload = EncodedPayload(data, to_json(data))
+        self._entries[key] = payload
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return payload
+
+
+payload_encoder = PayloadEncoder()
+
+
+class PreEncodedJSONResponse(Response):
+    """사전 인코딩된 data에 meta만 덧붙이는 APIResponse 성공 응답
+
+    gzip을 받는 요청이면 br을 더 선호해도 payload의 사전 압축 세그먼트를 재사용해 gzip으로 보낸다.
+    meta.timestamp가 요청마다 바뀌어 br은 본문 전체를 매번 압축해야 하므로 br만 받는 요청에만 쓴다.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        payload: EncodedPayload,
+        version: str = "v1",
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.payload = payload
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        self._prefix = b'{"success":true,"data":'
+        self._suffix = b"".join(
+            (
+                b',"error":null,"meta":{"timestamp":"',
+                timestamp.encode("ascii"),
+                b'","version":"',
+                version.encode("ascii"),
+                b'"}}',
+            )
+        )
+        body = self._prefix + payload.body + self._suffix
+        super().__init__(content=body, status_code=status_code, headers=headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.status_code == 200 and len(self.body) >= settings.compression_min_size:
+            # 사전 압축 세그먼트는 gzip만 이어 붙일 수 있으므로 gzip 우선 (br만 받으면 미들웨어가 압축)
+            accept = Headers(scope=scope).get("accept-encoding")
+            if choose_encoding(accept, allow_brotli=False) == "gzip":
+                self.body = gzip_spliced(
+                    self._prefix, self.payload.body, self.payload.deflated, self._suffix
+                )
+                mark_encoded(self.headers, "gzip", len(self.body))
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,161 @@
+"""백그라운드 주기 작업 스케줄러"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+JobFunc = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class JobStats:
+    """작업별 실행 지표"""
+
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_duration: float = 0.0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    last_success_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+@dataclass
+class Job:
+    """주기 작업"""
+
+    name: str
+    func: JobFunc
+    interval: float
+    jitter: float
+    max_backoff: float
+    stats: JobStats
+    primed: bool = False
+
+    def next_delay(self) -> float:
+        """다음 실행까지 대기 시간 (실패 시 지수 백오프, ±jitter 비율)"""
+        delay = self.interval
+        if self.stats.consecutive_failures:
+            delay = min(
+                self.interval * 2 ** self.stats.consecutive_failures, self.max_backoff
+            )
+        return max(0.0, delay * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+class Scheduler:
+    """asyncio 기반 주기 작업 실행기
+
+    작업마다 독립된 태스크로 실행 주기/지터/백오프를 적용하고,
+    예정 시각 대비 지연(lag)과 실패를 기록한다.
+    """
+
+    def __init__(self, jitter: float, max_backoff: float, shutdown_timeout: float) -> None:
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.shutdown_timeout = shutdown_timeout
+        self._jobs: dict[str, Job] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._stopping: Optional[asyncio.Event] = None
+
+    def add_job(
+        self,
+        name: str,
+        func: JobFunc,
+        interval: float,
+        jitter: Optional[float] = None,
+    ) -> None:
+        """작업 등록"""
+        self._jobs[name] = Job(
+            name=name,
+            func=func,
+            interval=interval,
+            jitter=self.jitter if jitter is None else jitter,
+            max_backoff=max(self.max_backoff, interval),
+            stats=JobStats(),
+        )
+
+    async def prime(self, names: Optional[Iterable[str]] = None) -> None:
+        """start 전에 작업을 1회씩 동시 실행 (워밍업용)
+
+        성공한 작업은 start 후 첫 실행을 한 주기 뒤로 미뤄 같은 조회를 바로 반복하지 않는다.
+        """
+        jobs = self._jobs.values() if names is None else [self._jobs[name] for name in names]
+        await asyncio.gather(*(self._prime(job) for job in jobs))
+
+    def start(self) -> None:
+        """전체 작업 시작 (prime되지 않은 작업의 첫 실행은 즉시)"""
+        if self._tasks:
+            return
+        self._stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._run(job), name=f"job:{job.name}")
+            for job in self._jobs.values()
+        ]
+
+    async def stop(self) -> None:
+        """대기 중인 작업을 멈추고 실행 중인 작업은 shutdown_timeout까지 기다림"""
+        if not self._tasks or self._stopping is None:
+            return
+        self._stopping.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=self.shutdown_timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """작업별 지표 스냅샷"""
+        return {name: asdict(job.stats) for name, job in self._jobs.items()}
+
+    async def _prime(self, job: Job) -> None:
+        job.primed = await self._execute(job)
+
+    async def _execute(self, job: Job) -> bool:
+        """작업 1회 실행 및 지표 기록 (성공 여부 반환)"""
+        started = time.monotonic()
+        try:
+            await job.func()
+        except Exception as e:
+            job.stats.failures += 1
+            job.stats.consecutive_failures += 1
+            job.stats.last_error = repr(e)
+            logger.warning("job %s failed: %r", job.name, e)
+            return False
+        else:
+            job.stats.consecutive_failures = 0
+            job.stats.last_success_at = time.time()
+            return True
+        finally:
+            job.stats.runs += 1
+            job.stats.last_duration = time.monotonic() - started
+
+    async def _run(self, job: Job) -> None:
+        assert self._stopping is not None
+        planned = time.monotonic()
+        if job.primed:
+            delay = job.next_delay()
+            planned += delay
+            await self._sleep(delay)
+        while not self._stopping.is_set():
+            job.stats.last_lag = max(0.0, time.monotonic() - planned)
+            job.stats.max_lag = max(job.stats.max_lag, job.stats.last_lag)
+            await self._execute(job)
+
+            delay = job.next_delay()
+            planned = time.monotonic() + delay
+            await self._sleep(delay)
+
+    async def _sleep(self, delay: float) -> None:
+        """delay초 대기 (stop 요청 시 즉시 반환)"""
+        assert self._stopping is not None
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
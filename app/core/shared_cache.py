@@ -0,0 +1,394 @@
+"""워커 간 공유 캐시 (L1 인프로세스 + L2 Redis 호환 저장소)"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Optional, Protocol
+
+from app.core.cache import Loader, SWRCache, UpdateListener
+from app.core.config import settings
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:  # redis 미설치 시 L2 없이 L1만 사용
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+Encoder = Callable[[Any], bytes]
+Decoder = Callable[[Hashable, bytes], Any]
+
+# 소유 토큰이 같을 때만 락 해제 (다른 워커가 재획득한 락을 지우지 않음)
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SharedStore(Protocol):
+    """L2 저장소 인터페이스 (Redis 명령 부분집합)"""
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def acquire(self, key: str, token: str, ttl: float) -> bool: ...
+
+    async def release(self, key: str, token: str) -> bool: ...
+
+    async def publish(self, channel: str, message: bytes) -> None: ...
+
+    def subscribe(self, channel: str) -> AsyncIterator[bytes]: ...
+
+    async def close(self) -> None: ...
+
+
+class RedisSharedStore:
+    """Redis 기반 L2 저장소 (SET NX PX 락, Pub/Sub 무효화)"""
+
+    def __init__(self, url: str) -> None:
+        if aioredis is None:
+            raise RuntimeError("redis 패키지가 설치되어 있지 않습니다 (pip install redis)")
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._redis.set(key, value, px=max(1, int(ttl * 1000)))
+
+    async def acquire(self, key: str, token: str, ttl: float) -> bool:
+        return bool(await self._redis.set(key, token, px=max(1, int(ttl * 1000)), nx=True))
+
+    async def release(self, key: str, token: str) -> bool:
+        return bool(await self._redis.eval(_RELEASE_SCRIPT, 1, key, token))
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        await self._redis.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+    async def close(self) -> None:
+        await self._redis.close()
+
+
+class InMemorySharedStore:
+    """인메모리 L2 저장소 (테스트/단일 프로세스용)
+
+    여러 TieredCache가 같은 인스턴스를 공유하면 여러 워커처럼 동작한다.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[str, tuple[bytes, float]] = {}
+        self._channels: Dict[str, list[asyncio.Queue]] = defaultdict(list)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        record = self._data.get(key)
+        if record is None:
+            return None
+        value, expires_at = record
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def acquire(self, key: str, token: str, ttl: float) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, token.encode(), ttl)
+        return True
+
+    async def release(self, key: str, token: str) -> bool:
+        if await self.get(key) == token.encode():
+            del self._data[key]
+            return True
+        return False
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        for queue in self._channels.get(channel, ()):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._channels[channel].append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._channels[channel].remove(queue)
+
+    async def close(self) -> None:
+        self._data.clear()
+
+
+@dataclass
+class SharedCacheStats:
+    """L2 카운터"""
+
+    l2_hits: int = 0
+    l2_misses: int = 0
+    l2_errors: int = 0
+    lock_acquired: int = 0
+    lock_waits: int = 0
+    remote_updates: int = 0
+
+
+class TieredCache(SWRCache):
+    """2단계 캐시 (L1 SWRCache + L2 공유 저장소)
+
+    - L1 미스/만료 시 L2를 먼저 확인하고, L2도 만료면 워커 간 락을 얻은 1개 워커만 업스트림 조회
+    - 락을 얻지 못한 워커는 L2에 새 값이 기록될 때까지 대기 (lock_ttl 초과 시 직접 조회)
+    - 값을 기록한 워커는 무효화 메시지를 발행하고, 다른 워커는 L2 값을 받아 L1을 갱신
+
+    L2가 연결되지 않았으면 SWRCache와 동일하게 동작한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        stale_ttl: float,
+        encode: Encoder,
+        decode: Decoder,
+        lock_ttl: float,
+        on_update: Optional[UpdateListener] = None,
+        namespace: str = "yangbong",
+        max_entries: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            name, ttl=ttl, stale_ttl=stale_ttl, on_update=on_update, max_entries=max_entries
+        )
+        self.encode = encode
+        self.decode = decode
+        self.lock_ttl = lock_ttl
+        self.worker_id = uuid.uuid4().hex
+        self.store: Optional[SharedStore] = None
+        self._prefix = f"{namespace}:cache:{name}"
+        self._channel = f"{self._prefix}:invalidate"
+        # L2 키 → 캐시 키 (원격 무효화 메시지 처리용, L2 연결 중 L1에 있는 키만)
+        self._keys: Dict[str, Hashable] = {}
+        self._shared_stats = SharedCacheStats()
+        self._listener: Optional[asyncio.Task] = None
+
+    async def attach(self, store: SharedStore) -> None:
+        """L2 연결 및 무효화 구독 시작"""
+        await self.detach()
+        self.store = store
+        self._listener = asyncio.get_running_loop().create_task(
+            self._listen(store), name=f"cache:{self.name}:listener"
+        )
+
+    async def detach(self) -> None:
+        """L2 연결 해제"""
+        listener, self._listener = self._listener, None
+        self.store = None
+        self._keys.clear()
+        if listener is not None:
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """L1에 값 저장 (L2 연결 중이면 원격 무효화 대상으로 등록)"""
+        if self.store is not None:
+            self._keys[self._storage_key(key)] = key
+        super().set(key, value)
+
+    async def put(self, key: Hashable, value: Any) -> None:
+        """L1/L2에 값 기록 후 다른 워커에 알림"""
+        self.set(key, value)
+        if self.store is not None:
+            await self._write_shared(key, value)
+
+    async def lease(self, name: Hashable, ttl: float) -> bool:
+        """ttl 동안 유지되는 워커 간 작업 임대 (주기 작업을 1개 워커만 실행할 때 사용)
+
+        L2가 없으면 항상 True.
+        """
+        if self.store is None:
+            return True
+        try:
+            acquired = await self.store.acquire(
+                f"{self._prefix}:lease:{self._storage_key(name)}", self.worker_id, ttl
+            )
+        except Exception as e:
+            self._shared_stats.l2_errors += 1
+            logger.warning("cache %s lease failed: %r", self.name, e)
+            return True
+        return acquired
+
+    def stats(self) -> Dict[str, int]:
+        """L1/L2 카운터 스냅샷"""
+        return {**super().stats(), **asdict(self._shared_stats)}
+
+    async def _refresh(self, key: Hashable, loader: Loader) -> Any:
+        if self.store is None:
+            return await super()._refresh(key, loader)
+        try:
+            value = await self._load_shared(self.store, key, loader)
+            if self._owns_refresh(key):
+                self.set(key, value)
+            return value
+        finally:
+            if self._owns_refresh(key):
+                del self._inflight[key]
+
+    async def _load_shared(self, store: SharedStore, key: Hashable, loader: Loader) -> Any:
+        skey = self._storage_key(key)
+        try:
+            cached = await self._read_shared(store, skey)
+        except Exception as e:
+            self._shared_stats.l2_errors += 1
+            logger.warning("cache %s L2 read failed: %r", self.name, e)
+            return await loader()
+
+        if cached is not None and time.time() - cached[0] < self.ttl:
+            self._shared_stats.l2_hits += 1
+            return self.decode(key, cached[1])
+        self._shared_stats.l2_misses += 1
+
+        token = uuid.uuid4().hex
+        lock_key = f"{self._prefix}:lock:{skey}"
+        try:
+            acquired = await store.acquire(lock_key, token, self.lock_ttl)
+        except Exception as e:
+            self._shared_stats.l2_errors += 1
+            logger.warning("cache %s lock failed: %r", self.name, e)
+            return await loader()
+        if acquired:
+            self._shared_stats.lock_acquired += 1
+            try:
+                value = await loader()
+                await self._write_shared(key, value)
+                return value
+            finally:
+                try:
+                    await store.release(lock_key, token)
+                except Exception as e:
+                    self._shared_stats.l2_errors += 1
+                    logger.warning("cache %s unlock failed: %r", self.name, e)
+
+        # 다른 워커가 조회 중: L2에 새 값이 기록될 때까지 대기
+        self._shared_stats.lock_waits += 1
+        seen_at = cached[0] if cached is not None else 0.0
+        deadline = time.monotonic() + self.lock_ttl
+        delay = 0.01
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            try:
+                fresh = await self._read_shared(store, skey)
+            except Exception:
+                self._shared_stats.l2_errors += 1
+                break
+            if fresh is not None and fresh[0] > seen_at:
+                self._shared_stats.l2_hits += 1
+                return self.decode(key, fresh[1])
+        return await loader()
+
+    async def _read_shared(self, store: SharedStore, skey: str) -> Optional[tuple[float, bytes]]:
+        record = await store.get(f"{self._prefix}:{skey}")
+        if record is None:
+            return None
+        stored_at, _, body = record.partition(b"\n")
+        return float(stored_at), body
+
+    async def _write_shared(self, key: Hashable, value: Any) -> None:
+        store = self.store
+        if store is None:
+            return
+        skey = self._storage_key(key)
+        record = f"{time.time():.6f}\n".encode() + self.encode(value)
+        try:
+            await store.set(f"{self._prefix}:{skey}", record, self.ttl + self.stale_ttl)
+            message = json.dumps({"origin": self.worker_id, "key": skey}).encode()
+            await store.publish(self._channel, message)
+        except Exception as e:
+            self._shared_stats.l2_errors += 1
+            logger.warning("cache %s L2 write failed: %r", self.name, e)
+
+    async def _listen(self, store: SharedStore) -> None:
+        while True:
+            try:
+                async for message in store.subscribe(self._channel):
+                    await self._on_remote_update(store, json.loads(message))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._shared_stats.l2_errors += 1
+                logger.warning("cache %s subscription failed: %r", self.name, e)
+                await asyncio.sleep(1.0)
+
+    async def _on_remote_update(self, store: SharedStore, message: dict) -> None:
+        if message.get("origin") == self.worker_id:
+            return
+        key = self._keys.get(message.get("key", ""))
+        if key is None:
+            # 이 워커가 아직 사용하지 않은 키는 다음 조회 때 L2에서 읽음
+            return
+        record = await self._read_shared(store, message["key"])
+        if record is None:
+            self.invalidate(key)
+            return
+        self._shared_stats.remote_updates += 1
+        self.set(key, self.decode(key, record[1]))
+
+    def _on_removed(self, key: Hashable) -> None:
+        self._keys.pop(self._storage_key(key), None)
+
+    @staticmethod
+    def _storage_key(key: Hashable) -> str:
+        if isinstance(key, tuple):
+            return ":".join(str(part) for part in key)
+        return str(key)
+
+
+class SharedCache:
+    """L2 저장소 싱글톤 (lifespan에서 open/close)"""
+
+    _store: Optional[SharedStore] = None
+    _caches: list[TieredCache] = []
+
+    @classmethod
+    def register(cls, cache: TieredCache) -> TieredCache:
+        """L2를 연결할 캐시 등록"""
+        cls._caches.append(cache)
+        return cache
+
+    @classmethod
+    async def open(cls, store: Optional[SharedStore] = None) -> Optional[SharedStore]:
+        """L2 연결 (REDIS_URL이 없으면 L1만 사용)"""
+        if store is None:
+            if not settings.redis_url:
+                return None
+            store = RedisSharedStore(settings.redis_url)
+        cls._store = store
+        for cache in cls._caches:
+            await cache.attach(store)
+        return store
+
+    @classmethod
+    async def close(cls) -> None:
+        """L2 연결 해제"""
+        store, cls._store = cls._store, None
+        for cache in cls._caches:
+            await cache.detach()
+        if store is not None:
+            await store.close()
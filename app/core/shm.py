@@ -0,0 +1,142 @@
+"""워커 간 공유 메모리 영역 (단일 writer / 다중 reader)"""
+
+import fcntl
+import mmap
+import os
+import struct
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_MAGIC = b"YBSM"
+_LAYOUT = 2
+# magic, layout, boot id, seq, active slot, slot0 길이, slot1 길이
+_HEADER = struct.Struct("<4sIQQQQQ")
+_HEADER_SIZE = 64
+
+
+class SnapshotTooLarge(ValueError):
+    """스냅샷이 슬롯 크기를 넘음"""
+
+
+class SharedRegion:
+    """mmap 파일 기반 이중 버퍼 영역
+
+    writer는 비활성 슬롯에 전체 스냅샷을 쓴 뒤 헤더의 활성 슬롯을 바꾼다.
+    seq는 쓰기 시작 시 홀수, 완료 시 짝수가 되며, reader는 읽기 전후 seq를 비교해
+    읽는 동안 해당 슬롯이 덮어써지지 않았는지 확인한다 (락 없음).
+
+    boot는 영역을 함께 쓰는 프로세스 묶음(같은 마스터의 워커들)의 식별값이다.
+    파일이 재배포/재시작 전 실행의 내용을 담고 있어도 boot가 다르면 reader는 없는 것으로
+    보고, writer는 처음부터 다시 기록한다.
+    """
+
+    def __init__(self, path: str, size: int, boot: int = 0) -> None:
+        self.path = path
+        self.size = size
+        self.boot = boot
+        self.slot_size = (size - _HEADER_SIZE) // 2
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.view = memoryview(self._mm)
+
+    def close(self) -> None:
+        """매핑 해제 (다른 곳에서 뷰를 참조 중이면 GC에 맡김)"""
+        try:
+            self.view.release()
+            self._mm.close()
+        except BufferError:
+            pass
+
+    def write(self, data: bytes) -> int:
+        """스냅샷 기록 (writer 전용, 새 seq 반환)"""
+        if len(data) > self.slot_size:
+            raise SnapshotTooLarge(f"snapshot {len(data)}B > slot {self.slot_size}B")
+        magic, layout, boot, seq, slot, *lengths = self._header()
+        if magic != _MAGIC or layout != _LAYOUT or boot != self.boot:
+            # 처음 쓰는 영역이거나 이전 실행이 남긴 내용
+            seq, slot, lengths = 0, 1, [0, 0]
+        elif seq % 2:
+            # 이전 writer가 기록 중 종료됨: 활성 슬롯은 완전한 상태로 남아 있다
+            seq -= 1
+        target = 1 - slot
+
+        self._write_header(seq + 1, slot, lengths)
+        start = self._slot_offset(target)
+        self.view[start : start + len(data)] = data
+        lengths[target] = len(data)
+        self._write_header(seq + 1, target, lengths)
+        self._write_header(seq + 2, target, lengths)
+        return seq + 2
+
+    def current(self) -> Optional[tuple[int, memoryview]]:
+        """활성 슬롯 (seq, 데이터 뷰). 아직 기록된 적 없으면 None"""
+        for _ in range(100):
+            first = self._header()
+            if first != self._header():
+                continue
+            magic, layout, boot, seq, slot, *lengths = first
+            if magic != _MAGIC or layout != _LAYOUT or boot != self.boot or not lengths[slot]:
+                return None
+            start = self._slot_offset(slot)
+            return seq, self.view[start : start + lengths[slot]]
+        return None
+
+    def is_stable(self, seq: int) -> bool:
+        """seq 시점에 얻은 슬롯이 아직 덮어써지지 않았는지"""
+        return self._header()[3] - seq <= 1
+
+    def read(self, func: Callable[[int, memoryview], T]) -> Optional[T]:
+        """활성 슬롯으로 func 실행 (실행 중 덮어써졌으면 재시도)"""
+        while True:
+            current = self.current()
+            if current is None:
+                return None
+            result = func(*current)
+            if self.is_stable(current[0]):
+                return result
+
+    def _header(self) -> tuple:
+        return _HEADER.unpack_from(self._mm, 0)
+
+    def _write_header(self, seq: int, slot: int, lengths: list[int]) -> None:
+        _HEADER.pack_into(self._mm, 0, _MAGIC, _LAYOUT, self.boot, seq, slot, *lengths)
+
+    def _slot_offset(self, slot: int) -> int:
+        return _HEADER_SIZE + slot * self.slot_size
+
+
+class WriterLock:
+    """writer 선출용 파일 락 (프로세스가 종료되면 OS가 해제)"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """비차단 획득 시도"""
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
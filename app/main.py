@@ -1,9 +1,44 @@
 """FastAPI 애플리케이션 메인 진입점"""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import router as v1_router
+from app.core.admission import AdmissionMiddleware
+from app.core.broadcast import hub
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.shared_cache import SharedCache
+from app.providers import Providers
+from app.services.ingestion import feed_scheduler, scheduler
+from app.services.snapshot import MarketSnapshot
+from app.services.telemetry import register_collectors
+from app.services.supabase_async import AsyncSupabaseClient
+from app.services.warmup import Warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 백그라운드 작업 관리"""
+    await AsyncSupabaseClient.open()
+    await Providers.open()
+    await SharedCache.open()
+    hub.start()
+    # 멀티 워커 모드: 스냅샷 writer만 마켓/시세를 수집하고 reader는 writer 종료 시 이어받음
+    # 수집 스케줄러는 워밍업(첫 수집 + 주요 조회 경로 호출)이 끝난 뒤 시작
+    Warmup.start(MarketSnapshot.open(settings.web_concurrency))
+    yield
+    await Warmup.close()
+    await feed_scheduler.stop()
+    await scheduler.stop()
+    await MarketSnapshot.close()
+    await hub.stop()
+    await SharedCache.close()
+    await Providers.close()
+    await AsyncSupabaseClient.close()
+
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -12,9 +47,16 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
-# CORS 설정
+# 응답 압축 (gzip/brotli)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
+
+# 과부하 차단/속도 제한 (거절 응답은 압축/라우팅 없이 바로 반환, 지표에는 기록)
+app.add_middleware(AdmissionMiddleware)
+
+# CORS 설정 (수락 제어 바깥에 두어 429/503 거절 응답에도 CORS 헤더 추가)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -28,6 +70,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 지연 시간/상태 코드 지표 (가장 바깥에서 측정)
+app.add_middleware(MetricsMiddleware)
+register_collectors()
+
 # --- 헬스체크용 최소 엔드포인트 ---
 @app.get("/")
 async def root():
@@ -37,6 +83,21 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def ready():
+    """준비 상태 (시작 워밍업이 끝나기 전에는 503)"""
+    status = Warmup.status()
+    return JSONResponse(status, status_code=200 if Warmup.ready else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 지표 (워커별)"""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4"
+    )
 # --------------------------------
 
 # v1 API 라우터 등록
@@ -52,6 +113,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=settings.debug,
+        workers=settings.web_concurrency,
+        reload=settings.debug and settings.web_concurrency == 1,
     )
 
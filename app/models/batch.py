@@ -0,0 +1,30 @@
+"""배치 요청 관련 모델 정의"""
+
+from typing import Any
+from pydantic import BaseModel, Field
+from app.core.config import settings
+
+
+class BatchRequest(BaseModel):
+    """배치 요청"""
+
+    paths: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.batch_max_requests,
+        description="v1 기준 상대 GET 경로 리스트 (예: /market/summary?seg=KR)",
+    )
+
+
+class BatchResult(BaseModel):
+    """배치 개별 결과"""
+
+    path: str = Field(..., description="요청 경로")
+    status: int = Field(..., description="HTTP 상태 코드")
+    body: Any = Field(..., description="개별 APIResponse 응답")
+
+
+class BatchResponse(BaseModel):
+    """배치 응답"""
+
+    results: list[BatchResult] = Field(..., description="요청 순서대로의 결과 리스트")
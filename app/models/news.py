@@ -4,6 +4,15 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+class NewsSource(BaseModel):
+    """같은 내용을 보도한 다른 출처의 기사"""
+
+    id: str = Field(..., description="뉴스 ID")
+    source: str = Field(..., description="출처")
+    published_at: str = Field(..., description="발행 시각 (ISO 8601)")
+    url: Optional[str] = Field(None, description="링크 URL")
+
+
 class NewsItem(BaseModel):
     """뉴스 항목"""
 
@@ -16,6 +25,9 @@ class NewsItem(BaseModel):
     url: Optional[str] = Field(None, description="링크 URL")
     image_url: Optional[str] = Field(None, description="이미지 URL")
     is_breaking: bool = Field(default=False, description="속보 여부")
+    alternate_sources: list[NewsSource] = Field(
+        default_factory=list, description="같은 내용을 보도한 다른 출처 (유사 기사 병합)"
+    )
 
 
 class NewsListResponse(BaseModel):
@@ -26,6 +38,18 @@ class NewsListResponse(BaseModel):
     page: int = Field(..., description="현재 페이지")
     limit: int = Field(..., description="페이지당 개수")
     has_more: bool = Field(..., description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서")
+
+
+class NewsSearchResponse(BaseModel):
+    """뉴스 검색 응답"""
+
+    query: str = Field(..., description="검색어")
+    items: list[NewsItem] = Field(..., description="뉴스 항목 리스트 (관련도 + 최신순)")
+    total: int = Field(..., description="검색 결과 전체 개수")
+    limit: int = Field(..., description="페이지당 개수")
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서")
 
 
 class NewsDetail(BaseModel):
@@ -42,4 +66,7 @@ class NewsDetail(BaseModel):
     image_url: Optional[str] = Field(None, description="이미지 URL")
     is_breaking: bool = Field(default=False, description="속보 여부")
     tags: list[str] = Field(default_factory=list, description="태그 리스트")
+    alternate_sources: list[NewsSource] = Field(
+        default_factory=list, description="같은 내용을 보도한 다른 출처 (유사 기사 병합)"
+    )
 
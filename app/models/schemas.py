@@ -3,6 +3,9 @@
 from typing import Generic, TypeVar, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
+from app.core.responses import EncodedPayload, PreEncodedJSONResponse, payload_encoder
+from app.models.trusted import trusted
 
 T = TypeVar("T")
 
@@ -32,17 +35,38 @@ class APIResponse(BaseModel, Generic[T]):
 
     @classmethod
     def success_response(cls, data: T, version: str = "v1") -> "APIResponse[T]":
-        """성공 응답 생성"""
-        return cls(
+        """성공 응답 생성 (data는 서비스에서 만든 모델이라 다시 검증하지 않음)"""
+        return trusted(
+            cls,
             success=True,
             data=data,
             error=None,
-            meta=MetaInfo(
+            meta=trusted(
+                MetaInfo,
                 timestamp=datetime.utcnow().isoformat() + "Z",
                 version=version,
             ),
         )
 
+    @classmethod
+    def encoded_response(cls, data: T, version: str = "v1") -> PreEncodedJSONResponse:
+        """성공 응답 생성 (사전 인코딩 경로)
+
+        success_response와 같은 JSON을 만들지만 data 직렬화 결과를 재사용하고
+        요청마다 meta.timestamp만 새로 붙인다.
+        """
+        return PreEncodedJSONResponse(payload_encoder.encode(data), version=version)
+
+    @classmethod
+    def trusted_response(cls, data: T, version: str = "v1") -> PreEncodedJSONResponse:
+        """성공 응답 생성 (응답 모델 재검증 생략 경로)
+
+        APIResponse를 그대로 반환하면 FastAPI가 response_model로 dict 변환 → 재검증 →
+        JSON 인코딩을 다시 거친다. 저장소 데이터로 만든 data를 바로 직렬화해 이를 건너뛴다.
+        요청마다 새로 만들어지는 data용 (같은 객체가 반복되면 encoded_response).
+        """
+        return PreEncodedJSONResponse(EncodedPayload(data, to_json(data)), version=version)
+
     @classmethod
     def error_response(
         cls,
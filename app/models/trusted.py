@@ -0,0 +1,64 @@
+"""검증 생략 모델 생성 (내부 저장소의 신뢰된 데이터 전용)
+
+업스트림 응답처럼 외부에서 들어온 값은 일반 생성자로 검증하고,
+이미 검증을 거쳐 저장소에 들어온 값으로 응답 모델을 다시 만들 때만 사용한다.
+클래스 정의는 그대로라 JSON 스키마/OpenAPI 문서는 바뀌지 않는다.
+"""
+
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from app.core.config import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+_new = object.__new__
+_set = object.__setattr__
+
+# 모델 → 필드명 튜플 (선언 순서)
+_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _names_of(model: type[BaseModel]) -> tuple[str, ...]:
+    names = _NAMES.get(model)
+    if names is None:
+        names = _NAMES[model] = tuple(model.model_fields)
+    return names
+
+
+def _complete(model: type[BaseModel], values: dict[str, Any]) -> dict[str, Any]:
+    """필드 선언 순서로 재배치하고 빠진 필드는 기본값으로 채움"""
+    data = {}
+    for name, info in model.model_fields.items():
+        if name in values:
+            data[name] = values[name]
+        elif info.default_factory is not None:
+            data[name] = info.default_factory()
+        elif info.default is not PydanticUndefined:
+            data[name] = info.default
+        else:
+            raise KeyError(f"{model.__name__}.{name}")
+    return data
+
+
+def trusted(model: type[M], **values: Any) -> M:
+    """검증 없이 모델 생성
+
+    model_construct보다 가볍게 __dict__를 직접 채운다. 모든 필드를 선언 순서대로 넘기면
+    키워드 인자 dict를 그대로 쓰고, 아니면 직렬화 순서를 위해 재배치한 뒤 기본값을 채운다
+    (필수 필드가 빠지면 KeyError). TRUSTED_MODELS=false면 일반 생성자로 검증한다.
+    """
+    if not settings.trusted_models:
+        return model(**values)
+
+    fields_set = set(values)
+    if tuple(values) != _names_of(model):
+        values = _complete(model, values)
+    instance = _new(model)
+    _set(instance, "__dict__", values)
+    _set(instance, "__pydantic_fields_set__", fields_set)
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    return instance
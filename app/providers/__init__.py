@@ -0,0 +1,91 @@
+"""업스트림 데이터 제공자
+
+UPSTREAM_BASE_URL이 설정되면 HTTP 제공자(연결 풀 + 재시도 예산 + 서킷 브레이커),
+없으면 Mock 제공자를 사용한다.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+from app.providers.base import MarketDataProvider, NewsProvider, QuoteProvider
+from app.providers.http import HTTPMarketDataProvider, HTTPNewsProvider, HTTPQuoteProvider
+from app.providers.mock import MockMarketDataProvider, MockNewsProvider, MockQuoteProvider
+from app.providers.upstream import CircuitOpenError, UpstreamClient, UpstreamError
+
+
+class Providers:
+    """제공자 레지스트리 (lifespan에서 open/close)"""
+
+    market: MarketDataProvider = MockMarketDataProvider()
+    quotes: QuoteProvider = MockQuoteProvider()
+    news: NewsProvider = MockNewsProvider()
+    upstream: Optional[UpstreamClient] = None
+
+    @classmethod
+    async def open(
+        cls,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """업스트림 연결 풀 열기 (URL이 없으면 Mock 유지)"""
+        base_url = base_url or settings.upstream_base_url
+        if not base_url or cls.upstream is not None:
+            return
+        client = UpstreamClient(
+            max_connections=settings.upstream_max_connections,
+            max_per_host=settings.upstream_max_per_host,
+            connect_timeout=settings.upstream_connect_timeout,
+            read_timeout=settings.upstream_read_timeout,
+            retries=settings.upstream_retries,
+            retry_budget_ratio=settings.upstream_retry_budget_ratio,
+            breaker_threshold=settings.upstream_breaker_threshold,
+            breaker_reset=settings.upstream_breaker_reset,
+            transport=transport,
+        )
+        await client.open()
+        cls.upstream = client
+        cls.use(
+            market=HTTPMarketDataProvider(client, base_url),
+            quotes=HTTPQuoteProvider(client, base_url),
+            news=HTTPNewsProvider(client, base_url),
+        )
+
+    @classmethod
+    async def close(cls) -> None:
+        """업스트림 연결 풀 종료 (Mock 제공자로 복귀)"""
+        client, cls.upstream = cls.upstream, None
+        if client is not None:
+            await client.close()
+            cls.use(
+                market=MockMarketDataProvider(),
+                quotes=MockQuoteProvider(),
+                news=MockNewsProvider(),
+            )
+
+    @classmethod
+    def use(
+        cls,
+        market: Optional[MarketDataProvider] = None,
+        quotes: Optional[QuoteProvider] = None,
+        news: Optional[NewsProvider] = None,
+    ) -> None:
+        """제공자 교체 (테스트/벤치마크 주입용)"""
+        if market is not None:
+            cls.market = market
+        if quotes is not None:
+            cls.quotes = quotes
+        if news is not None:
+            cls.news = news
+
+
+__all__ = [
+    "CircuitOpenError",
+    "MarketDataProvider",
+    "NewsProvider",
+    "Providers",
+    "QuoteProvider",
+    "UpstreamClient",
+    "UpstreamError",
+]
@@ -0,0 +1,30 @@
+"""업스트림 데이터 제공자 인터페이스"""
+
+from typing import Protocol
+
+from app.models.market import MarketFlow, MarketSectors, MarketSummary, SegmentType
+from app.models.news import NewsDetail
+from app.models.stocks import MarketType
+from app.services.quote_store import Quote
+
+
+class MarketDataProvider(Protocol):
+    """마켓 지수/섹터/자금 흐름 제공자"""
+
+    async def fetch_summary(self, seg: SegmentType) -> MarketSummary: ...
+
+    async def fetch_sectors(self, seg: SegmentType) -> MarketSectors: ...
+
+    async def fetch_flow(self, seg: SegmentType) -> MarketFlow: ...
+
+
+class QuoteProvider(Protocol):
+    """종목 시세 제공자"""
+
+    async def fetch_quotes(self, market: MarketType) -> list[Quote]: ...
+
+
+class NewsProvider(Protocol):
+    """뉴스 제공자"""
+
+    async def fetch_latest(self) -> list[NewsDetail]: ...
@@ -0,0 +1,71 @@
+"""로컬 개발/부하 테스트용 가짜 업스트림 서버
+
+Mock 데이터를 업스트림 계약(app.providers.http) 형식으로 제공한다.
+지연(latency)과 실패율(failure_rate)을 설정해 타임아웃/서킷 브레이커 동작을 재현할 수 있다.
+
+실행: FAKE_UPSTREAM_LATENCY=0.05 uvicorn app.providers.fake_upstream:app --port 9000
+      UPSTREAM_BASE_URL=http://localhost:9000 uvicorn app.main:app
+"""
+
+import asyncio
+import os
+import random
+from dataclasses import asdict
+
+from fastapi import FastAPI, HTTPException, Query
+
+from app.models.market import SegmentType
+from app.models.stocks import MarketType
+from app.providers.mock import MockMarketDataProvider, MockNewsProvider, MockQuoteProvider
+
+
+def create_app(latency: float = 0.0, failure_rate: float = 0.0) -> FastAPI:
+    """가짜 업스트림 앱 생성"""
+    fake = FastAPI(title="Fake Upstream")
+    fake.state.latency = latency
+    fake.state.failure_rate = failure_rate
+    market = MockMarketDataProvider()
+    quotes = MockQuoteProvider()
+    news = MockNewsProvider()
+
+    async def _simulate() -> None:
+        if fake.state.latency:
+            await asyncio.sleep(fake.state.latency)
+        if random.random() < fake.state.failure_rate:
+            raise HTTPException(status_code=503, detail="simulated upstream failure")
+
+    @fake.get("/market/summary")
+    async def market_summary(seg: SegmentType = Query("KR")):
+        await _simulate()
+        summary = await market.fetch_summary(seg)
+        return {"items": [item.model_dump() for item in summary.items]}
+
+    @fake.get("/market/sectors")
+    async def market_sectors(seg: SegmentType = Query("KR")):
+        await _simulate()
+        sectors = await market.fetch_sectors(seg)
+        return {"sectors": [item.model_dump() for item in sectors.sectors]}
+
+    @fake.get("/market/flow")
+    async def market_flow(seg: SegmentType = Query("KR")):
+        await _simulate()
+        flow = await market.fetch_flow(seg)
+        return {"flows": [item.model_dump() for item in flow.flows]}
+
+    @fake.get("/quotes")
+    async def market_quotes(market_type: MarketType = Query("KR", alias="market")):
+        await _simulate()
+        return {"quotes": [asdict(quote) for quote in await quotes.fetch_quotes(market_type)]}
+
+    @fake.get("/news/latest")
+    async def news_latest():
+        await _simulate()
+        return {"items": [detail.model_dump() for detail in await news.fetch_latest()]}
+
+    return fake
+
+
+app = create_app(
+    latency=float(os.getenv("FAKE_UPSTREAM_LATENCY", "0")),
+    failure_rate=float(os.getenv("FAKE_UPSTREAM_FAILURE_RATE", "0")),
+)
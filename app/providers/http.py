@@ -0,0 +1,131 @@
+"""HTTP 업스트림 데이터 제공자
+
+업스트림 계약 (JSON):
+- GET /market/summary?seg=KR  → {"items": [MarketSummaryItem]}
+- GET /market/sectors?seg=KR  → {"sectors": [SectorItem]}
+- GET /market/flow?seg=KR     → {"flows": [FlowItem]}
+- GET /quotes?market=KR       → {"quotes": [Quote]}
+- GET /news/latest            → {"items": [NewsDetail]}
+
+호출이 실패하거나 서킷이 열려 있으면 키별 마지막 정상 응답(last good snapshot)을 반환한다.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, Hashable, TypeVar
+
+from pydantic import TypeAdapter
+
+from app.models.market import (
+    FlowItem,
+    MarketFlow,
+    MarketSectors,
+    MarketSummary,
+    MarketSummaryItem,
+    SectorItem,
+    SegmentType,
+)
+from app.models.news import NewsDetail
+from app.models.stocks import MarketType
+from app.providers.upstream import UpstreamClient, UpstreamError
+from app.services.quote_store import Quote
+
+# 시세는 저장소에 들어간 뒤 검증 없이 StockItem으로 만들어지므로 여기서 타입을 검증
+_QUOTES = TypeAdapter(list[Quote])
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _SnapshotFallback:
+    """키별 마지막 정상 응답 보관"""
+
+    def __init__(self, client: UpstreamClient, base_url: str) -> None:
+        self.client = client
+        self.base_url = base_url.rstrip("/")
+        self.fallbacks = 0
+        self._snapshots: dict[Hashable, Any] = {}
+
+    async def fetch(
+        self,
+        key: Hashable,
+        path: str,
+        params: dict[str, Any],
+        parse: Callable[[Any], T],
+    ) -> T:
+        try:
+            value = parse(await self.client.get_json(self.base_url + path, params))
+        except (UpstreamError, KeyError, TypeError, ValueError) as e:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                raise
+            self.fallbacks += 1
+            logger.warning("upstream %s failed, serving last snapshot: %r", path, e)
+            return snapshot
+        self._snapshots[key] = value
+        return value
+
+
+class HTTPMarketDataProvider(_SnapshotFallback):
+    """마켓 데이터 HTTP 제공자"""
+
+    async def fetch_summary(self, seg: SegmentType) -> MarketSummary:
+        return await self.fetch(
+            ("summary", seg),
+            "/market/summary",
+            {"seg": seg},
+            lambda body: MarketSummary(
+                segment=seg,
+                items=[MarketSummaryItem(**item) for item in body["items"]],
+                updated_at=datetime.utcnow().isoformat() + "Z",
+            ),
+        )
+
+    async def fetch_sectors(self, seg: SegmentType) -> MarketSectors:
+        return await self.fetch(
+            ("sectors", seg),
+            "/market/sectors",
+            {"seg": seg},
+            lambda body: MarketSectors(
+                segment=seg,
+                sectors=[SectorItem(**item) for item in body["sectors"]],
+                updated_at=datetime.utcnow().isoformat() + "Z",
+            ),
+        )
+
+    async def fetch_flow(self, seg: SegmentType) -> MarketFlow:
+        return await self.fetch(
+            ("flow", seg),
+            "/market/flow",
+            {"seg": seg},
+            lambda body: MarketFlow(
+                segment=seg,
+                flows=[FlowItem(**item) for item in body["flows"]],
+                updated_at=datetime.utcnow().isoformat() + "Z",
+            ),
+        )
+
+
+class HTTPQuoteProvider(_SnapshotFallback):
+    """시세 HTTP 제공자"""
+
+    async def fetch_quotes(self, market: MarketType) -> list[Quote]:
+        return await self.fetch(
+            ("quotes", market),
+            "/quotes",
+            {"market": market},
+            lambda body: _QUOTES.validate_python(body["quotes"]),
+        )
+
+
+class HTTPNewsProvider(_SnapshotFallback):
+    """뉴스 HTTP 제공자"""
+
+    async def fetch_latest(self) -> list[NewsDetail]:
+        return await self.fetch(
+            "news",
+            "/news/latest",
+            {},
+            lambda body: [NewsDetail(**item) for item in body["items"]],
+        )
@@ -0,0 +1,242 @@
+"""Mock 데이터 제공자 (업스트림 미설정 시 / 로컬 개발용)"""
+
+from datetime import datetime, timedelta
+
+from app.models.market import (
+    FlowItem,
+    MarketFlow,
+    MarketSectors,
+    MarketSummary,
+    MarketSummaryItem,
+    SectorItem,
+    SegmentType,
+)
+from app.models.news import NewsDetail
+from app.models.stocks import MarketType
+from app.services.quote_store import Quote
+
+NEWS_CATEGORIES = ["증시", "경제", "산업", "정치", "국제"]
+
+# Mock 데이터 기준 시각 (반복 수집해도 같은 기사가 되도록 고정)
+_MOCK_BASE_TIME = datetime.utcnow().replace(microsecond=0) - timedelta(hours=1)
+
+
+class MockMarketDataProvider:
+    """마켓 Mock 데이터"""
+
+    async def fetch_summary(self, seg: SegmentType) -> MarketSummary:
+        """마켓 요약 (Mock 데이터)"""
+        mock_items = []
+        
+        if seg == "KR":
+            mock_items = [
+                MarketSummaryItem(
+                    index_name="KOSPI",
+                    value=2500.5,
+                    change=15.2,
+                    change_percent=0.61,
+                    status="UP",
+                ),
+                MarketSummaryItem(
+                    index_name="KOSDAQ",
+                    value=850.3,
+                    change=-5.1,
+                    change_percent=-0.60,
+                    status="DOWN",
+                ),
+            ]
+        elif seg == "US":
+            mock_items = [
+                MarketSummaryItem(
+                    index_name="S&P 500",
+                    value=4500.2,
+                    change=25.5,
+                    change_percent=0.57,
+                    status="UP",
+                ),
+                MarketSummaryItem(
+                    index_name="NASDAQ",
+                    value=14000.8,
+                    change=45.3,
+                    change_percent=0.32,
+                    status="UP",
+                ),
+            ]
+        elif seg == "CRYPTO":
+            mock_items = [
+                MarketSummaryItem(
+                    index_name="BTC",
+                    value=42000.5,
+                    change=850.2,
+                    change_percent=2.07,
+                    status="UP",
+                ),
+                MarketSummaryItem(
+                    index_name="ETH",
+                    value=2200.3,
+                    change=35.1,
+                    change_percent=1.62,
+                    status="UP",
+                ),
+            ]
+        elif seg == "COMMO":
+            mock_items = [
+                MarketSummaryItem(
+                    index_name="WTI",
+                    value=75.5,
+                    change=-1.2,
+                    change_percent=-1.56,
+                    status="DOWN",
+                ),
+                MarketSummaryItem(
+                    index_name="Gold",
+                    value=2000.8,
+                    change=5.5,
+                    change_percent=0.28,
+                    status="UP",
+                ),
+            ]
+
+        return MarketSummary(
+            segment=seg,
+            items=mock_items,
+            updated_at=datetime.utcnow().isoformat() + "Z",
+        )
+
+    async def fetch_sectors(self, seg: SegmentType) -> MarketSectors:
+        """마켓 섹터 (Mock 데이터)"""
+        mock_sectors = []
+        
+        if seg == "KR":
+            mock_sectors = [
+                SectorItem(sector_name="기술", change_percent=1.5, status="UP"),
+                SectorItem(sector_name="금융", change_percent=-0.8, status="DOWN"),
+                SectorItem(sector_name="에너지", change_percent=2.1, status="UP"),
+                SectorItem(sector_name="바이오", change_percent=0.3, status="UP"),
+            ]
+        elif seg == "US":
+            mock_sectors = [
+                SectorItem(sector_name="Technology", change_percent=1.2, status="UP"),
+                SectorItem(sector_name="Finance", change_percent=-0.5, status="DOWN"),
+                SectorItem(sector_name="Healthcare", change_percent=0.8, status="UP"),
+            ]
+        else:
+            mock_sectors = [
+                SectorItem(sector_name="Sector 1", change_percent=0.5, status="UP"),
+                SectorItem(sector_name="Sector 2", change_percent=-0.3, status="DOWN"),
+            ]
+
+        return MarketSectors(
+            segment=seg,
+            sectors=mock_sectors,
+            updated_at=datetime.utcnow().isoformat() + "Z",
+        )
+
+    async def fetch_flow(self, seg: SegmentType) -> MarketFlow:
+        """마켓 자금 흐름 (Mock 데이터)"""
+        mock_flows = []
+        
+        if seg == "KR":
+            mock_flows = [
+                FlowItem(name="기관", inflow=5000000000.0, outflow=3000000000.0, net=2000000000.0),
+                FlowItem(name="외국인", inflow=3000000000.0, outflow=4000000000.0, net=-1000000000.0),
+                FlowItem(name="개인", inflow=2000000000.0, outflow=3000000000.0, net=-1000000000.0),
+            ]
+        elif seg == "US":
+            mock_flows = [
+                FlowItem(name="Institutions", inflow=10000000000.0, outflow=8000000000.0, net=2000000000.0),
+                FlowItem(name="Foreign", inflow=5000000000.0, outflow=3000000000.0, net=2000000000.0),
+            ]
+        else:
+            mock_flows = [
+                FlowItem(name="Flow 1", inflow=1000000.0, outflow=500000.0, net=500000.0),
+                FlowItem(name="Flow 2", inflow=800000.0, outflow=900000.0, net=-100000.0),
+            ]
+
+        return MarketFlow(
+            segment=seg,
+            flows=mock_flows,
+            updated_at=datetime.utcnow().isoformat() + "Z",
+        )
+
+
+class MockQuoteProvider:
+    """시세 Mock 데이터"""
+
+    async def fetch_quotes(self, market: MarketType) -> list[Quote]:
+        """시장 시세 (Mock 데이터)"""
+        return [quote for quote in MOCK_QUOTES if quote.market == market]
+
+
+class MockNewsProvider:
+    """뉴스 Mock 데이터"""
+
+    async def fetch_latest(self) -> list[NewsDetail]:
+        """최신 기사 (Mock 데이터)"""
+        return mock_news()
+
+
+MOCK_QUOTES = [
+    Quote("005930", "삼성전자", "KR", 65000.0, 1000.0, 1.56, 10000000),
+    Quote("000660", "SK하이닉스", "KR", 120000.0, -2000.0, -1.64, 5000000),
+    Quote("035420", "NAVER", "KR", 200000.0, 3000.0, 1.52, 2000000),
+    Quote("035720", "카카오", "KR", 55000.0, 3500.0, 6.80, 8000000),
+    Quote("207940", "삼성바이오로직스", "KR", 750000.0, 20000.0, 2.74, 100000),
+    Quote("AAPL", "Apple Inc.", "US", 175.5, 2.3, 1.33, 50000000),
+    Quote("MSFT", "Microsoft Corporation", "US", 380.2, -1.5, -0.39, 20000000),
+    Quote("GOOGL", "Alphabet Inc.", "US", 140.8, 1.2, 0.86, 15000000),
+    Quote("TSLA", "Tesla, Inc.", "US", 250.5, 12.3, 5.16, 100000000),
+    Quote("NVDA", "NVIDIA Corporation", "US", 500.2, 18.5, 3.84, 50000000),
+]
+
+
+def mock_news() -> list[NewsDetail]:
+    """Mock 뉴스 데이터"""
+    base_time = _MOCK_BASE_TIME
+    details = []
+
+    for i in range(100):
+        category_name = NEWS_CATEGORIES[i % len(NEWS_CATEGORIES)]
+        item_time = base_time - timedelta(minutes=i * 10)
+        details.append(
+            NewsDetail(
+                id=f"news-{i+1:04d}",
+                title=f"{category_name} 관련 뉴스 제목 {i+1}",
+                content=(
+                    "이것은 뉴스의 본문 내용입니다.\n\n"
+                    "여러 단락으로 구성된 뉴스 내용을 여기에 표시합니다.\n\n"
+                    "중요한 정보와 분석 내용이 포함되어 있습니다."
+                ),
+                summary=f"{category_name} 분야의 중요한 뉴스 요약 내용입니다.",
+                source=f"출처{i+1}",
+                category=category_name,
+                published_at=item_time.isoformat() + "Z",
+                url=f"https://example.com/news/{i+1}",
+                image_url=f"https://example.com/images/news-{i+1}.jpg",
+                is_breaking=(i < 2),  # 처음 2개를 속보로 설정
+                tags=["주식", category_name, "투자"],
+            )
+        )
+
+    breaking_time = base_time + timedelta(minutes=50)
+    for i in range(5):
+        item_time = breaking_time - timedelta(minutes=i * 2)
+        details.append(
+            NewsDetail(
+                id=f"breaking-{i+1:04d}",
+                title=f"속보: 중요 뉴스 제목 {i+1}",
+                content="속보 뉴스의 본문 내용입니다.",
+                summary="속보 뉴스의 요약 내용입니다.",
+                source=f"속보출처{i+1}",
+                category="증시",
+                published_at=item_time.isoformat() + "Z",
+                url=f"https://example.com/news/breaking-{i+1}",
+                image_url=f"https://example.com/images/breaking-{i+1}.jpg",
+                is_breaking=True,
+                tags=["속보", "증시"],
+            )
+        )
+
+    # 오래된 기사부터 반영 (속보 링은 최신 기사가 앞에 오도록 유지)
+    details.sort(key=lambda detail: detail.published_at)
+    return details
@@ -0,0 +1,213 @@
+"""업스트림 HTTP 클라이언트 (연결 풀, 재시도 예산, 서킷 브레이커)"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamError(Exception):
+    """업스트림 호출 실패"""
+
+
+class CircuitOpenError(UpstreamError):
+    """서킷이 열려 있어 호출하지 않음"""
+
+
+class CircuitBreaker:
+    """연속 실패 시 호출을 차단하고 reset_timeout 후 1건만 시험 호출"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_inflight = False
+
+    def allow(self) -> bool:
+        """호출 허용 여부"""
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = "half_open"
+            self._trial_inflight = False
+        if self.state == "half_open" and not self._trial_inflight:
+            self._trial_inflight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """결과 없이 끝난 시험 호출 반환 (취소 등, 다음 호출이 다시 시험)"""
+        self._trial_inflight = False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self._trial_inflight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning("upstream circuit opened after %d failures", self.failures)
+            self.state = "open"
+            self._opened_at = time.monotonic()
+            self._trial_inflight = False
+
+
+class RetryBudget:
+    """재시도 예산 (정상 요청마다 ratio만큼 적립, 재시도 1회에 1 소모)
+
+    장애 시 재시도가 트래픽을 증폭시키지 않도록 재시도 비율을 제한한다.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class UpstreamClient:
+    """공유 httpx.AsyncClient 기반 업스트림 호출
+
+    - 전체 연결 수와 호스트별 동시 요청 수를 분리해 제한 (느린 업체 하나가 풀을 독점하지 않음)
+    - 호스트별 슬롯 대기 시간도 제한해 빠르게 실패
+    - 5xx/타임아웃은 재시도 예산 안에서만 재시도
+    - 호스트별 서킷 브레이커
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_per_host: int,
+        connect_timeout: float,
+        read_timeout: float,
+        retries: int,
+        retry_budget_ratio: float,
+        breaker_threshold: int,
+        breaker_reset: float,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout)
+        self._transport = transport
+        self._retry_budget_ratio = retry_budget_ratio
+        self._breaker_threshold = breaker_threshold
+        self._breaker_reset = breaker_reset
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._budgets: dict[str, RetryBudget] = {}
+
+    async def open(self) -> None:
+        """연결 풀 생성"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=self._limits, timeout=self._timeout, transport=self._transport
+            )
+
+    async def close(self) -> None:
+        """연결 풀 종료"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """호스트별 서킷 브레이커"""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                self._breaker_threshold, self._breaker_reset
+            )
+        return breaker
+
+    def breaker_states(self) -> dict[str, str]:
+        """호스트별 서킷 상태"""
+        return {host: breaker.state for host, breaker in self._breakers.items()}
+
+    async def get_json(self, url: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """GET 요청 후 JSON 반환"""
+        if self._client is None:
+            raise RuntimeError("UpstreamClient가 열려 있지 않습니다 (open() 필요)")
+
+        host = httpx.URL(url).host
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(f"circuit open: {host}")
+        trial = breaker.state == "half_open"
+
+        budget = self._budgets.get(host)
+        if budget is None:
+            budget = self._budgets[host] = RetryBudget(
+                self._retry_budget_ratio, max_tokens=max(1.0, self.retries * 5.0)
+            )
+        budget.deposit()
+
+        try:
+            return await self._get_with_retries(host, url, params, breaker, budget)
+        except BaseException:
+            # 취소 등 결과 없이 끝나도 반개방 시험 호출이 계속 진행 중으로 남지 않게 반환
+            if trial:
+                breaker.release_trial()
+            raise
+
+    async def _get_with_retries(
+        self,
+        host: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        breaker: CircuitBreaker,
+        budget: RetryBudget,
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(host, url, params)
+            except (httpx.RequestError, asyncio.TimeoutError) as e:
+                error: UpstreamError = UpstreamError(f"{host}: {e!r}")
+            else:
+                if response.status_code < 500:
+                    breaker.record_success()
+                    if response.status_code >= 400:
+                        raise UpstreamError(f"{host}: HTTP {response.status_code}")
+                    return response.json()
+                error = UpstreamError(f"{host}: HTTP {response.status_code}")
+
+            attempt += 1
+            if attempt > self.retries or not budget.withdraw():
+                breaker.record_failure()
+                raise error
+            await asyncio.sleep(0.05 * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+
+    async def _send(
+        self, host: str, url: str, params: Optional[dict[str, Any]]
+    ) -> httpx.Response:
+        assert self._client is not None
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        await asyncio.wait_for(slots.acquire(), timeout=self._timeout.pool)
+        try:
+            return await self._client.get(url, params=params)
+        finally:
+            slots.release()
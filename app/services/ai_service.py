@@ -1,31 +1,330 @@
 """AI 서비스"""
 
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Hashable, Optional, Union
+
+from openai import AsyncOpenAI
+from pydantic_core import to_json
+
+from app.core.config import settings
+from app.core.metrics import instrument
+from app.core.shared_cache import SharedCache, TieredCache
 from app.models.ai import MarketBriefingResponse
+from app.models.market import SegmentType
+from app.services.market_service import MarketService
+from app.services.news_service import NewsService
 from datetime import datetime
 
+BRIEFING_SEGMENTS: tuple[SegmentType, ...] = ("KR", "US", "CRYPTO", "COMMO")
+
+# 입력에 넣을 속보/최신 뉴스 개수 (중복 제거 전)
+BRIEFING_NEWS_LIMIT = 10
+# 토큰 예산 초과 시에도 남겨 둘 최소 뉴스 개수
+_MIN_NEWS = 3
+
+
+# 가짜 토큰 생성기의 토큰 길이 (문자 수)
+_FAKE_TOKEN_SIZE = 8
+
+
+class _BriefingRun:
+    """진행 중인 브리핑 생성 (생성된 토큰을 보관하고 구독자에게 전달)
+
+    늦게 구독한 스트림도 지금까지의 토큰을 처음부터 받은 뒤 이어서 받는다.
+    """
+
+    __slots__ = ("tokens", "finished", "_changed")
+
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+        self.finished = False
+        self._changed = asyncio.Event()
+
+    def push(self, token: str) -> None:
+        self.tokens.append(token)
+        self._wake()
+
+    def finish(self) -> None:
+        self.finished = True
+        self._wake()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """토큰 순회 (생성이 끝나면 종료)"""
+        index = 0
+        while True:
+            if index < len(self.tokens):
+                index += 1
+                yield self.tokens[index - 1]
+                continue
+            if self.finished:
+                return
+            await self._changed.wait()
+
+    def _wake(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+@dataclass
+class _BriefingState:
+    """현재 브리핑 및 재생성 상태"""
+
+    current: Optional[MarketBriefingResponse] = None
+    inflight: Optional[asyncio.Task] = None
+    run: Optional[_BriefingRun] = None
+    generations: int = 0
+
+
+def _decode_briefing(key: Hashable, data: bytes) -> MarketBriefingResponse:
+    return MarketBriefingResponse.model_validate_json(data)
+
+
+_state = _BriefingState()
+# 입력 해시 → 생성된 브리핑 (REDIS_URL이 있으면 워커 간/재시작 후에도 재사용)
+_cache = SharedCache.register(
+    TieredCache(
+        "briefing",
+        ttl=settings.briefing_max_age,
+        stale_ttl=0.0,
+        encode=to_json,
+        decode=_decode_briefing,
+        lock_ttl=settings.briefing_lock_ttl,
+        max_entries=settings.briefing_cache_size,
+    )
+)
+_openai_client: Optional[AsyncOpenAI] = None
+
 
 class AIService:
     """AI 관련 비즈니스 로직"""
 
     @staticmethod
+    @instrument("ai", "briefing", "cache")
     async def get_market_briefing() -> MarketBriefingResponse:
-        """마켓 브리핑 생성 (Mock 데이터)"""
-        # TODO: 실제 OpenAI API 연동으로 교체
-        # 예시: OpenAI API를 사용하여 마켓 뉴스와 데이터를 분석하여 브리핑 생성
-        
+        """현재 브리핑 조회 (미생성 상태일 때만 생성 대기)"""
+        if _state.current is not None:
+            return _state.current
+        return await AIService.refresh_market_briefing()
+
+    @staticmethod
+    async def refresh_market_briefing() -> MarketBriefingResponse:
+        """브리핑 재생성 (동시 호출은 하나의 생성으로 합침)
+
+        입력 해시가 같은 브리핑이 캐시에 있으면 재사용한다.
+        """
+        return await asyncio.shield(AIService._start_refresh())
+
+    @staticmethod
+    async def stream_market_briefing() -> AsyncIterator[Union[str, MarketBriefingResponse]]:
+        """브리핑 스트리밍 (생성 중이면 토큰 문자열, 마지막에 MarketBriefingResponse)
+
+        완성된 브리핑이 있으면 토큰 없이 바로 반환한다. 생성이 필요하면
+        진행 중인 생성에 합류해 모델이 만든 토큰을 즉시 전달한다.
+        """
+        if _state.current is not None:
+            yield _state.current
+            return
+        task = AIService._start_refresh()
+        run = _state.run
+        if run is not None:
+            async for token in run.follow():
+                yield token
+        yield await asyncio.shield(task)
+
+    @staticmethod
+    def _start_refresh() -> asyncio.Task:
+        task = _state.inflight
+        if task is None:
+            run = _BriefingRun()
+            task = asyncio.get_running_loop().create_task(AIService._regenerate(run))
+            _state.inflight = task
+            _state.run = run
+            task.add_done_callback(_clear_inflight)
+        return task
+
+    @staticmethod
+    async def scheduled_refresh() -> None:
+        """주기 갱신 (입력이 바뀌었거나 캐시 항목이 BRIEFING_MAX_AGE를 넘긴 경우에만 생성)"""
+        await AIService.refresh_market_briefing()
+
+    @staticmethod
+    def cache_stats() -> dict[str, int]:
+        """브리핑 캐시 카운터 (hit = LLM 호출 생략)"""
+        return {**_cache.stats(), "generations": _state.generations}
+
+    @staticmethod
+    async def _regenerate(run: _BriefingRun) -> MarketBriefingResponse:
+        inputs = await AIService._collect_inputs()
+
+        async def generate() -> MarketBriefingResponse:
+            _state.generations += 1
+            return await AIService._generate_briefing(inputs, run.push)
+
+        briefing = await _cache.get(_fingerprint(inputs), generate)
+        _state.current = briefing
+        return briefing
+
+    @staticmethod
+    @instrument("ai", "inputs", "cache")
+    async def _collect_inputs() -> dict[str, Any]:
+        """브리핑 입력 수집 (시장 요약/섹터/자금 흐름 + 주요 뉴스, 토큰 예산 내로 축소)
+
+        같은 시장 상태면 같은 입력이 되도록 값을 반올림하고 순서를 고정한다.
+        """
+        markets, breaking, latest = await asyncio.gather(
+            asyncio.gather(*(_segment_input(seg) for seg in BRIEFING_SEGMENTS)),
+            NewsService.get_breaking_news(BRIEFING_NEWS_LIMIT),
+            NewsService.get_news_list(limit=BRIEFING_NEWS_LIMIT),
+        )
+        news = {}
+        for item in (*breaking, *latest.items):
+            news.setdefault(item.id, {"title": item.title, "category": item.category})
+        inputs = {"markets": list(markets), "news": list(news.values())}
+        _fit_budget(inputs, settings.briefing_input_token_budget)
+        return inputs
+
+    @staticmethod
+    @instrument("ai", "briefing", "upstream")
+    async def _generate_briefing(
+        inputs: dict[str, Any], on_token: Callable[[str], None]
+    ) -> MarketBriefingResponse:
+        """브리핑 생성 (토큰마다 on_token 호출, OpenAI 키가 없으면 가짜 토큰 생성기)"""
+        client = _get_openai_client()
+        tokens = _fake_tokens() if client is None else _openai_tokens(client, inputs)
+        parts = []
+        async for token in tokens:
+            parts.append(token)
+            on_token(token)
+
+        content = json.loads("".join(parts) or "{}")
         return MarketBriefingResponse(
-            briefing=(
-                "오늘 주요 시장은 상승세를 보였습니다. KOSPI는 전일 대비 0.61% 상승하며 2500선을 돌파했고, "
-                "S&P 500은 0.57% 상승했습니다. 암호화폐 시장도 강세를 보이며 비트코인은 2% 이상 상승했습니다. "
-                "기관 투자자들은 순매수로 전환했으며, 외국인 투자자들은 소폭 순매도를 기록했습니다."
-            ),
-            summary="주요 시장 전반적인 상승세, 기관 순매수 전환, 암호화폐 강세 지속",
-            key_points=[
-                "KOSPI 0.61% 상승, 2500선 돌파",
-                "S&P 500 0.57% 상승, 기술주 강세",
-                "비트코인 2% 이상 상승",
-                "기관 투자자 순매수 전환",
-            ],
+            briefing=content.get("briefing", ""),
+            summary=content.get("summary", ""),
+            key_points=content.get("key_points", []),
             generated_at=datetime.utcnow().isoformat() + "Z",
         )
 
+
+def _clear_inflight(task: asyncio.Task) -> None:
+    if _state.inflight is task:
+        _state.inflight = None
+        if _state.run is not None:
+            _state.run.finish()
+            _state.run = None
+
+
+async def _openai_tokens(client: AsyncOpenAI, inputs: dict[str, Any]) -> AsyncIterator[str]:
+    """OpenAI 스트리밍 응답의 토큰"""
+    stream = await client.chat.completions.create(
+        model=settings.openai_model,
+        response_format={"type": "json_object"},
+        stream=True,
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "당신은 금융 시장 애널리스트입니다. 주어진 시장 데이터와 뉴스를 바탕으로 "
+                    "한국어 마켓 브리핑을 작성하세요. JSON 객체로 briefing(문단), "
+                    "summary(한 문장), key_points(문자열 배열) 키를 이 순서대로 반환하세요."
+                ),
+            },
+            {"role": "user", "content": json.dumps(inputs, ensure_ascii=False)},
+        ],
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def _fake_tokens() -> AsyncIterator[str]:
+    """OpenAI 대신 Mock 브리핑 JSON을 토큰 단위로 흘려보내는 생성기 (로컬/테스트용)"""
+    mock = _mock_briefing()
+    text = json.dumps(mock.model_dump(exclude={"generated_at"}), ensure_ascii=False)
+    for start in range(0, len(text), _FAKE_TOKEN_SIZE):
+        await asyncio.sleep(settings.briefing_fake_token_delay)
+        yield text[start : start + _FAKE_TOKEN_SIZE]
+
+
+async def _segment_input(seg: SegmentType) -> dict[str, Any]:
+    """세그먼트별 입력 (섹터/자금 흐름은 변동 폭이 큰 순서로 정렬해 예산 초과 시 뒤에서 제거)"""
+    summary, sectors, flow = await asyncio.gather(
+        MarketService.get_market_summary(seg),
+        MarketService.get_market_sectors(seg),
+        MarketService.get_market_flow(seg),
+    )
+    return {
+        "segment": seg,
+        "indices": [
+            {
+                "name": item.index_name,
+                "value": round(item.value, 2),
+                "change_percent": round(item.change_percent, 2),
+            }
+            for item in summary.items
+        ],
+        "sectors": [
+            {"name": item.sector_name, "change_percent": round(item.change_percent, 2)}
+            for item in sorted(sectors.sectors, key=lambda item: -abs(item.change_percent))
+        ],
+        "flows": [
+            {"name": item.name, "net": round(item.net, -6)}
+            for item in sorted(flow.flows, key=lambda item: -abs(item.net))
+        ],
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사 (ASCII 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰)"""
+    ascii_length = len(text.encode("ascii", "ignore"))
+    return ascii_length // 4 + (len(text) - ascii_length)
+
+
+def _fit_budget(inputs: dict[str, Any], budget: int) -> None:
+    """토큰 예산을 넘으면 뉴스 → 섹터 → 자금 흐름 순으로 뒤에서부터 제거"""
+    while estimate_tokens(json.dumps(inputs, ensure_ascii=False)) > budget:
+        news = inputs["news"]
+        if len(news) > _MIN_NEWS:
+            news.pop()
+            continue
+        for field in ("sectors", "flows"):
+            longest = max((market[field] for market in inputs["markets"]), key=len)
+            if len(longest) > 1:
+                longest.pop()
+                break
+        else:
+            return
+
+
+def _fingerprint(inputs: dict[str, Any]) -> str:
+    raw = json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _get_openai_client() -> Optional[AsyncOpenAI]:
+    global _openai_client
+    if not settings.openai_api_key:
+        return None
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+    return _openai_client
+
+
+def _mock_briefing() -> MarketBriefingResponse:
+    return MarketBriefingResponse(
+        briefing=(
+            "오늘 주요 시장은 상승세를 보였습니다. KOSPI는 전일 대비 0.61% 상승하며 2500선을 돌파했고, "
+            "S&P 500은 0.57% 상승했습니다. 암호화폐 시장도 강세를 보이며 비트코인은 2% 이상 상승했습니다. "
+            "기관 투자자들은 순매수로 전환했으며, 외국인 투자자들은 소폭 순매도를 기록했습니다."
+        ),
+        summary="주요 시장 전반적인 상승세, 기관 순매수 전환, 암호화폐 강세 지속",
+        key_points=[
+            "KOSPI 0.61% 상승, 2500선 돌파",
+            "S&P 500 0.57% 상승, 기술주 강세",
+            "비트코인 2% 이상 상승",
+            "기관 투자자 순매수 전환",
+        ],
+        generated_at=datetime.utcnow().isoformat() + "Z",
+    )
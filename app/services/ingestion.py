@@ -0,0 +1,92 @@
+"""업스트림 데이터 수집 작업"""
+
+from functools import partial
+from typing import Any, Awaitable, Callable, get_args
+
+from app.core.config import settings
+from app.core.scheduler import Scheduler
+from app.models.stocks import MarketType
+from app.services.ai_service import AIService
+from app.services.market_service import SEGMENTS, MarketService
+from app.services.news_service import NewsService
+from app.services.snapshot import MarketSnapshot, Role, build_snapshot
+from app.services.stocks_service import StocksService, quote_store
+
+
+def _new_scheduler() -> Scheduler:
+    return Scheduler(
+        jitter=settings.scheduler_jitter,
+        max_backoff=settings.scheduler_max_backoff,
+        shutdown_timeout=settings.scheduler_shutdown_timeout,
+    )
+
+
+def publish_snapshot() -> None:
+    """writer 워커: 마켓/시세 스냅샷을 공유 메모리에 기록"""
+    MarketSnapshot.publish(
+        lambda generation: build_snapshot(
+            generation,
+            market=MarketService.snapshot_payloads(),
+            quotes=quote_store,
+            popular=StocksService.snapshot_popular_rows(),
+        )
+    )
+
+
+# 아직 한 번도 성공하지 않은 수집 작업 (모두 성공한 뒤부터 스냅샷 기록)
+_unfed: set[str] = set()
+
+
+def _publishing(name: str, func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[None]]:
+    """수집 작업 성공 후 스냅샷 기록
+
+    reader는 첫 스냅샷이 보이면 준비된 것으로 보므로, 새로 시작했거나 역할을 이어받은 writer는
+    모든 마켓/시세 작업이 한 번 이상 데이터를 채운 뒤에만 기록한다 (빈 시세표 방지).
+    """
+    _unfed.add(name)
+
+    async def run() -> None:
+        await func()
+        _unfed.discard(name)
+        if not _unfed:
+            publish_snapshot()
+
+    return run
+
+
+# 워커마다 실행하는 작업
+scheduler = _new_scheduler()
+scheduler.add_job("news", NewsService.refresh, settings.news_poll_interval)
+scheduler.add_job("ai.briefing", AIService.scheduled_refresh, settings.briefing_check_interval)
+
+# 마켓/시세 수집 (멀티 워커 모드에서는 스냅샷 writer 워커만 실행)
+# 핸들러는 인메모리 저장소(또는 스냅샷)만 읽고, 업스트림 조회는 아래 작업이 담당한다
+feed_scheduler = _new_scheduler()
+for seg in SEGMENTS:
+    name = f"market.{seg}"
+    feed_scheduler.add_job(
+        name,
+        _publishing(name, partial(MarketService.refresh, seg)),
+        settings.market_poll_interval,
+    )
+for market in get_args(MarketType):
+    name = f"stocks.{market}"
+    feed_scheduler.add_job(
+        name,
+        _publishing(name, partial(StocksService.refresh, market)),
+        settings.stocks_poll_interval,
+    )
+
+
+def start_ingestion(role: Role) -> None:
+    """수집 스케줄러 시작
+
+    멀티 워커 모드의 reader는 마켓/시세를 수집하지 않고 writer 종료 시 이어받는다.
+    """
+    scheduler.start()
+    if role == "reader":
+        MarketSnapshot.start(
+            on_elected=feed_scheduler.start, on_change=MarketService.publish_snapshot
+        )
+    else:
+        feed_scheduler.start()
@@ -1,159 +1,170 @@
 """마켓 서비스"""
 
-from typing import Literal
+import asyncio
+from typing import Hashable, get_args
 from app.models.market import (
     MarketSummary,
     MarketSectors,
     MarketFlow,
     SegmentType,
-    MarketSummaryItem,
-    SectorItem,
-    FlowItem,
 )
-from datetime import datetime
+from app.core.broadcast import hub
+from app.core.config import settings
+from app.core.etag import payload_etag
+from app.core.metrics import instrument
+from app.core.responses import payload_encoder
+from app.core.shared_cache import SharedCache, TieredCache
+from pydantic import BaseModel
+from pydantic_core import to_json
+from app.providers import Providers
+from app.services.snapshot import MarketSnapshot, SnapshotView
+
+SEGMENTS: tuple[SegmentType, ...] = get_args(SegmentType)
+
+
+def summary_topic(seg: SegmentType) -> str:
+    """마켓 요약 SSE 토픽"""
+    return f"market.summary.{seg}"
+
+
+def _publish_update(key: Hashable, value: object) -> None:
+    """요약 갱신 시 내용이 바뀌었으면 SSE 구독자에게 발행"""
+    endpoint, seg = key
+    if endpoint == "summary":
+        payload = payload_encoder.encode(value)
+        hub.publish(summary_topic(seg), payload.body, version=payload_etag(payload))
+
+
+_MODELS: dict[str, type[BaseModel]] = {
+    "summary": MarketSummary,
+    "sectors": MarketSectors,
+    "flow": MarketFlow,
+}
+
+
+def _decode(key: Hashable, data: bytes) -> BaseModel:
+    """L2 저장 값 → 응답 모델"""
+    endpoint, _ = key
+    return _MODELS[endpoint].model_validate_json(data)
+
+
+# (엔드포인트, 세그먼트) 단위 캐시 (REDIS_URL 설정 시 워커 간 공유)
+_cache = SharedCache.register(
+    TieredCache(
+        "market",
+        ttl=settings.market_cache_ttl,
+        stale_ttl=settings.market_cache_stale_ttl,
+        encode=to_json,
+        decode=_decode,
+        lock_ttl=settings.cache_lock_ttl,
+        on_update=_publish_update,
+    )
+)
+
+
+def _from_snapshot(endpoint: str, seg: SegmentType):
+    """reader 워커: 공유 스냅샷의 값 (없으면 None)"""
+    if not MarketSnapshot.is_reader():
+        return None
+    return MarketSnapshot.read(
+        lambda view: view.market_model(f"{endpoint}:{seg}", _MODELS[endpoint])
+    )
 
 
 class MarketService:
     """마켓 관련 비즈니스 로직"""
 
     @staticmethod
+    @instrument("market", "summary", "cache")
     async def get_market_summary(seg: SegmentType) -> MarketSummary:
-        """마켓 요약 조회 (Mock 데이터)"""
-        # TODO: 실제 외부 API 연동으로 교체
-        mock_items = []
-        
-        if seg == "KR":
-            mock_items = [
-                MarketSummaryItem(
-                    index_name="KOSPI",
-                    value=2500.5,
-                    change=15.2,
-                    change_percent=0.61,
-                    status="UP",
-                ),
-                MarketSummaryItem(
-                    index_name="KOSDAQ",
-                    value=850.3,
-                    change=-5.1,
-                    change_percent=-0.60,
-                    status="DOWN",
-                ),
-            ]
-        elif seg == "US":
-            mock_items = [
-                MarketSummaryItem(
-                    index_name="S&P 500",
-                    value=4500.2,
-                    change=25.5,
-                    change_percent=0.57,
-                    status="UP",
-                ),
-                MarketSummaryItem(
-                    index_name="NASDAQ",
-                    value=14000.8,
-                    change=45.3,
-                    change_percent=0.32,
-                    status="UP",
-                ),
-            ]
-        elif seg == "CRYPTO":
-            mock_items = [
-                MarketSummaryItem(
-                    index_name="BTC",
-                    value=42000.5,
-                    change=850.2,
-                    change_percent=2.07,
-                    status="UP",
-                ),
-                MarketSummaryItem(
-                    index_name="ETH",
-                    value=2200.3,
-                    change=35.1,
-                    change_percent=1.62,
-                    status="UP",
-                ),
-            ]
-        elif seg == "COMMO":
-            mock_items = [
-                MarketSummaryItem(
-                    index_name="WTI",
-                    value=75.5,
-                    change=-1.2,
-                    change_percent=-1.56,
-                    status="DOWN",
-                ),
-                MarketSummaryItem(
-                    index_name="Gold",
-                    value=2000.8,
-                    change=5.5,
-                    change_percent=0.28,
-                    status="UP",
-                ),
-            ]
-
-        return MarketSummary(
-            segment=seg,
-            items=mock_items,
-            updated_at=datetime.utcnow().isoformat() + "Z",
+        """마켓 요약 조회 (캐시)"""
+        shared = _from_snapshot("summary", seg)
+        if shared is not None:
+            return shared
+        return await _cache.get(
+            ("summary", seg), lambda: MarketService._fetch_market_summary(seg)
         )
 
     @staticmethod
+    @instrument("market", "sectors", "cache")
     async def get_market_sectors(seg: SegmentType) -> MarketSectors:
-        """마켓 섹터 조회 (Mock 데이터)"""
-        # TODO: 실제 외부 API 연동으로 교체
-        mock_sectors = []
-        
-        if seg == "KR":
-            mock_sectors = [
-                SectorItem(sector_name="기술", change_percent=1.5, status="UP"),
-                SectorItem(sector_name="금융", change_percent=-0.8, status="DOWN"),
-                SectorItem(sector_name="에너지", change_percent=2.1, status="UP"),
-                SectorItem(sector_name="바이오", change_percent=0.3, status="UP"),
-            ]
-        elif seg == "US":
-            mock_sectors = [
-                SectorItem(sector_name="Technology", change_percent=1.2, status="UP"),
-                SectorItem(sector_name="Finance", change_percent=-0.5, status="DOWN"),
-                SectorItem(sector_name="Healthcare", change_percent=0.8, status="UP"),
-            ]
-        else:
-            mock_sectors = [
-                SectorItem(sector_name="Sector 1", change_percent=0.5, status="UP"),
-                SectorItem(sector_name="Sector 2", change_percent=-0.3, status="DOWN"),
-            ]
-
-        return MarketSectors(
-            segment=seg,
-            sectors=mock_sectors,
-            updated_at=datetime.utcnow().isoformat() + "Z",
+        """마켓 섹터 조회 (캐시)"""
+        shared = _from_snapshot("sectors", seg)
+        if shared is not None:
+            return shared
+        return await _cache.get(
+            ("sectors", seg), lambda: MarketService._fetch_market_sectors(seg)
         )
 
     @staticmethod
+    @instrument("market", "flow", "cache")
     async def get_market_flow(seg: SegmentType) -> MarketFlow:
-        """마켓 자금 흐름 조회 (Mock 데이터)"""
-        # TODO: 실제 외부 API 연동으로 교체
-        mock_flows = []
-        
-        if seg == "KR":
-            mock_flows = [
-                FlowItem(name="기관", inflow=5000000000.0, outflow=3000000000.0, net=2000000000.0),
-                FlowItem(name="외국인", inflow=3000000000.0, outflow=4000000000.0, net=-1000000000.0),
-                FlowItem(name="개인", inflow=2000000000.0, outflow=3000000000.0, net=-1000000000.0),
-            ]
-        elif seg == "US":
-            mock_flows = [
-                FlowItem(name="Institutions", inflow=10000000000.0, outflow=8000000000.0, net=2000000000.0),
-                FlowItem(name="Foreign", inflow=5000000000.0, outflow=3000000000.0, net=2000000000.0),
-            ]
-        else:
-            mock_flows = [
-                FlowItem(name="Flow 1", inflow=1000000.0, outflow=500000.0, net=500000.0),
-                FlowItem(name="Flow 2", inflow=800000.0, outflow=900000.0, net=-100000.0),
-            ]
-
-        return MarketFlow(
-            segment=seg,
-            flows=mock_flows,
-            updated_at=datetime.utcnow().isoformat() + "Z",
+        """마켓 자금 흐름 조회 (캐시)"""
+        shared = _from_snapshot("flow", seg)
+        if shared is not None:
+            return shared
+        return await _cache.get(
+            ("flow", seg), lambda: MarketService._fetch_market_flow(seg)
+        )
+
+    @staticmethod
+    def cache_stats() -> dict[str, int]:
+        """캐시 hit/miss/refresh 카운터"""
+        return _cache.stats()
+
+    @staticmethod
+    async def refresh(seg: SegmentType) -> None:
+        """업스트림에서 세그먼트 데이터를 받아 캐시에 기록 (수집 작업용)
+
+        여러 워커가 같은 주기로 실행해도 임대를 얻은 1개 워커만 업스트림을 조회하고,
+        나머지 워커는 무효화 메시지로 L2 값을 받는다.
+        """
+        if not await _cache.lease(("refresh", seg), settings.market_poll_interval * 0.8):
+            return
+        summary, sectors, flow = await asyncio.gather(
+            MarketService._fetch_market_summary(seg),
+            MarketService._fetch_market_sectors(seg),
+            MarketService._fetch_market_flow(seg),
+        )
+        await asyncio.gather(
+            _cache.put(("summary", seg), summary),
+            _cache.put(("sectors", seg), sectors),
+            _cache.put(("flow", seg), flow),
         )
 
+    @staticmethod
+    def publish_snapshot(view: SnapshotView) -> None:
+        """reader 워커: 새 스냅샷의 요약을 SSE 구독자에게 발행 (내용이 같으면 무시)"""
+        for seg in SEGMENTS:
+            summary = view.market_model(f"summary:{seg}", MarketSummary)
+            if summary is not None:
+                _publish_update(("summary", seg), summary)
+
+    @staticmethod
+    def snapshot_payloads() -> dict[str, bytes]:
+        """스냅샷에 실을 캐시 값 ("summary:KR" → JSON)"""
+        payloads = {}
+        for endpoint in _MODELS:
+            for seg in SEGMENTS:
+                value = _cache.peek((endpoint, seg))
+                if value is not None:
+                    payloads[f"{endpoint}:{seg}"] = payload_encoder.encode(value).body
+        return payloads
+
+    @staticmethod
+    @instrument("market", "summary", "upstream")
+    async def _fetch_market_summary(seg: SegmentType) -> MarketSummary:
+        """마켓 요약 조회 (업스트림)"""
+        return await Providers.market.fetch_summary(seg)
+
+    @staticmethod
+    @instrument("market", "sectors", "upstream")
+    async def _fetch_market_sectors(seg: SegmentType) -> MarketSectors:
+        """마켓 섹터 조회 (업스트림)"""
+        return await Providers.market.fetch_sectors(seg)
+
+    @staticmethod
+    @instrument("market", "flow", "upstream")
+    async def _fetch_market_flow(seg: SegmentType) -> MarketFlow:
+        """마켓 자금 흐름 조회 (업스트림)"""
+        return await Providers.market.fetch_flow(seg)
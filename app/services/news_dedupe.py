@@ -0,0 +1,117 @@
+"""유사 기사(중복 보도) 탐지 (MinHash + LSH)
+
+제목+요약을 검색 색인과 같은 토큰(한글 바이그램, 영문 단어) 집합으로 보고 자카드 유사도로 비교한다.
+MinHash 서명을 band로 나눠 버킷에 넣으므로 새 기사는 같은 버킷의 후보만 확인하며,
+후보는 저장해 둔 토큰 해시 집합으로 정확한 자카드 유사도를 계산해 확정한다.
+"""
+
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from app.services.news_index import tokenize
+
+NUM_PERM = 64
+_BAND_CHOICES = (32, 16, 8, 4, 2, 1)  # band당 행 수 후보 (NUM_PERM의 약수)
+_SEED = 20240601
+
+
+def _rows_per_band(threshold: float) -> int:
+    """LSH 후보 기준 (1/b)^(1/r)이 threshold보다 충분히 낮은 가장 큰 r (누락 방지)"""
+    for rows in _BAND_CHOICES:
+        bands = NUM_PERM // rows
+        if (1 / bands) ** (1 / rows) <= threshold - 0.1:
+            return rows
+    return 1
+
+
+def shingles(text: str) -> np.ndarray:
+    """토큰 해시 집합 (정렬된 uint32 배열)"""
+    hashes = [zlib.crc32(token.encode("utf-8")) for token in tokenize(text)]
+    return np.unique(np.array(hashes, dtype=np.uint32))
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """정렬된 해시 집합의 자카드 유사도"""
+    if a.size == 0 or b.size == 0:
+        return 0.0
+    common = np.intersect1d(a, b, assume_unique=True).size
+    return common / (a.size + b.size - common)
+
+
+class NearDuplicateIndex:
+    """MinHash LSH 색인 (ID → 서명/토큰 해시, band 버킷 → ID 집합)"""
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.rows = _rows_per_band(threshold)
+        self.bands = NUM_PERM // self.rows
+        rng = np.random.default_rng(_SEED)
+        # 곱셈-시프트 해시 계열 h(x) = (a * x + b) >> 32 (a는 홀수, uint64 오버플로 허용)
+        self._a = rng.integers(1, 2**63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+        # 추정 오차(표준편차 약 sqrt(J(1-J)/NUM_PERM) ≤ 0.0625)의 3배 여유
+        self._min_agreement = max(0.0, threshold - 0.2) * NUM_PERM
+        self._signatures: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._buckets: dict[tuple[int, bytes], set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        """MinHash 서명 (토큰이 없으면 빈 배열)"""
+        if hashes.size == 0:
+            return hashes
+        with np.errstate(over="ignore"):
+            values = (hashes.astype(np.uint64)[:, None] * self._a + self._b) >> np.uint64(32)
+        return values.min(axis=0).astype(np.uint32)
+
+    def find(self, hashes: np.ndarray, signature: np.ndarray) -> Optional[str]:
+        """같은 버킷 후보 중 threshold 이상으로 가장 유사한 기사 ID"""
+        if signature.size == 0:
+            return None
+        candidates: set[str] = set()
+        for key in self._band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket:
+                candidates.update(bucket)
+
+        best_id, best = None, self.threshold
+        for news_id in candidates:
+            stored_hashes, stored_signature = self._signatures[news_id]
+            # 서명 일치 비율(자카드 추정치)이 기준보다 확실히 낮으면 정확한 계산 생략
+            if np.count_nonzero(stored_signature == signature) < self._min_agreement:
+                continue
+            similarity = jaccard(hashes, stored_hashes)
+            if similarity >= best:
+                best_id, best = news_id, similarity
+        return best_id
+
+    def add(self, news_id: str, hashes: np.ndarray, signature: np.ndarray) -> None:
+        """기사 등록 (같은 ID가 있으면 교체)"""
+        self.remove(news_id)
+        if signature.size == 0:
+            return
+        self._signatures[news_id] = (hashes, signature)
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, set()).add(news_id)
+
+    def remove(self, news_id: str) -> None:
+        """기사 제거"""
+        entry = self._signatures.pop(news_id, None)
+        if entry is None:
+            return
+        for key in self._band_keys(entry[1]):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(news_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _band_keys(self, signature: np.ndarray) -> list[tuple[int, bytes]]:
+        rows = self.rows
+        return [
+            (band, signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self.bands)
+        ]
@@ -0,0 +1,238 @@
+"""뉴스 검색 역색인
+
+형태소 분석기 없이 한글(및 한자/가나)은 글자 바이그램, 라틴 문자/숫자는 단어 단위로 토큰화한다.
+색인에는 한글 글자 단위(유니그램) 토큰도 넣어 한 글자 검색어(예: "금")도 찾을 수 있다.
+토큰별 포스팅 리스트는 문서 번호 오름차순 uint32 배열(array)이며, 값의 최하위 비트는
+제목 포함 여부, 나머지 비트는 문서 번호다. 질의는 모든 토큰을 포함한 문서(AND)를 찾는다.
+"""
+
+import re
+import unicodedata
+from array import array
+from typing import Iterable, Optional
+
+import numpy as np
+
+# 한글/한자/가나 연속 구간 또는 라틴 문자·숫자 단어
+_TOKEN_PATTERN = re.compile(
+    r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3]+|[0-9a-z\u00c0-\u024f]+"
+)
+# 이 문자 이상으로 시작하는 구간은 바이그램으로 나눔
+_BIGRAM_START = "\u3040"
+
+MAX_QUERY_TOKENS = 32
+
+# 삭제된 문서가 이보다 많고 살아 있는 문서 수를 넘으면 포스팅을 압축
+_COMPACT_MIN = 1024
+
+# 정렬 키: (순위 점수, 뉴스 ID)
+RankKey = tuple[float, str]
+
+assert array("I").itemsize == 4
+
+
+def tokenize(text: str, unigrams: bool = False) -> list[str]:
+    """검색 토큰 (NFKC 정규화 + 소문자, 중복 포함)
+
+    unigrams=True면 바이그램으로 나눈 구간의 각 글자도 토큰에 포함한다 (색인용).
+    """
+    tokens: list[str] = []
+    for run in _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if run[0] < _BIGRAM_START or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+            if unigrams:
+                tokens.extend(run)
+    return tokens
+
+
+class SearchIndex:
+    """증분 갱신되는 역색인
+
+    - 토큰 → 포스팅 배열 (문서 번호 오름차순, 추가는 끝에 append)
+    - 문서 번호별 발행 시각/카테고리/생존 여부 컬럼 (NumPy 배열)
+    - 삭제는 표시만 하고, 삭제 문서가 쌓이면 문서 번호를 다시 매겨 포스팅을 압축한다
+
+    순위는 발행 시각에 반감기(half_life) 기준 지수 감쇠를 적용한 관련도로 정한다.
+    관련도 r = 1 + (제목에 포함된 질의 토큰 비율)이고, 점수 r * 0.5^(경과 시간 / half_life)를
+    로그로 바꾸면 published_ts + half_life * log2(r)이 되므로 현재 시각 없이 비교할 수 있다
+    (제목에 모두 포함되면 half_life만큼 최신 기사로 취급).
+    """
+
+    def __init__(self, half_life: float, capacity: int = 1024) -> None:
+        self.half_life = half_life
+        self._postings: dict[str, array] = {}
+        self._docs: dict[str, int] = {}
+        self._ids: list[Optional[str]] = []
+        self._categories: dict[str, int] = {}
+        self._size = 0
+        self._dead = 0
+        self._ts = np.zeros(capacity, dtype=np.float64)
+        self._category = np.zeros(capacity, dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=np.bool_)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @property
+    def token_count(self) -> int:
+        """색인된 고유 토큰 수"""
+        return len(self._postings)
+
+    def add(
+        self,
+        news_id: str,
+        published_ts: float,
+        category: str,
+        title: str,
+        texts: Iterable[str],
+    ) -> None:
+        """문서 추가 (같은 ID가 있으면 교체)"""
+        self.remove(news_id)
+        doc = self._size
+        if doc == len(self._ts):
+            self._grow()
+        self._size += 1
+        self._docs[news_id] = doc
+        self._ids.append(news_id)
+        self._ts[doc] = published_ts
+        self._category[doc] = self._category_code(category)
+        self._alive[doc] = True
+
+        title_tokens = set(tokenize(title, unigrams=True))
+        tokens = set(title_tokens)
+        for text in texts:
+            tokens.update(tokenize(text, unigrams=True))
+        entry = doc << 1
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = array("I")
+            posting.append(entry | 1 if token in title_tokens else entry)
+
+    def remove(self, news_id: str) -> None:
+        """문서 삭제 (포스팅에서는 압축 시 제거)"""
+        doc = self._docs.pop(news_id, None)
+        if doc is None:
+            return
+        self._alive[doc] = False
+        self._ids[doc] = None
+        self._dead += 1
+        if self._dead > _COMPACT_MIN and self._dead > len(self._docs):
+            self.compact()
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str],
+        limit: int,
+        after: Optional[RankKey] = None,
+    ) -> tuple[list[RankKey], int, bool]:
+        """질의 토큰을 모두 포함한 문서를 순위순으로 조회 → (키 목록, 전체 개수, 다음 페이지 여부)
+
+        after가 있으면 해당 키 다음 순위부터 조회한다. 검색 가능한 토큰이 없으면 ValueError.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
+        if not tokens:
+            raise ValueError("검색어에 검색 가능한 문자가 없습니다")
+
+        postings = []
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                return [], 0, False
+            postings.append(posting)
+        postings.sort(key=len)
+
+        # 가장 짧은 포스팅을 기준으로 나머지에서 이진 탐색해 교집합을 구함
+        # (항목 값 doc << 1 | 제목 비트는 문서 번호 순서와 같으므로 긴 포스팅은 변환 없이 탐색)
+        entries = np.frombuffer(postings[0], dtype=np.uint32)
+        docs = entries >> 1
+        title_hits = (entries & 1).astype(np.int32)
+        for posting in postings[1:]:
+            if docs.size == 0:
+                break
+            entries = np.frombuffer(posting, dtype=np.uint32)
+            index = np.searchsorted(entries, docs << 1)
+            index[index == entries.size] = 0
+            matched = entries[index]
+            found = (matched >> 1) == docs
+            docs = docs[found]
+            title_hits = title_hits[found] + (matched[found] & 1)
+
+        mask = self._alive[docs]
+        if category is not None:
+            code = self._categories.get(category)
+            if code is None:
+                return [], 0, False
+            mask &= self._category[docs] == code
+        docs = docs[mask]
+        total = int(docs.size)
+        if total == 0:
+            return [], 0, False
+
+        relevance = 1.0 + title_hits[mask] / len(tokens)
+        ranks = self._ts[docs] + self.half_life * np.log2(relevance)
+
+        if after is not None:
+            after_rank, after_id = after
+            keep = ranks < after_rank
+            for i in np.flatnonzero(ranks == after_rank):
+                keep[i] = self._ids[docs[i]] < after_id
+            docs, ranks = docs[keep], ranks[keep]
+
+        remaining = int(docs.size)
+        if limit < remaining:
+            # 상위 limit개 경계 점수 이상을 모두 골라 (점수, ID) 순으로 정렬
+            bound = -np.partition(-ranks, limit - 1)[limit - 1]
+            picked = np.flatnonzero(ranks >= bound)
+        else:
+            picked = np.arange(remaining)
+        keys = sorted(
+            ((float(ranks[i]), self._ids[docs[i]]) for i in picked),
+            reverse=True,
+        )[:limit]
+        return keys, total, remaining > limit  # type: ignore[return-value]
+
+    def compact(self) -> None:
+        """삭제된 문서를 포스팅에서 제거하고 문서 번호를 다시 매김 (순서 유지)"""
+        alive = self._alive[: self._size]
+        remap = (np.cumsum(alive) - 1).astype(np.uint32)
+        for token, posting in list(self._postings.items()):
+            entries = np.frombuffer(posting, dtype=np.uint32)
+            docs = entries >> 1
+            keep = alive[docs]
+            if not keep.any():
+                del self._postings[token]
+                continue
+            compacted = array("I")
+            compacted.frombytes(((remap[docs[keep]] << 1) | (entries[keep] & 1)).tobytes())
+            self._postings[token] = compacted
+
+        size = int(alive.sum())
+        capacity = max(len(self._ts), 16)
+        for name in ("_ts", "_category", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:size] = old[: self._size][alive]
+            setattr(self, name, new)
+        self._ids = [news_id for news_id in self._ids if news_id is not None]
+        self._docs = {news_id: doc for doc, news_id in enumerate(self._ids)}
+        self._size = size
+        self._dead = 0
+
+    def _category_code(self, category: str) -> int:
+        code = self._categories.get(category)
+        if code is None:
+            code = self._categories[category] = len(self._categories)
+        return code
+
+    def _grow(self) -> None:
+        capacity = max(len(self._ts) * 2, 16)
+        for name in ("_ts", "_category", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
@@ -1,111 +1,142 @@
 """뉴스 서비스"""
 
-from app.models.news import NewsItem, NewsListResponse, NewsDetail
-from datetime import datetime, timedelta
+import math
+from typing import Iterable, Optional
+from pydantic_core import to_json
+from app.core.broadcast import hub
+from app.core.config import settings
+from app.core.cursor import decode_cursor, encode_cursor
+from app.core.etag import compute_etag
+from app.core.metrics import instrument
+from app.models.news import NewsItem, NewsListResponse, NewsDetail, NewsSearchResponse
+from app.providers import Providers
+from app.services.news_index import RankKey
+from app.services.news_store import NewsStore, NewsKey
+
+BREAKING_TOPIC = "news.breaking"
+BREAKING_STREAM_LIMIT = 5
+
+news_store = NewsStore(
+    retention_seconds=settings.news_retention_hours * 3600,
+    breaking_size=settings.news_breaking_size,
+    search_half_life=settings.news_search_half_life_hours * 3600,
+    dedupe_threshold=settings.news_dedupe_threshold,
+)
 
 
 class NewsService:
     """뉴스 관련 비즈니스 로직"""
 
     @staticmethod
+    @instrument("news", "list", "cache")
     async def get_news_list(
         category: str = "전체",
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
     ) -> NewsListResponse:
-        """뉴스 리스트 조회 (Mock 데이터)"""
-        # TODO: 실제 Supabase 또는 외부 API 연동으로 교체
-        
-        # Mock 데이터 생성
-        all_categories = ["전체", "증시", "경제", "산업", "정치", "국제"]
-        if category != "전체":
-            categories = [category]
-        else:
-            categories = all_categories[1:]  # "전체" 제외
-        
-        mock_items = []
-        base_time = datetime.utcnow() - timedelta(hours=1)
-        
-        for i in range(limit):
-            category_name = categories[i % len(categories)]
-            item_time = base_time - timedelta(minutes=i * 10)
-            
-            mock_items.append(
-                NewsItem(
-                    id=f"news-{i+1:04d}",
-                    title=f"{category_name} 관련 뉴스 제목 {i+1}",
-                    summary=f"{category_name} 분야의 중요한 뉴스 요약 내용입니다.",
-                    source=f"출처{i+1}",
-                    category=category_name,
-                    published_at=item_time.isoformat() + "Z",
-                    url=f"https://example.com/news/{i+1}",
-                    image_url=f"https://example.com/images/news-{i+1}.jpg",
-                    is_breaking=(i < 2),  # 처음 2개를 속보로 설정
-                )
-            )
-        
-        # 페이지네이션 적용
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_items = mock_items[start_idx:end_idx]
-        
-        # Mock total (실제로는 DB 쿼리 결과)
-        total = 100  # 예시값
-        
+        """뉴스 리스트 조회 (최신순)
+
+        cursor가 있으면 (published_at, id) 기준 keyset 페이지네이션을 사용하고,
+        없으면 page 기반 오프셋 조회로 동작한다 (하위 호환).
+        """
+        before = _decode_news_cursor(cursor) if cursor is not None else None
+        items, total, has_more = news_store.page(
+            category, limit, before=before, offset=(page - 1) * limit
+        )
+
+        next_cursor = None
+        if has_more and items:
+            last_key = news_store.key_of(items[-1].id)
+            if last_key is not None:
+                next_cursor = encode_cursor(*last_key)
+
         return NewsListResponse(
-            items=paginated_items,
+            items=items,
             total=total,
             page=page,
             limit=limit,
-            has_more=end_idx < total,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    @instrument("news", "search", "cache")
+    async def search_news(
+        query: str,
+        category: str = "전체",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> NewsSearchResponse:
+        """뉴스 검색 (제목/요약/태그, 모든 검색어 토큰 포함)
+
+        제목 일치 비율과 발행 시각으로 순위를 매기고, cursor는 (점수, id) 기준으로 이어서 조회한다.
+        """
+        after = _decode_search_cursor(cursor) if cursor is not None else None
+        items, total, last_key = news_store.search(query, category, limit, after)
+        return NewsSearchResponse(
+            query=query,
+            items=items,
+            total=total,
+            limit=limit,
+            has_more=last_key is not None,
+            next_cursor=encode_cursor(*last_key) if last_key is not None else None,
         )
 
     @staticmethod
+    @instrument("news", "breaking", "cache")
     async def get_breaking_news(limit: int = 5) -> list[NewsItem]:
-        """속보 뉴스 조회 (Mock 데이터)"""
-        # TODO: 실제 Supabase 또는 외부 API 연동으로 교체
-        
-        mock_items = []
-        base_time = datetime.utcnow() - timedelta(minutes=10)
-        
-        for i in range(limit):
-            item_time = base_time - timedelta(minutes=i * 2)
-            mock_items.append(
-                NewsItem(
-                    id=f"breaking-{i+1:04d}",
-                    title=f"속보: 중요 뉴스 제목 {i+1}",
-                    summary="속보 뉴스의 요약 내용입니다.",
-                    source=f"속보출처{i+1}",
-                    category="증시",
-                    published_at=item_time.isoformat() + "Z",
-                    url=f"https://example.com/news/breaking-{i+1}",
-                    image_url=f"https://example.com/images/breaking-{i+1}.jpg",
-                    is_breaking=True,
-                )
-            )
-        
-        return mock_items
+        """속보 뉴스 조회"""
+        return news_store.breaking(limit)
 
     @staticmethod
+    @instrument("news", "detail", "cache")
     async def get_news_detail(news_id: str) -> NewsDetail:
-        """뉴스 상세 조회 (Mock 데이터)"""
-        # TODO: 실제 Supabase 또는 외부 API 연동으로 교체
-        
-        return NewsDetail(
-            id=news_id,
-            title="뉴스 상세 제목",
-            content=(
-                "이것은 뉴스의 본문 내용입니다.\n\n"
-                "여러 단락으로 구성된 뉴스 내용을 여기에 표시합니다.\n\n"
-                "중요한 정보와 분석 내용이 포함되어 있습니다."
-            ),
-            summary="뉴스의 요약 내용입니다.",
-            source="출처명",
-            category="증시",
-            published_at=(datetime.utcnow() - timedelta(hours=2)).isoformat() + "Z",
-            url=f"https://example.com/news/{news_id}",
-            image_url=f"https://example.com/images/{news_id}.jpg",
-            is_breaking=False,
-            tags=["주식", "증시", "투자"],
-        )
+        """뉴스 상세 조회"""
+        detail = news_store.get(news_id)
+        if detail is None:
+            raise LookupError(f"뉴스를 찾을 수 없습니다: {news_id}")
+        return detail
+
+    @staticmethod
+    def ingest(details: Iterable[NewsDetail]) -> int:
+        """수집된 기사 반영 (추가/갱신된 개수 반환)"""
+        count = news_store.upsert_many(details)
+        if count:
+            NewsService.publish_breaking()
+        return count
+
+    @staticmethod
+    async def refresh() -> None:
+        """업스트림에서 최신 기사를 받아 반영 (수집 작업용)"""
+        NewsService.ingest(await NewsService._fetch_latest())
+        news_store.prune()
+
+    @staticmethod
+    @instrument("news", "latest", "upstream")
+    async def _fetch_latest() -> list[NewsDetail]:
+        """최신 기사 조회 (업스트림)"""
+        return await Providers.news.fetch_latest()
+
+    @staticmethod
+    def publish_breaking() -> None:
+        """속보 목록이 바뀌었으면 SSE 구독자에게 발행"""
+        items = news_store.breaking(BREAKING_STREAM_LIMIT)
+        data = [item.model_dump() for item in items]
+        hub.publish(BREAKING_TOPIC, to_json(data), version=compute_etag(data))
+
+
+def _decode_news_cursor(cursor: str) -> NewsKey:
+    timestamp, news_id = decode_cursor(cursor, 2)
+    if not isinstance(timestamp, (int, float)) or not isinstance(news_id, str):
+        raise ValueError("잘못된 커서입니다")
+    return float(timestamp), news_id
+
 
+def _decode_search_cursor(cursor: str) -> RankKey:
+    rank, news_id = decode_cursor(cursor, 2)
+    if not isinstance(rank, (int, float)) or not isinstance(news_id, str):
+        raise ValueError("잘못된 커서입니다")
+    if not math.isfinite(rank):
+        raise ValueError("잘못된 커서입니다")
+    return float(rank), news_id
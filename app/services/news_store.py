@@ -0,0 +1,284 @@
+"""인메모리 뉴스 저장소"""
+
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+from typing import Iterable, Optional
+
+from app.models.news import NewsDetail, NewsItem, NewsSource
+from app.models.trusted import trusted
+from app.services.news_dedupe import NearDuplicateIndex, shingles
+from app.services.news_index import RankKey, SearchIndex
+
+ALL_CATEGORY = "전체"
+
+# 정렬 키: (발행 시각 epoch, 뉴스 ID)
+NewsKey = tuple[float, str]
+
+
+def published_timestamp(published_at: str) -> float:
+    """ISO 8601 발행 시각을 epoch 초로 변환"""
+    return datetime.fromisoformat(published_at.replace("Z", "+00:00")).timestamp()
+
+
+def to_news_item(detail: NewsDetail) -> NewsItem:
+    """상세 → 리스트 항목 변환 (검증된 NewsDetail 값을 그대로 사용)"""
+    values = detail.__dict__
+    return trusted(NewsItem, **{name: values[name] for name in NewsItem.model_fields})
+
+
+def _dedupe_text(detail: NewsDetail) -> str:
+    return f"{detail.title} {detail.summary or ''}"
+
+
+class _Timeline:
+    """키 오름차순으로 정렬된 항목 시퀀스"""
+
+    __slots__ = ("keys", "items")
+
+    def __init__(self) -> None:
+        self.keys: list[NewsKey] = []
+        self.items: list[NewsItem] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def insert(self, key: NewsKey, item: NewsItem) -> None:
+        # 대부분 최신 기사가 들어오므로 끝에 추가되는 경우가 많다
+        if not self.keys or self.keys[-1] < key:
+            self.keys.append(key)
+            self.items.append(item)
+            return
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.items.insert(index, item)
+
+    def replace(self, key: NewsKey, item: NewsItem) -> None:
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            self.items[index] = item
+
+    def remove(self, key: NewsKey) -> None:
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.items[index]
+
+    def drop_before(self, key: NewsKey) -> None:
+        index = bisect_left(self.keys, key)
+        del self.keys[:index]
+        del self.items[:index]
+
+    def before(self, key: NewsKey) -> int:
+        """key보다 작은 항목 개수 (= 해당 항목 앞 위치)"""
+        return bisect_left(self.keys, key)
+
+
+class NewsStore:
+    """뉴스 인덱스 저장소
+
+    - ID → 상세 해시맵 (상세 조회 O(1))
+    - 카테고리별 ("전체" 포함) 시간순 시퀀스 (리스트 조회 O(log n + limit))
+    - 속보 전용 링 버퍼 (속보 조회 O(limit))
+    - 제목/요약/태그 검색 역색인 (app/services/news_index.py)
+    - 유사 기사 LSH 색인 (app/services/news_dedupe.py): dedupe_threshold > 0이면 새 기사가 기존 기사와
+      자카드 유사도 threshold 이상일 때 별도 기사로 넣지 않고 기존 기사의 alternate_sources에 추가
+
+    보관 기간(retention)보다 오래된 기사는 삽입 시 함께 정리한다.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: float,
+        breaking_size: int,
+        search_half_life: float = 6 * 3600,
+        dedupe_threshold: float = 0.0,
+    ) -> None:
+        self.retention_seconds = retention_seconds
+        self.version = 0
+        self._details: dict[str, NewsDetail] = {}
+        self._items: dict[str, NewsItem] = {}
+        self._keys: dict[str, NewsKey] = {}
+        self._timelines: dict[str, _Timeline] = {ALL_CATEGORY: _Timeline()}
+        self._breaking: deque[str] = deque(maxlen=breaking_size)
+        self._index = SearchIndex(search_half_life)
+        self._dedupe = NearDuplicateIndex(dedupe_threshold) if dedupe_threshold > 0 else None
+        # 병합된 중복 기사 ID → 대표 기사 ID
+        self._aliases: dict[str, str] = {}
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._details)
+
+    def upsert(self, detail: NewsDetail) -> bool:
+        """기사 추가/갱신 (보관 기간 밖이거나 내용이 같으면 무시, 유사 기사는 대표 기사에 병합)"""
+        if detail.id in self._aliases:
+            return False
+        existing = self._details.get(detail.id)
+        if existing is not None and existing.alternate_sources and not detail.alternate_sources:
+            # 업스트림에서 다시 받은 대표 기사: 병합된 출처 유지
+            detail = detail.model_copy(update={"alternate_sources": existing.alternate_sources})
+        if existing == detail:
+            return False
+        key = (published_timestamp(detail.published_at), detail.id)
+        cutoff = time.time() - self.retention_seconds
+        if key[0] < cutoff:
+            return False
+
+        fingerprint = None
+        if self._dedupe is not None and (
+            existing is None or _dedupe_text(existing) != _dedupe_text(detail)
+        ):
+            hashes = shingles(_dedupe_text(detail))
+            fingerprint = (hashes, self._dedupe.signature(hashes))
+            if existing is None:
+                canonical_id = self._dedupe.find(*fingerprint)
+                # 대표 기사가 보관 기간 밖이라 병합하지 못하면 별도 기사로 저장
+                if canonical_id is not None and self._merge(canonical_id, detail):
+                    return True
+
+        item = to_news_item(detail)
+        old_key = self._keys.get(detail.id)
+        old_item = self._items.get(detail.id)
+        if old_key is not None and old_item is not None:
+            if old_key == key and old_item.category == item.category:
+                self._timelines[ALL_CATEGORY].replace(key, item)
+                self._timelines[item.category].replace(key, item)
+            else:
+                self._timelines[ALL_CATEGORY].remove(old_key)
+                self._timelines[old_item.category].remove(old_key)
+                self._insert(key, item)
+        else:
+            self._insert(key, item)
+
+        self._details[detail.id] = detail
+        self._items[detail.id] = item
+        self._keys[detail.id] = key
+        self._index.add(
+            detail.id, key[0], item.category, detail.title, (detail.summary or "", *detail.tags)
+        )
+        if fingerprint is not None:
+            self._dedupe.add(detail.id, *fingerprint)  # type: ignore[union-attr]
+        self._update_breaking(item, was_breaking=bool(old_item and old_item.is_breaking))
+        self.version += 1
+        self._evict_before(cutoff)
+        return True
+
+    def prune(self) -> None:
+        """보관 기간이 지난 기사 정리"""
+        self._evict_before(time.time() - self.retention_seconds)
+
+    def upsert_many(self, details: Iterable[NewsDetail]) -> int:
+        """여러 기사 추가/갱신 (반영된 개수 반환)"""
+        return sum(1 for detail in details if self.upsert(detail))
+
+    def get(self, news_id: str) -> Optional[NewsDetail]:
+        """상세 조회 (병합된 중복 기사 ID면 대표 기사)"""
+        return self._details.get(self._aliases.get(news_id, news_id))
+
+    def page(
+        self,
+        category: str,
+        limit: int,
+        before: Optional[NewsKey] = None,
+        offset: int = 0,
+    ) -> tuple[list[NewsItem], int, bool]:
+        """최신순 페이지 조회 → (항목, 전체 개수, 다음 페이지 여부)
+
+        before가 있으면 해당 키보다 오래된 항목부터, 없으면 offset부터 조회한다.
+        """
+        timeline = self._timelines.get(category)
+        if timeline is None:
+            return [], 0, False
+
+        end = timeline.before(before) if before is not None else len(timeline) - offset
+        if end <= 0:
+            return [], len(timeline), False
+        start = max(end - limit, 0)
+        return timeline.items[start:end][::-1], len(timeline), start > 0
+
+    def key_of(self, news_id: str) -> Optional[NewsKey]:
+        """기사의 정렬 키"""
+        return self._keys.get(news_id)
+
+    def search(
+        self,
+        query: str,
+        category: str,
+        limit: int,
+        after: Optional[RankKey] = None,
+    ) -> tuple[list[NewsItem], int, Optional[RankKey]]:
+        """검색 (관련도 + 최신순) → (항목, 전체 개수, 다음 페이지 시작 키)"""
+        keys, total, has_more = self._index.search(
+            query, None if category == ALL_CATEGORY else category, limit, after
+        )
+        items = [self._items[news_id] for _, news_id in keys]
+        return items, total, keys[-1] if has_more and keys else None
+
+    def breaking(self, limit: int) -> list[NewsItem]:
+        """최신 속보 조회"""
+        result = []
+        for news_id in self._breaking:
+            item = self._items.get(news_id)
+            if item is not None and item.is_breaking:
+                result.append(item)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def _merge(self, canonical_id: str, duplicate: NewsDetail) -> bool:
+        """중복 기사를 대표 기사의 다른 출처로 추가 (속보 여부는 둘 중 하나라도 속보면 유지)"""
+        canonical = self._details[canonical_id]
+        alternate = trusted(
+            NewsSource,
+            id=duplicate.id,
+            source=duplicate.source,
+            published_at=duplicate.published_at,
+            url=duplicate.url,
+        )
+        merged = canonical.model_copy(
+            update={
+                "alternate_sources": [*canonical.alternate_sources, alternate],
+                "is_breaking": canonical.is_breaking or duplicate.is_breaking,
+            }
+        )
+        if not self.upsert(merged):
+            return False
+        self._aliases[duplicate.id] = canonical_id
+        self.duplicates += 1
+        return True
+
+    def _insert(self, key: NewsKey, item: NewsItem) -> None:
+        self._timelines[ALL_CATEGORY].insert(key, item)
+        timeline = self._timelines.get(item.category)
+        if timeline is None:
+            timeline = self._timelines[item.category] = _Timeline()
+        timeline.insert(key, item)
+
+    def _update_breaking(self, item: NewsItem, was_breaking: bool) -> None:
+        if item.is_breaking and not was_breaking:
+            self._breaking.appendleft(item.id)
+        elif was_breaking and not item.is_breaking:
+            try:
+                self._breaking.remove(item.id)
+            except ValueError:
+                pass
+
+    def _evict_before(self, cutoff: float) -> None:
+        timeline = self._timelines[ALL_CATEGORY]
+        if not timeline.keys or timeline.keys[0][0] >= cutoff:
+            return
+
+        bound = (cutoff, "")
+        for item in timeline.items[: timeline.before(bound)]:
+            detail = self._details.pop(item.id, None)
+            self._items.pop(item.id, None)
+            self._keys.pop(item.id, None)
+            self._index.remove(item.id)
+            if self._dedupe is not None:
+                self._dedupe.remove(item.id)
+            for alternate in detail.alternate_sources if detail is not None else ():
+                self._aliases.pop(alternate.id, None)
+        for category_timeline in self._timelines.values():
+            category_timeline.drop_before(bound)
@@ -0,0 +1,177 @@
+"""컬럼형 시세 저장소"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from app.models.stocks import MarketType, StockItem
+from app.models.trusted import trusted
+
+MARKET_CODES: dict[MarketType, int] = {"KR": 0, "US": 1}
+MARKET_NAMES: tuple[MarketType, ...] = ("KR", "US")
+
+_NO_VOLUME = -1
+
+# 컬럼 이름 → dtype (스냅샷 직렬화 순서)
+COLUMNS: dict[str, str] = {
+    "price": "<f8",
+    "change": "<f8",
+    "change_percent": "<f8",
+    "volume": "<i8",
+    "market": "i1",
+}
+
+
+@dataclass(frozen=True)
+class Quote:
+    """시세 업데이트 단위"""
+
+    symbol: str
+    name: str
+    market: MarketType
+    price: float
+    change: float
+    change_percent: float
+    volume: Optional[int] = None
+
+
+class QuoteStore:
+    """종목 시세를 컬럼(NumPy 배열)으로 보관
+
+    price / change / change_percent / volume / market 컬럼과 종목 코드 → 행 인덱스를 유지한다.
+    순위 계산은 배열 연산으로 처리하고 StockItem은 반환되는 행에 대해서만 만든다.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._index: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._names: list[str] = []
+        self._price = np.zeros(capacity, dtype=np.float64)
+        self._change = np.zeros(capacity, dtype=np.float64)
+        self._change_percent = np.zeros(capacity, dtype=np.float64)
+        self._volume = np.full(capacity, _NO_VOLUME, dtype=np.int64)
+        self._market = np.zeros(capacity, dtype=np.int8)
+
+    @classmethod
+    def from_columns(
+        cls,
+        symbols: Sequence[str],
+        names: Sequence[str],
+        columns: dict[str, np.ndarray],
+    ) -> "QuoteStore":
+        """기존 컬럼 배열을 그대로 사용하는 저장소 (공유 메모리 뷰를 복사 없이 감쌈)"""
+        store = cls(capacity=0)
+        store._size = len(symbols)
+        store._symbols = list(symbols)
+        store._names = list(names)
+        store._index = {symbol: row for row, symbol in enumerate(symbols)}
+        for name, column in columns.items():
+            setattr(store, f"_{name}", column)
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def symbols(self) -> list[str]:
+        return self._symbols
+
+    @property
+    def names(self) -> list[str]:
+        return self._names
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """유효 행 범위의 컬럼 배열 (복사 없음)"""
+        return {name: getattr(self, f"_{name}")[: self._size] for name in COLUMNS}
+
+    def row_of(self, symbol: str) -> Optional[int]:
+        """종목 코드의 행 인덱스"""
+        return self._index.get(symbol)
+
+    def upsert(self, quote: Quote) -> int:
+        """시세 추가/갱신 (행 인덱스 반환)"""
+        row = self._index.get(quote.symbol)
+        if row is None:
+            row = self._size
+            if row == len(self._price):
+                self._grow()
+            self._index[quote.symbol] = row
+            self._symbols.append(quote.symbol)
+            self._names.append(quote.name)
+            self._size += 1
+        else:
+            self._names[row] = quote.name
+
+        self._price[row] = quote.price
+        self._change[row] = quote.change
+        self._change_percent[row] = quote.change_percent
+        self._volume[row] = _NO_VOLUME if quote.volume is None else quote.volume
+        self._market[row] = MARKET_CODES[quote.market]
+        return row
+
+    def matches(self, quote: Quote) -> bool:
+        """저장된 행이 quote와 같은지 (없는 종목이면 False)"""
+        row = self._index.get(quote.symbol)
+        if row is None:
+            return False
+        volume = _NO_VOLUME if quote.volume is None else quote.volume
+        return (
+            self._names[row] == quote.name
+            and self._price[row] == quote.price
+            and self._change[row] == quote.change
+            and self._change_percent[row] == quote.change_percent
+            and self._volume[row] == volume
+            and self._market[row] == MARKET_CODES[quote.market]
+        )
+
+    def upsert_many(self, quotes: Iterable[Quote]) -> list[int]:
+        """여러 시세 추가/갱신"""
+        return [self.upsert(quote) for quote in quotes]
+
+    def market_mask(self, market: MarketType) -> np.ndarray:
+        """시장별 행 마스크"""
+        return self._market[: self._size] == MARKET_CODES[market]
+
+    def top_rows(self, column: str, limit: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """column 내림차순 상위 limit개 행 (argpartition 부분 정렬)"""
+        values = getattr(self, f"_{column}")[: self._size]
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(self._size)
+        if limit <= 0 or rows.size == 0:
+            return rows[:0]
+
+        candidates = values[rows]
+        if limit < rows.size:
+            top = np.argpartition(-candidates, limit - 1)[:limit]
+        else:
+            top = np.arange(rows.size)
+        order = np.argsort(-candidates[top], kind="stable")
+        return rows[top[order]]
+
+    def top_gainers(self, limit: int, market: MarketType) -> np.ndarray:
+        """시장별 상승률 상위 행 (상승 종목만)"""
+        mask = self.market_mask(market) & (self._change_percent[: self._size] > 0)
+        return self.top_rows("change_percent", limit, mask)
+
+    def stock_item(self, row: int) -> StockItem:
+        """행 → StockItem (저장소 값은 반영 시점에 검증되므로 검증 생략)"""
+        volume = int(self._volume[row])
+        return trusted(
+            StockItem,
+            symbol=self._symbols[row],
+            name=self._names[row],
+            price=float(self._price[row]),
+            change=float(self._change[row]),
+            change_percent=float(self._change_percent[row]),
+            volume=None if volume == _NO_VOLUME else volume,
+            market=MARKET_NAMES[self._market[row]],
+        )
+
+    def _grow(self) -> None:
+        capacity = max(len(self._price) * 2, 16)
+        for name in ("_price", "_change", "_change_percent", "_volume", "_market"):
+            old = getattr(self, name)
+            new = np.full(capacity, _NO_VOLUME if name == "_volume" else 0, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
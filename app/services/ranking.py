@@ -0,0 +1,155 @@
+"""점진 갱신 순위 구조"""
+
+import random
+from typing import Any, Hashable, Optional
+
+_MAX_LEVELS = 16  # 약 6만 5천 종목까지 기대 O(log n)
+
+
+class _Infinity:
+    """모든 키보다 큰 값 (꼬리 센티넬 키)"""
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __le__(self, other: Any) -> bool:
+        return False
+
+    def __gt__(self, other: Any) -> bool:
+        return True
+
+    def __ge__(self, other: Any) -> bool:
+        return True
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Any, levels: int) -> None:
+        self.key = key
+        self.next: list[Optional["_Node"]] = [None] * levels
+        self.width: list[int] = [1] * levels
+
+
+_NIL = _Node(_Infinity(), 0)
+
+
+class RankedSet:
+    """점수 내림차순 순위 (indexable skip list)
+
+    - update/remove: 기대 O(log n), 변경 전후 순위를 함께 계산
+    - top(limit): 앞에서부터 O(limit)
+    - version: 상위 window 안의 순위/항목이 바뀔 때만 증가
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.version = 0
+        self._scores: dict[Hashable, float] = {}
+        self._head = _Node(None, _MAX_LEVELS)
+        self._head.next = [_NIL] * _MAX_LEVELS
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, member: Hashable) -> bool:
+        return member in self._scores
+
+    def update(self, member: Hashable, score: float, touched: bool = True) -> bool:
+        """점수 반영 (상위 window에 영향이 있으면 version 증가 후 True)
+
+        touched가 True면 점수가 같아도 항목 내용이 바뀐 것으로 보고
+        상위 window 안의 항목이면 version을 올린다.
+        """
+        old_score = self._scores.get(member)
+        if old_score is not None and old_score == score:
+            changed = touched and self.rank(member) < self.window
+        else:
+            old_rank = self._remove((-old_score, member)) if old_score is not None else None
+            new_rank = self._insert((-score, member))
+            self._scores[member] = score
+            changed = new_rank < self.window or (
+                old_rank is not None and old_rank < self.window
+            )
+        if changed:
+            self.version += 1
+        return changed
+
+    def remove(self, member: Hashable) -> bool:
+        """항목 제거"""
+        score = self._scores.pop(member, None)
+        if score is None:
+            return False
+        if self._remove((-score, member)) < self.window:
+            self.version += 1
+        return True
+
+    def rank(self, member: Hashable) -> int:
+        """0부터 시작하는 순위 (없으면 -1)"""
+        score = self._scores.get(member)
+        if score is None:
+            return -1
+        key = (-score, member)
+        node, rank = self._head, 0
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].key < key:
+                rank += node.width[level]
+                node = node.next[level]
+        return rank
+
+    def top(self, limit: int) -> list[Hashable]:
+        """상위 limit개 항목"""
+        result = []
+        node = self._head.next[0]
+        while node is not _NIL and len(result) < limit:
+            result.append(node.key[1])
+            node = node.next[0]
+        return result
+
+    def _insert(self, key: tuple) -> int:
+        chain: list[_Node] = [self._head] * _MAX_LEVELS
+        steps_at_level = [0] * _MAX_LEVELS
+        node = self._head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].key <= key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        levels = 1
+        while levels < _MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+        new_node = _Node(key, levels)
+        steps = 0
+        for level in range(levels):
+            prev = chain[level]
+            new_node.next[level] = prev.next[level]
+            prev.next[level] = new_node
+            new_node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].width[level] += 1
+        return sum(steps_at_level)
+
+    def _remove(self, key: tuple) -> int:
+        chain: list[_Node] = [self._head] * _MAX_LEVELS
+        rank = 0
+        node = self._head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].key < key:
+                rank += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is _NIL or target.key != key:
+            raise KeyError(key)
+        levels = len(target.next)
+        for level in range(levels):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].width[level] -= 1
+        return rank
@@ -0,0 +1,277 @@
+"""워커 간 마켓/시세 스냅샷
+
+멀티 워커 모드에서 writer 워커 1개만 업스트림을 수집해 공유 메모리에 스냅샷을 기록하고,
+나머지 워커는 같은 영역을 복사 없이 읽는다.
+
+스냅샷 레이아웃: generation(u64, monotonic ns) | index 길이(u32) | index JSON | 8바이트 정렬 blob
+- market: "summary:KR" 등 → 응답 모델 JSON
+- quotes: 종목 코드/이름 + 컬럼 배열 (NumPy 뷰로 직접 사용)
+- popular: 시장별 거래량 순위 행 번호 배열
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+from typing import Callable, Literal, Optional, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.shm import SharedRegion, WriterLock
+from app.models.stocks import MarketType, PopularStocksResponse
+from app.services.quote_store import COLUMNS, QuoteStore
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+Role = Literal["single", "writer", "reader"]
+
+_PREAMBLE = struct.Struct("<QI")
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def build_snapshot(
+    generation: int,
+    market: dict[str, bytes],
+    quotes: QuoteStore,
+    popular: dict[str, list[int]],
+) -> bytes:
+    """스냅샷 바이트 생성 (writer 전용)"""
+    blobs: list[bytes] = []
+    offset = 0
+
+    def add(blob: bytes) -> int:
+        nonlocal offset
+        start = offset
+        padded = _align(len(blob))
+        blobs.append(blob + b"\0" * (padded - len(blob)))
+        offset += padded
+        return start
+
+    index = {
+        "market": {key: [add(body), len(body)] for key, body in market.items()},
+        "quotes": {
+            "symbols": quotes.symbols,
+            "names": quotes.names,
+            "columns": {
+                name: add(column.astype(COLUMNS[name], copy=False).tobytes())
+                for name, column in quotes.columns().items()
+            },
+        },
+        "popular": {
+            market_name: [add(np.asarray(rows, dtype="<i8").tobytes()), len(rows)]
+            for market_name, rows in popular.items()
+        },
+    }
+    header = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode()
+    head = _PREAMBLE.pack(generation, len(header)) + header
+    head += b"\0" * (_align(len(head)) - len(head))
+    return head + b"".join(blobs)
+
+
+class SnapshotView:
+    """스냅샷 1개 세대의 읽기 전용 뷰 (세대가 바뀔 때만 index를 다시 읽음)"""
+
+    def __init__(self, data: memoryview) -> None:
+        self.generation, index_length = _PREAMBLE.unpack_from(data, 0)
+        start = _PREAMBLE.size
+        index = json.loads(bytes(data[start : start + index_length]))
+        base = _align(start + index_length)
+        self._data = data
+        self._base = base
+        self._market: dict[str, list[int]] = index["market"]
+        self._models: dict[str, BaseModel] = {}
+        self._popular_cache: dict[tuple[str, int], PopularStocksResponse] = {}
+
+        quotes = index["quotes"]
+        size = len(quotes["symbols"])
+        columns = {}
+        for name, column_offset in quotes["columns"].items():
+            column = np.frombuffer(
+                data, dtype=COLUMNS[name], count=size, offset=base + column_offset
+            )
+            column.flags.writeable = False
+            columns[name] = column
+        self.quotes = QuoteStore.from_columns(quotes["symbols"], quotes["names"], columns)
+        self._popular = {
+            market: np.frombuffer(data, dtype="<i8", count=count, offset=base + rows_offset)
+            for market, (rows_offset, count) in index["popular"].items()
+        }
+
+    def market_model(self, key: str, model: type[M]) -> Optional[M]:
+        """마켓 응답 모델 (세대 내에서는 같은 객체 반환)"""
+        cached = self._models.get(key)
+        if cached is None:
+            location = self._market.get(key)
+            if location is None:
+                return None
+            offset, length = location
+            start = self._base + offset
+            cached = self._models[key] = model.model_validate_json(
+                bytes(self._data[start : start + length])
+            )
+        return cached  # type: ignore[return-value]
+
+    def popular(self, market: MarketType, limit: int) -> PopularStocksResponse:
+        """시장별 거래량 상위 (세대 내에서는 같은 객체 반환)"""
+        cached = self._popular_cache.get((market, limit))
+        if cached is None:
+            rows = self._popular.get(market)
+            stocks = [] if rows is None else [
+                self.quotes.stock_item(int(row)) for row in rows[:limit]
+            ]
+            cached = self._popular_cache[(market, limit)] = PopularStocksResponse(
+                market=market, stocks=stocks
+            )
+        return cached
+
+
+def _boot_id() -> int:
+    """워커를 띄운 마스터 프로세스 식별값 (PID + 시작 시각, 재배포/재시작마다 바뀜)
+
+    /proc이 없으면 PID만 사용한다.
+    """
+    ppid = os.getppid()
+    try:
+        with open(f"/proc/{ppid}/stat", "rb") as f:
+            # comm 필드 뒤의 22번째 필드(starttime)
+            started = int(f.read().rsplit(b")", 1)[1].split()[19])
+    except (OSError, ValueError, IndexError):
+        started = 0
+    return ((started << 32) | ppid) & 0xFFFF_FFFF_FFFF_FFFF
+
+
+def _default_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "yangbong-snapshot")
+
+
+class MarketSnapshot:
+    """스냅샷 역할 관리 (lifespan에서 open/close)
+
+    - single: 워커 1개, 공유 메모리 없이 인프로세스 저장소 사용
+    - writer: 파일 락을 얻은 워커, 수집 후 스냅샷 기록
+    - reader: 나머지 워커, 스냅샷만 읽고 writer가 종료되면 락을 이어받음
+    """
+
+    role: Role = "single"
+    _region: Optional[SharedRegion] = None
+    _lock: Optional[WriterLock] = None
+    _view: Optional[SnapshotView] = None
+    _watcher: Optional[asyncio.Task] = None
+    _follower: Optional[asyncio.Task] = None
+
+    @classmethod
+    def open(cls, workers: int) -> Role:
+        """워커 수에 따라 공유 영역을 열고 역할 결정"""
+        if workers <= 1 or cls._region is not None:
+            return cls.role
+        path = settings.snapshot_path or _default_path()
+        cls._region = SharedRegion(
+            path, settings.snapshot_size_mb * 1024 * 1024, boot=_boot_id()
+        )
+        cls._lock = WriterLock(path + ".lock")
+        cls.role = "writer" if cls._lock.try_acquire() else "reader"
+        logger.info("market snapshot %s (pid=%d)", cls.role, os.getpid())
+        return cls.role
+
+    @classmethod
+    def start(
+        cls,
+        on_elected: Callable[[], None],
+        on_change: Optional[Callable[[SnapshotView], None]] = None,
+    ) -> None:
+        """reader면 writer 락을 주기적으로 시도 (획득 시 on_elected 호출)
+
+        on_change가 있으면 새 세대 스냅샷이 보일 때마다 해당 뷰로 호출한다 (SSE 발행 등).
+        """
+        if cls.role != "reader" or cls._watcher is not None:
+            return
+        loop = asyncio.get_running_loop()
+        cls._watcher = loop.create_task(cls._watch(on_elected), name="snapshot:watch")
+        if on_change is not None:
+            cls._follower = loop.create_task(cls._follow(on_change), name="snapshot:follow")
+
+    @classmethod
+    async def close(cls) -> None:
+        """공유 영역 해제"""
+        tasks = [task for task in (cls._watcher, cls._follower) if task is not None]
+        cls._watcher = cls._follower = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        region, cls._region = cls._region, None
+        lock, cls._lock = cls._lock, None
+        cls._view = None
+        cls.role = "single"
+        if lock is not None:
+            lock.release()
+        if region is not None:
+            region.close()
+
+    @classmethod
+    def is_reader(cls) -> bool:
+        return cls.role == "reader"
+
+    @classmethod
+    def is_writer(cls) -> bool:
+        return cls.role == "writer"
+
+    @classmethod
+    def publish(cls, data_factory: Callable[[int], bytes]) -> None:
+        """writer: 다음 세대 스냅샷 기록
+
+        세대 번호는 시스템 공통 monotonic 시각이라 writer가 바뀌어도 증가한다.
+        """
+        if cls.role != "writer" or cls._region is None:
+            return
+        cls._region.write(data_factory(time.monotonic_ns()))
+
+    @classmethod
+    def read(cls, func: Callable[[SnapshotView], T]) -> Optional[T]:
+        """reader: 현재 세대 뷰로 func 실행 (스냅샷이 없으면 None)"""
+        region = cls._region
+        if region is None:
+            return None
+        return region.read(lambda seq, data: func(cls._view_for(data)))
+
+    @classmethod
+    def _view_for(cls, data: memoryview) -> SnapshotView:
+        generation = _PREAMBLE.unpack_from(data, 0)[0]
+        view = cls._view
+        if view is None or view.generation != generation:
+            view = cls._view = SnapshotView(data)
+        return view
+
+    @classmethod
+    async def _watch(cls, on_elected: Callable[[], None]) -> None:
+        while cls.role == "reader" and cls._lock is not None:
+            await asyncio.sleep(settings.snapshot_takeover_interval)
+            if cls._lock.try_acquire():
+                cls.role = "writer"
+                cls._view = None
+                logger.info("market snapshot writer taken over (pid=%d)", os.getpid())
+                on_elected()
+
+    @classmethod
+    async def _follow(cls, on_change: Callable[[SnapshotView], None]) -> None:
+        seen = None
+        while cls.role == "reader":
+            generation = cls.read(lambda view: view.generation)
+            if generation is not None and generation != seen:
+                seen = generation
+                try:
+                    cls.read(on_change)
+                except Exception:
+                    logger.exception("snapshot change handler failed")
+            await asyncio.sleep(settings.snapshot_poll_interval)
@@ -1,159 +1,123 @@
 """주식 서비스"""
 
+from typing import Iterable, get_args
+import numpy as np
+from app.core.metrics import instrument
 from app.models.stocks import (
     PopularStocksResponse,
     SurgingStocksResponse,
-    StockItem,
     MarketType,
 )
+from app.providers import Providers
+from app.services.quote_store import Quote, QuoteStore
+from app.services.ranking import RankedSet
+from app.services.snapshot import MarketSnapshot
 
 
 class StocksService:
     """주식 관련 비즈니스 로직"""
 
     @staticmethod
+    @instrument("stocks", "popular", "cache")
     async def get_popular_stocks(market: MarketType, limit: int = 6) -> PopularStocksResponse:
-        """인기 주식 조회 (Mock 데이터)"""
-        # TODO: 실제 외부 API 연동으로 교체
-        mock_stocks = []
-        
-        if market == "KR":
-            mock_stocks = [
-                StockItem(
-                    symbol="005930",
-                    name="삼성전자",
-                    price=65000.0,
-                    change=1000.0,
-                    change_percent=1.56,
-                    volume=10000000,
-                    market="KR",
-                ),
-                StockItem(
-                    symbol="000660",
-                    name="SK하이닉스",
-                    price=120000.0,
-                    change=-2000.0,
-                    change_percent=-1.64,
-                    volume=5000000,
-                    market="KR",
-                ),
-                StockItem(
-                    symbol="035420",
-                    name="NAVER",
-                    price=200000.0,
-                    change=3000.0,
-                    change_percent=1.52,
-                    volume=2000000,
-                    market="KR",
-                ),
-            ]
-        else:  # US
-            mock_stocks = [
-                StockItem(
-                    symbol="AAPL",
-                    name="Apple Inc.",
-                    price=175.5,
-                    change=2.3,
-                    change_percent=1.33,
-                    volume=50000000,
-                    market="US",
-                ),
-                StockItem(
-                    symbol="MSFT",
-                    name="Microsoft Corporation",
-                    price=380.2,
-                    change=-1.5,
-                    change_percent=-0.39,
-                    volume=20000000,
-                    market="US",
-                ),
-                StockItem(
-                    symbol="GOOGL",
-                    name="Alphabet Inc.",
-                    price=140.8,
-                    change=1.2,
-                    change_percent=0.86,
-                    volume=15000000,
-                    market="US",
-                ),
-            ]
-
-        # limit 적용
-        mock_stocks = mock_stocks[:limit]
-
-        return PopularStocksResponse(market=market, stocks=mock_stocks)
+        """인기 주식 조회 (거래량 상위)
+
+        순위가 바뀌지 않았으면 같은 응답 객체를 재사용한다 (직렬화 결과도 재사용됨).
+        """
+        if MarketSnapshot.is_reader():
+            shared = MarketSnapshot.read(lambda view: view.popular(market, limit))
+            if shared is not None:
+                return shared
+
+        ranking = _popular_rankings[market]
+        cached = _popular_snapshots.get((market, limit))
+        if cached is not None and cached[0] == ranking.version:
+            return cached[1]
+
+        stocks = [
+            quote_store.stock_item(quote_store.row_of(symbol))
+            for symbol in ranking.top(limit)
+        ]
+        response = PopularStocksResponse(market=market, stocks=stocks)
+        _popular_snapshots[(market, limit)] = (ranking.version, response)
+        return response
 
     @staticmethod
+    @instrument("stocks", "surging", "cache")
     async def get_surging_stocks(limit: int = 6, mix: bool = True) -> SurgingStocksResponse:
-        """급등 주식 조회 (Mock 데이터)"""
-        # TODO: 실제 외부 API 연동으로 교체
-        mock_stocks = []
-        
-        if mix:
-            # KR과 US 믹스
-            mock_stocks = [
-                StockItem(
-                    symbol="035720",
-                    name="카카오",
-                    price=55000.0,
-                    change=3500.0,
-                    change_percent=6.80,
-                    volume=8000000,
-                    market="KR",
-                ),
-                StockItem(
-                    symbol="TSLA",
-                    name="Tesla, Inc.",
-                    price=250.5,
-                    change=12.3,
-                    change_percent=5.16,
-                    volume=100000000,
-                    market="US",
-                ),
-                StockItem(
-                    symbol="207940",
-                    name="삼성바이오로직스",
-                    price=750000.0,
-                    change=20000.0,
-                    change_percent=2.74,
-                    volume=100000,
-                    market="KR",
-                ),
-                StockItem(
-                    symbol="NVDA",
-                    name="NVIDIA Corporation",
-                    price=500.2,
-                    change=18.5,
-                    change_percent=3.84,
-                    volume=50000000,
-                    market="US",
-                ),
-            ]
-        else:
-            # KR만
-            mock_stocks = [
-                StockItem(
-                    symbol="035720",
-                    name="카카오",
-                    price=55000.0,
-                    change=3500.0,
-                    change_percent=6.80,
-                    volume=8000000,
-                    market="KR",
-                ),
-                StockItem(
-                    symbol="207940",
-                    name="삼성바이오로직스",
-                    price=750000.0,
-                    change=20000.0,
-                    change_percent=2.74,
-                    volume=100000,
-                    market="KR",
-                ),
-            ]
-
-        # limit 적용
-        mock_stocks = mock_stocks[:limit]
-
-        return SurgingStocksResponse(stocks=mock_stocks, mix=mix)
+        """급등 주식 조회 (상승률 상위, mix면 KR/US 교차)"""
+        if MarketSnapshot.is_reader():
+            shared = MarketSnapshot.read(lambda view: _surging(view.quotes, limit, mix))
+            if shared is not None:
+                return shared
+        return _surging(quote_store, limit, mix)
+
+    @staticmethod
+    async def refresh(market: MarketType) -> None:
+        """업스트림에서 시장 시세를 받아 반영 (수집 작업용)"""
+        StocksService.update_quotes(await StocksService._fetch_quotes(market))
+
+    @staticmethod
+    @instrument("stocks", "quotes", "upstream")
+    async def _fetch_quotes(market: MarketType) -> list[Quote]:
+        """시장 시세 조회 (업스트림)"""
+        return await Providers.quotes.fetch_quotes(market)
+
+    @staticmethod
+    def snapshot_popular_rows() -> dict[str, list[int]]:
+        """스냅샷에 실을 시장별 거래량 순위 (행 번호)"""
+        return {
+            market: [quote_store.row_of(symbol) for symbol in ranking.top(POPULAR_WINDOW)]
+            for market, ranking in _popular_rankings.items()
+        }
+
+    @staticmethod
+    def update_quotes(quotes: Iterable[Quote]) -> None:
+        """수집된 시세 반영 (시세 저장소 + 시장별 거래량 순위)"""
+        for quote in quotes:
+            # 같은 시세가 다시 들어오면 순위 version을 올리지 않음 (인기 종목 응답 재사용)
+            touched = not quote_store.matches(quote)
+            if touched:
+                quote_store.upsert(quote)
+            for market, ranking in _popular_rankings.items():
+                if market == quote.market:
+                    ranking.update(quote.symbol, quote.volume or 0, touched=touched)
+                elif quote.symbol in ranking:
+                    ranking.remove(quote.symbol)
+
+
+def _surging(store: QuoteStore, limit: int, mix: bool) -> SurgingStocksResponse:
+    if mix:
+        rows = _interleave(
+            store.top_gainers(limit, "KR"),
+            store.top_gainers(limit, "US"),
+            limit,
+        )
+    else:
+        # KR만
+        rows = store.top_gainers(limit, "KR").tolist()
+
+    stocks = [store.stock_item(row) for row in rows]
+    return SurgingStocksResponse(stocks=stocks, mix=mix)
+
+
+def _interleave(first: np.ndarray, second: np.ndarray, limit: int) -> list[int]:
+    """두 순위를 번갈아 합침 (한쪽이 부족하면 나머지로 채움)"""
+    merged: list[int] = []
+    a, b = first.tolist(), second.tolist()
+    for i in range(max(len(a), len(b))):
+        if i < len(a):
+            merged.append(a[i])
+        if i < len(b):
+            merged.append(b[i])
+    return merged[:limit]
+
+
+quote_store = QuoteStore()
 
+# 시장별 거래량 순위와 (market, limit)별 버전 스냅샷
+POPULAR_WINDOW = 100  # /stocks/popular limit 최대값
+_popular_rankings: dict[MarketType, RankedSet] = {
+    market: RankedSet(window=POPULAR_WINDOW) for market in get_args(MarketType)
+}
+_popular_snapshots: dict[tuple[MarketType, int], tuple[int, PopularStocksResponse]] = {}
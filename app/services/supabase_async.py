@@ -0,0 +1,396 @@
+"""비동기 Supabase(PostgREST) 접근 계층"""
+
+import asyncio
+import operator
+from typing import Any, Callable, Optional, Protocol, Union
+
+import httpx
+
+from app.core.config import settings
+
+Row = dict[str, Any]
+TimeoutArg = Union[float, httpx.Timeout, None]
+
+
+class SupabaseError(Exception):
+    """PostgREST 요청 실패"""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class AsyncSupabase(Protocol):
+    """비동기 Supabase 테이블 접근 인터페이스
+
+    filters는 PostgREST 문법을 따른다. 예: {"id": "eq.news-0001", "published_at": "lt.2024-01-01"}
+    """
+
+    async def open(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def select(
+        self,
+        table: str,
+        columns: str = "*",
+        filters: Optional[dict[str, str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]: ...
+
+    async def insert(
+        self,
+        table: str,
+        rows: list[Row],
+        upsert: bool = False,
+        on_conflict: Optional[str] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]: ...
+
+    async def update(
+        self,
+        table: str,
+        values: Row,
+        filters: dict[str, str],
+        timeout: TimeoutArg = None,
+    ) -> list[Row]: ...
+
+    async def delete(
+        self,
+        table: str,
+        filters: dict[str, str],
+        timeout: TimeoutArg = None,
+    ) -> list[Row]: ...
+
+
+class SupabaseREST:
+    """httpx 연결 풀 기반 PostgREST 클라이언트
+
+    - 공유 AsyncClient (keep-alive, 최대 연결 수 제한)
+    - 호출별 타임아웃
+    - 세마포어로 동시 요청 수 제한 (초과 요청은 대기)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        max_connections: int,
+        max_keepalive: int,
+        timeout: float,
+        max_concurrency: int,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.base_url = url.rstrip("/") + "/rest/v1"
+        self._api_key = api_key
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+        )
+        self._timeout = httpx.Timeout(timeout)
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def open(self) -> None:
+        """연결 풀 생성"""
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "apikey": self._api_key,
+                "Authorization": f"Bearer {self._api_key}",
+            },
+            limits=self._limits,
+            timeout=self._timeout,
+            transport=self._transport,
+        )
+
+    async def close(self) -> None:
+        """연결 풀 종료"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def select(
+        self,
+        table: str,
+        columns: str = "*",
+        filters: Optional[dict[str, str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        """행 조회"""
+        params: dict[str, Any] = {"select": columns, **(filters or {})}
+        if order is not None:
+            params["order"] = order
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        return await self._request("GET", table, params=params, timeout=timeout)
+
+    async def insert(
+        self,
+        table: str,
+        rows: list[Row],
+        upsert: bool = False,
+        on_conflict: Optional[str] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        """행 추가 (upsert=True면 충돌 시 병합)"""
+        prefer = "return=representation"
+        if upsert:
+            prefer += ",resolution=merge-duplicates"
+        params = {"on_conflict": on_conflict} if on_conflict else None
+        return await self._request(
+            "POST", table, params=params, json=rows, prefer=prefer, timeout=timeout
+        )
+
+    async def update(
+        self,
+        table: str,
+        values: Row,
+        filters: dict[str, str],
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        """조건에 맞는 행 수정"""
+        return await self._request(
+            "PATCH",
+            table,
+            params=filters,
+            json=values,
+            prefer="return=representation",
+            timeout=timeout,
+        )
+
+    async def delete(
+        self,
+        table: str,
+        filters: dict[str, str],
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        """조건에 맞는 행 삭제"""
+        return await self._request(
+            "DELETE", table, params=filters, prefer="return=representation", timeout=timeout
+        )
+
+    async def _request(
+        self,
+        method: str,
+        table: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Any = None,
+        prefer: Optional[str] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        if self._client is None:
+            raise RuntimeError("SupabaseREST가 열려 있지 않습니다 (open() 필요)")
+
+        headers = {"Prefer": prefer} if prefer else None
+        async with self._semaphore:
+            response = await self._client.request(
+                method,
+                f"/{table}",
+                params=params,
+                json=json,
+                headers=headers,
+                timeout=timeout if timeout is not None else self._timeout,
+            )
+        if response.status_code >= 400:
+            raise SupabaseError(response.status_code, response.text)
+        if not response.content:
+            return []
+        return response.json()
+
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+class InMemorySupabase:
+    """테스트/로컬 개발용 인메모리 대체 구현
+
+    eq/neq/gt/gte/lt/lte/in/is 필터와 "컬럼.asc|desc" 정렬만 지원한다 (그 외 연산자는 SupabaseError).
+    필터 값은 행 값의 타입(숫자/불리언/문자열)으로 변환해 비교하고, null은 is.null로만 일치한다.
+    """
+
+    def __init__(self, tables: Optional[dict[str, list[Row]]] = None) -> None:
+        self.tables: dict[str, list[Row]] = {
+            name: [dict(row) for row in rows] for name, rows in (tables or {}).items()
+        }
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def select(
+        self,
+        table: str,
+        columns: str = "*",
+        filters: Optional[dict[str, str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        rows = [row for row in self.tables.get(table, []) if _matches(row, filters)]
+        if order is not None:
+            for part in reversed(order.split(",")):
+                column, _, direction = part.partition(".")
+                rows.sort(key=lambda row: _sort_key(row.get(column)), reverse=direction == "desc")
+        start = offset or 0
+        rows = rows[start : start + limit] if limit is not None else rows[start:]
+        if columns != "*":
+            names = [name.strip() for name in columns.split(",")]
+            rows = [{name: row.get(name) for name in names} for row in rows]
+        return [dict(row) for row in rows]
+
+    async def insert(
+        self,
+        table: str,
+        rows: list[Row],
+        upsert: bool = False,
+        on_conflict: Optional[str] = None,
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        stored = self.tables.setdefault(table, [])
+        key = on_conflict or "id"
+        for row in rows:
+            existing = next((r for r in stored if key in row and r.get(key) == row[key]), None)
+            if existing is not None:
+                if not upsert:
+                    raise SupabaseError(409, f"duplicate key value: {row[key]}")
+                existing.update(row)
+            else:
+                stored.append(dict(row))
+        return [dict(row) for row in rows]
+
+    async def update(
+        self,
+        table: str,
+        values: Row,
+        filters: dict[str, str],
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        updated = []
+        for row in self.tables.get(table, []):
+            if _matches(row, filters):
+                row.update(values)
+                updated.append(dict(row))
+        return updated
+
+    async def delete(
+        self,
+        table: str,
+        filters: dict[str, str],
+        timeout: TimeoutArg = None,
+    ) -> list[Row]:
+        rows = self.tables.get(table, [])
+        deleted = [row for row in rows if _matches(row, filters)]
+        self.tables[table] = [row for row in rows if not _matches(row, filters)]
+        return deleted
+
+
+def _matches(row: Row, filters: Optional[dict[str, str]]) -> bool:
+    for column, expression in (filters or {}).items():
+        op, _, expected = expression.partition(".")
+        actual = row.get(column)
+        if op == "is":
+            if expected not in _IS_VALUES:
+                raise SupabaseError(400, f"지원하지 않는 is 값입니다: {expected}")
+            if actual is not _IS_VALUES[expected]:
+                return False
+        elif op == "in":
+            values = expected.strip("()").split(",")
+            if actual is None or actual not in [_coerce(actual, value) for value in values]:
+                return False
+        elif op not in _OPERATORS:
+            raise SupabaseError(400, f"지원하지 않는 필터 연산자입니다: {op}")
+        elif actual is None or not _OPERATORS[op](actual, _coerce(actual, expected)):
+            # PostgREST와 같이 null은 비교 연산에서 일치하지 않음
+            return False
+    return True
+
+
+_IS_VALUES = {"null": None, "true": True, "false": False}
+
+
+def _coerce(actual: Any, expected: str) -> Any:
+    """필터 문자열을 행 값의 타입으로 변환 (숫자는 수치 비교, "10" > "9")"""
+    if isinstance(actual, bool):
+        if expected not in ("true", "false"):
+            raise SupabaseError(400, f"불리언이 아닌 값입니다: {expected}")
+        return expected == "true"
+    if isinstance(actual, (int, float)):
+        try:
+            return float(expected)
+        except ValueError:
+            raise SupabaseError(400, f"숫자가 아닌 값입니다: {expected}") from None
+    return expected
+
+
+def _sort_key(value: Any) -> tuple[bool, Any]:
+    # 오름차순에서 null은 마지막 (내림차순에서는 처음, PostgreSQL 기본값과 같음)
+    return value is None, value if value is not None else 0
+
+
+class AsyncSupabaseClient:
+    """비동기 Supabase 클라이언트 싱글톤 (lifespan에서 open/close)"""
+
+    _instance: Optional[AsyncSupabase] = None
+
+    @classmethod
+    async def open(cls) -> Optional[AsyncSupabase]:
+        """클라이언트 생성 및 연결 풀 열기 (환경변수가 없으면 None)"""
+        if cls._instance is None:
+            if not settings.supabase_url or not settings.supabase_service_role_key:
+                return None
+            cls._instance = SupabaseREST(
+                settings.supabase_url,
+                settings.supabase_service_role_key,
+                max_connections=settings.supabase_max_connections,
+                max_keepalive=settings.supabase_max_keepalive,
+                timeout=settings.supabase_timeout,
+                max_concurrency=settings.supabase_max_concurrency,
+            )
+        await cls._instance.open()
+        return cls._instance
+
+    @classmethod
+    async def close(cls) -> None:
+        """연결 풀 종료"""
+        instance, cls._instance = cls._instance, None
+        if instance is not None:
+            await instance.close()
+
+    @classmethod
+    def use(cls, instance: Optional[AsyncSupabase]) -> None:
+        """클라이언트 교체 (테스트에서 InMemorySupabase 주입용)"""
+        cls._instance = instance
+
+    @classmethod
+    def get_client(cls) -> Optional[AsyncSupabase]:
+        """열린 클라이언트 반환"""
+        return cls._instance
+
+
+# 편의 함수
+def get_async_supabase() -> Optional[AsyncSupabase]:
+    """비동기 Supabase 클라이언트 반환"""
+    return AsyncSupabaseClient.get_client()
@@ -0,0 +1,166 @@
+"""서비스 지표를 /metrics에 노출"""
+
+from typing import Any, Iterable
+
+from app.core.admission import admission
+from app.core.broadcast import hub
+from app.core.compression import compression_stats
+from app.core.metrics import Sample, registry
+from app.core.scheduler import Scheduler
+from app.providers import Providers
+from app.services.ai_service import AIService
+from app.services.ingestion import feed_scheduler, scheduler
+from app.services.market_service import MarketService
+from app.services.news_service import news_store
+from app.services.warmup import Warmup
+
+_BREAKER_STATES = ("closed", "half_open", "open")
+
+
+def _cache_metrics():
+    caches = {"market": MarketService.cache_stats(), "briefing": AIService.cache_stats()}
+    yield (
+        "cache_events_total",
+        "counter",
+        "캐시 이벤트 수 (hit/stale_hit/miss/refresh 등)",
+        [
+            ({"cache": cache, "event": event}, value)
+            for cache, stats in caches.items()
+            for event, value in stats.items()
+        ],
+    )
+
+
+def _scheduler_samples(field: str, *schedulers: Scheduler) -> Iterable[Sample]:
+    for s in schedulers:
+        for job, stats in s.stats().items():
+            value: Any = stats[field]
+            if value is not None:
+                yield {"job": job}, value
+
+
+def _scheduler_metrics():
+    jobs = (scheduler, feed_scheduler)
+    yield "scheduler_job_runs_total", "counter", "작업 실행 수", _scheduler_samples("runs", *jobs)
+    yield (
+        "scheduler_job_failures_total",
+        "counter",
+        "작업 실패 수",
+        _scheduler_samples("failures", *jobs),
+    )
+    yield (
+        "scheduler_job_duration_seconds",
+        "gauge",
+        "마지막 실행 시간",
+        _scheduler_samples("last_duration", *jobs),
+    )
+    yield (
+        "scheduler_job_lag_seconds",
+        "gauge",
+        "마지막 실행 지연 (예정 시각 대비)",
+        _scheduler_samples("last_lag", *jobs),
+    )
+    yield (
+        "scheduler_job_last_success_timestamp",
+        "gauge",
+        "마지막 성공 시각 (epoch)",
+        _scheduler_samples("last_success_at", *jobs),
+    )
+
+
+def _compression_metrics():
+    stats = compression_stats()
+    yield (
+        "compression_events_total",
+        "counter",
+        "응답 압축 이벤트 수",
+        [
+            ({"event": event}, stats[event])
+            for event in ("compressed", "precompressed_hits", "skipped_small")
+        ],
+    )
+    yield (
+        "compression_bytes_total",
+        "counter",
+        "압축 전후 바이트",
+        [({"direction": "in"}, stats["bytes_in"]), ({"direction": "out"}, stats["bytes_out"])],
+    )
+    yield "compression_cpu_seconds_total", "counter", "압축 CPU 시간", [({}, stats["cpu_seconds"])]
+
+
+def _stream_metrics():
+    yield "sse_subscribers", "gauge", "SSE 구독자 수", [({}, hub.subscriber_count())]
+    yield "sse_evictions_total", "counter", "느린 SSE 구독자 해제 수", [({}, hub.evictions)]
+    yield "news_store_items", "gauge", "뉴스 저장소 기사 수", [({}, len(news_store))]
+    yield (
+        "news_duplicates_total",
+        "counter",
+        "수집 시 대표 기사에 병합된 유사 기사 수",
+        [({}, news_store.duplicates)],
+    )
+
+
+def _upstream_metrics():
+    client = Providers.upstream
+    if client is None:
+        return
+    yield (
+        "upstream_circuit_state",
+        "gauge",
+        "업스트림 서킷 상태 (현재 상태만 1)",
+        [
+            ({"host": host, "state": state}, float(current == state))
+            for host, current in client.breaker_states().items()
+            for state in _BREAKER_STATES
+        ],
+    )
+    yield (
+        "upstream_snapshot_fallbacks_total",
+        "counter",
+        "업스트림 실패 시 마지막 정상 응답 반환 수",
+        [
+            ({"provider": name}, getattr(provider, "fallbacks", 0))
+            for name, provider in (
+                ("market", Providers.market),
+                ("quotes", Providers.quotes),
+                ("news", Providers.news),
+            )
+        ],
+    )
+
+
+def _readiness_metrics():
+    status = Warmup.status()
+    yield "app_ready", "gauge", "시작 워밍업 완료 여부", [({}, float(Warmup.ready))]
+    yield "app_warmup_degraded", "gauge", "워밍업 제한 시간 초과 여부", [({}, float(status["degraded"]))]
+    yield "app_warmup_seconds", "gauge", "워밍업 소요 시간 (진행 중이면 경과 시간)", [({}, status["elapsed"])]
+
+
+def _admission_metrics():
+    stats = admission.stats()
+    yield (
+        "admission_active_requests",
+        "gauge",
+        "동시 실행 슬롯 점유 수",
+        [({"route": route}, s["active"]) for route, s in stats.items()],
+    )
+    yield (
+        "admission_queued_requests",
+        "gauge",
+        "슬롯 대기 중인 요청 수",
+        [({"route": route}, s["queued"]) for route, s in stats.items()],
+    )
+
+
+def register_collectors() -> None:
+    """기존 카운터를 스크레이프 시점에 읽어 노출"""
+    for collector in (
+        _cache_metrics,
+        _scheduler_metrics,
+        _compression_metrics,
+        _stream_metrics,
+        _upstream_metrics,
+        _readiness_metrics,
+        _admission_metrics,
+    ):
+        registry.add_collector(collector)
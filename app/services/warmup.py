@@ -0,0 +1,127 @@
+"""시작 시 캐시 워밍업과 준비 상태 (/ready)
+
+새 인스턴스가 빈 캐시로 트래픽을 받지 않도록 lifespan에서 수집 작업을 1회씩 먼저 실행하고
+주요 조회 경로를 미리 호출한다. 완료(또는 WARMUP_TIMEOUT 경과) 전까지 /ready는 503을 반환한다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from app.core.config import settings
+from app.services.ai_service import AIService
+from app.services.ingestion import feed_scheduler, scheduler, start_ingestion
+from app.services.market_service import SEGMENTS, MarketService
+from app.services.news_service import NewsService
+from app.services.snapshot import MarketSnapshot, Role
+from app.services.stocks_service import StocksService
+
+logger = logging.getLogger(__name__)
+
+# 미리 호출할 조회 경로 (라우트 기본 쿼리 파라미터 기준)
+WARM_READS: dict[str, Callable[[], Awaitable[Any]]] = {
+    **{
+        f"market.summary.{seg}": (lambda seg=seg: MarketService.get_market_summary(seg))
+        for seg in SEGMENTS
+    },
+    "stocks.popular.KR": lambda: StocksService.get_popular_stocks("KR"),
+    "stocks.popular.US": lambda: StocksService.get_popular_stocks("US"),
+    "stocks.surging": lambda: StocksService.get_surging_stocks(),
+    "news.breaking": lambda: NewsService.get_breaking_news(),
+    "ai.briefing": AIService.get_market_briefing,
+}
+
+_SNAPSHOT_POLL_INTERVAL = 0.05
+
+
+class Warmup:
+    """워밍업 실행 및 준비 상태 (lifespan에서 start/close)"""
+
+    ready: bool = False
+    timed_out: bool = False
+    started_at: Optional[float] = None
+    duration: Optional[float] = None
+    warmed: list[str] = []
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start(cls, role: Role) -> None:
+        """워밍업 시작 (끝나면 수집 스케줄러 시작 후 ready 전환)"""
+        if cls._task is not None:
+            return
+        cls.ready = False
+        cls.timed_out = False
+        cls.started_at = time.monotonic()
+        cls.duration = None
+        cls.warmed = []
+        cls._task = asyncio.get_running_loop().create_task(cls._run(role), name="warmup")
+
+    @classmethod
+    async def close(cls) -> None:
+        """진행 중인 워밍업 취소"""
+        task, cls._task = cls._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        cls.ready = False
+
+    @classmethod
+    async def wait(cls) -> None:
+        """워밍업 종료까지 대기"""
+        if cls._task is not None:
+            await asyncio.shield(cls._task)
+
+    @classmethod
+    def status(cls) -> dict[str, Any]:
+        """/ready 응답 본문"""
+        elapsed = cls.duration
+        if elapsed is None and cls.started_at is not None:
+            elapsed = time.monotonic() - cls.started_at
+        return {
+            "status": "ready" if cls.ready else "warming",
+            "degraded": cls.timed_out,
+            "elapsed": round(elapsed or 0.0, 3),
+            "warmed": len(cls.warmed),
+            "pending": [name for name in WARM_READS if name not in cls.warmed],
+        }
+
+    @classmethod
+    async def _run(cls, role: Role) -> None:
+        if settings.warmup_timeout > 0:
+            try:
+                await asyncio.wait_for(cls._warm(role), timeout=settings.warmup_timeout)
+            except asyncio.TimeoutError:
+                cls.timed_out = True
+                logger.warning(
+                    "warm-up timed out after %.1fs (pending: %s)",
+                    settings.warmup_timeout,
+                    ", ".join(cls.status()["pending"]),
+                )
+        # 시간 초과여도 수집은 계속되므로 ready로 전환 (degraded로 표시)
+        start_ingestion(role)
+        cls.duration = time.monotonic() - (cls.started_at or time.monotonic())
+        cls.ready = True
+        logger.info("warm-up finished in %.2fs (degraded=%s)", cls.duration, cls.timed_out)
+
+    @classmethod
+    async def _warm(cls, role: Role) -> None:
+        # 1) 저장소 채우기: 마켓/시세(writer) 또는 스냅샷 대기(reader), 뉴스
+        feed = _wait_for_snapshot() if role == "reader" else feed_scheduler.prime()
+        await asyncio.gather(feed, scheduler.prime(["news"]))
+        # 2) 브리핑은 마켓/뉴스 입력이 있어야 생성 가능
+        await scheduler.prime(["ai.briefing"])
+        # 3) 조회 경로 호출 (캐시 적재, 스냅샷 뷰 생성)
+        for name, read in WARM_READS.items():
+            try:
+                await read()
+            except Exception as e:
+                logger.warning("warm-up read %s failed: %r", name, e)
+                continue
+            cls.warmed.append(name)
+
+
+async def _wait_for_snapshot() -> None:
+    """reader 워커: writer가 첫 스냅샷을 기록할 때까지 대기"""
+    while MarketSnapshot.read(lambda view: view.generation) is None:
+        await asyncio.sleep(_SNAPSHOT_POLL_INTERVAL)
@@ -0,0 +1 @@
+# 벤치마크 모듈
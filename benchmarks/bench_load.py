@@ -0,0 +1,156 @@
+"""ASGI 인프로세스 부하 테스트
+
+모든 /api/v1 라우트(SSE 스트림 제외)를 app에 직접 요청해 라우트별 처리량과 p50/p99를 측정한다.
+네트워크/서버 프로세스 없이 미들웨어(압축, 지표 등)와 라우팅/직렬화 비용을 포함한다.
+
+실행: python -m benchmarks.bench_load [--requests N] [--concurrency C] [--save-baseline]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any, Optional
+
+import httpx
+from fastapi.routing import APIRoute
+
+from app.core.admission import admission
+from app.main import app
+from app.services.warmup import Warmup
+from benchmarks.harness import (
+    Result,
+    add_baseline_arguments,
+    best_of,
+    check_baseline,
+    print_results,
+    summarize,
+)
+
+# (메서드, 라우트 템플릿) → (요청 URL, JSON 본문)
+ROUTE_SAMPLES: dict[tuple[str, str], tuple[str, Optional[dict[str, Any]]]] = {
+    ("GET", "/api/v1/market/summary"): ("/api/v1/market/summary?seg=KR", None),
+    ("GET", "/api/v1/market/sectors"): ("/api/v1/market/sectors?seg=US", None),
+    ("GET", "/api/v1/market/flow"): ("/api/v1/market/flow?seg=KR", None),
+    ("GET", "/api/v1/stocks/popular"): ("/api/v1/stocks/popular?market=KR&limit=6", None),
+    ("GET", "/api/v1/stocks/surging"): ("/api/v1/stocks/surging?limit=6&mix=true", None),
+    ("GET", "/api/v1/ai/market-briefing"): ("/api/v1/ai/market-briefing", None),
+    ("GET", "/api/v1/news/list"): ("/api/v1/news/list?limit=20", None),
+    ("GET", "/api/v1/news/search"): ("/api/v1/news/search?q=%EC%A6%9D%EC%8B%9C&limit=20", None),
+    ("GET", "/api/v1/news/breaking"): ("/api/v1/news/breaking?limit=5", None),
+    ("GET", "/api/v1/news/{news_id}"): ("/api/v1/news/news-0001", None),
+    ("POST", "/api/v1/batch"): (
+        "/api/v1/batch",
+        {
+            "paths": [
+                "/market/summary?seg=KR",
+                "/stocks/popular?market=KR",
+                "/news/breaking",
+            ]
+        },
+    ),
+}
+
+
+def _routes_without_sample() -> list[str]:
+    """샘플이 없는 /api/v1 라우트 (새 라우트 추가 시 ROUTE_SAMPLES 갱신 필요)"""
+    missing = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not route.path.startswith("/api/v1"):
+            continue
+        if route.path.endswith("/stream"):
+            continue
+        for method in route.methods:
+            if (method, route.path) not in ROUTE_SAMPLES:
+                missing.append(f"{method} {route.path}")
+    return missing
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    name: str,
+    method: str,
+    url: str,
+    body: Optional[dict[str, Any]],
+    requests: int,
+    concurrency: int,
+) -> Result:
+    samples: list[float] = []
+    errors: list[int] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            t0 = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            samples.append(time.perf_counter() - t0)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    if errors:
+        raise RuntimeError(f"{name}: {len(errors)}건 실패 (status {sorted(set(errors))})")
+    return summarize(name, samples, elapsed)
+
+
+async def run(
+    requests: int, concurrency: int, warmup: int, rounds: int, route_filter: str
+) -> list[Result]:
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    # 한 클라이언트가 계속 요청하므로 속도 제한은 끄고, 동시 요청이 대기열을 넘지 않도록 맞춤
+    # (수락 제어 미들웨어 자체의 비용은 측정에 포함)
+    admission.rate_limit = 0
+    for limiter in (admission.default, *admission.limiters.values()):
+        limiter.queue_size = max(limiter.queue_size, concurrency)
+    async with app.router.lifespan_context(app):
+        # 시작 워밍업(첫 수집 + 주요 조회 경로)이 끝난 뒤 측정
+        await Warmup.wait()
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for (method, path), (url, body) in ROUTE_SAMPLES.items():
+                name = f"{method} {path}"
+                if route_filter not in name:
+                    continue
+                await _drive(client, name, method, url, body, warmup, concurrency)
+                results.append(
+                    best_of(
+                        [
+                            await _drive(client, name, method, url, body, requests, concurrency)
+                            for _ in range(rounds)
+                        ]
+                    )
+                )
+    return results
+
+
+async def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="라우트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="라우트별 워밍업 요청 수")
+    parser.add_argument("--route", default="", help="이름에 포함된 라우트만 실행")
+    # 동시 요청은 이벤트 루프 스케줄링 영향으로 회차 간 편차가 커서 허용치를 넓게 둠
+    add_baseline_arguments(parser, threshold=0.5)
+    args = parser.parse_args(argv)
+
+    missing = _routes_without_sample()
+    if missing:
+        print("ROUTE_SAMPLES에 없는 라우트:", ", ".join(missing))
+        return 2
+
+    results = await run(args.requests, args.concurrency, args.warmup, args.rounds, args.route)
+    print_results(f"load (concurrency={args.concurrency})", results)
+    section = f"load.c{args.concurrency}"
+    ok = check_baseline(
+        section, results, args.baseline, args.threshold, args.save_baseline, args.min_delta
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,75 @@
+"""APIResponse 인코딩 벤치마크
+
+기존 경로(success_response + FastAPI 검증/직렬화)와 사전 인코딩 경로를 비교한다.
+
+실행: python -m benchmarks.bench_response_encoding
+"""
+
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic_core import to_json
+
+from app.core.responses import EncodedPayload, PreEncodedJSONResponse
+from app.models.schemas import APIResponse
+from app.services.market_service import MarketService
+from app.services.news_service import NewsService
+from app.services.stocks_service import StocksService
+
+ITERATIONS = 2000
+
+_response_field = create_response_field(name="Response", type_=APIResponse)
+
+
+async def _legacy(data) -> bytes:
+    """기존 경로: 모델 생성 → response_model 검증 → jsonable_encoder → json.dumps"""
+    content = await serialize_response(
+        field=_response_field, response_content=APIResponse.success_response(data)
+    )
+    return JSONResponse(content).body
+
+
+async def _encoded_cold(data) -> bytes:
+    """사전 인코딩 경로 (캐시 미스: 매번 data 직렬화)"""
+    return PreEncodedJSONResponse(EncodedPayload(data, to_json(data))).body
+
+
+async def _encoded(data) -> bytes:
+    """사전 인코딩 경로 (캐시 히트)"""
+    return APIResponse.encoded_response(data).body
+
+
+async def _measure(func, data) -> float:
+    await func(data)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await func(data)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    await NewsService.refresh()
+    await StocksService.refresh("KR")
+    payloads = {
+        "/news/list?limit=100": await NewsService.get_news_list(limit=100),
+        "/stocks/popular": await StocksService.get_popular_stocks("KR", 6),
+        "/market/summary": await MarketService.get_market_summary("KR"),
+    }
+
+    print(
+        f"{'payload':<24}{'legacy(us)':>12}{'cold(us)':>10}{'cached(us)':>12}{'speedup':>10}"
+    )
+    for name, data in payloads.items():
+        legacy = await _measure(_legacy, data)
+        cold = await _measure(_encoded_cold, data)
+        cached = await _measure(_encoded, data)
+        print(
+            f"{name:<24}{legacy:>12.1f}{cold:>10.1f}{cached:>12.1f}{legacy / cached:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""뉴스 검색 역색인 벤치마크 (대용량 합성 기사)
+
+기사 N건(기본 200,000)을 색인한 뒤 질의 유형별 검색 지연 시간을 측정한다.
+어휘가 작은 합성 데이터라 포스팅이 실제보다 길며, 흔한 바이그램끼리 교집합을 구하는 질의가 가장 느리다.
+
+실행: python -m benchmarks.bench_search [--articles N] [--iterations N] [--save-baseline]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from app.services.news_index import SearchIndex
+from benchmarks.harness import (
+    Result,
+    add_baseline_arguments,
+    best_of,
+    check_baseline,
+    measure,
+    print_results,
+)
+
+COMPANIES = (
+    "삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "카카오", "네이버", "셀트리온",
+    "포스코홀딩스", "기아", "KB금융", "Apple", "Tesla", "NVIDIA", "Microsoft",
+)
+TOPICS = (
+    "실적 발표", "목표주가 상향", "외국인 순매수", "기관 매도", "신제품 출시", "반도체 업황",
+    "배당 확대", "자사주 매입", "AI 투자", "금리 인하 기대", "환율 급등", "공매도 재개",
+)
+WORDS = (
+    "시장 전망 투자자 증권가 분석 상승 하락 급등 급락 거래량 코스피 코스닥 나스닥 미국 중국 정부 "
+    "정책 발표 예상 우려 기대 회복 둔화 성장 수출 수입 물가 고용 지표 연준 한국은행 ETF 채권 "
+    "원자재 유가"
+).split()
+CATEGORIES = ("증시", "경제", "산업", "해외", "코인")
+
+# (이름, 검색어, 카테고리)
+QUERIES = (
+    ("company", "삼성전자", None),
+    ("company+topic", "삼성전자 실적", None),
+    ("latin word", "nvidia", None),
+    ("common bigrams", "코스피 급등", None),
+    ("long query", "금리 인하 기대 연준", None),
+    ("category filter", "반도체", "증시"),
+    ("no match", "없는검색어", None),
+)
+
+
+def build_index(articles: int, seed: int = 1) -> SearchIndex:
+    rng = random.Random(seed)
+    index = SearchIndex(half_life=6 * 3600)
+    base = time.time() - articles
+    for i in range(articles):
+        words = " ".join(rng.choices(WORDS, k=2))
+        title = f"{rng.choice(COMPANIES)} {rng.choice(TOPICS)} {words}"
+        summary = " ".join(rng.choices(WORDS, k=12))
+        category = rng.choice(CATEGORIES)
+        index.add(f"news-{i}", base + i, category, title, (summary, category))
+    return index
+
+
+async def bench_search(index: SearchIndex, iterations: int, rounds: int) -> list[Result]:
+    results = []
+    for name, query, category in QUERIES:
+
+        async def search(query=query, category=category):
+            return index.search(query, category, 20)
+
+        keys, _, has_more = index.search(query, category, 20)
+
+        async def next_page(query=query, category=category, after=keys[-1] if keys else None):
+            return index.search(query, category, 20, after)
+
+        results.append(best_of([await measure(name, search, iterations) for _ in range(rounds)]))
+        if has_more:
+            label = f"{name} (page 2)"
+            results.append(
+                best_of([await measure(label, next_page, iterations) for _ in range(rounds)])
+            )
+    return results
+
+
+async def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=200_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    add_baseline_arguments(parser)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = build_index(args.articles)
+    elapsed = time.perf_counter() - started
+    print(
+        f"색인: {len(index)}건, 토큰 {index.token_count}개, "
+        f"{elapsed:.1f}s ({args.articles / elapsed:.0f}건/s)"
+    )
+
+    results = await bench_search(index, args.iterations, args.rounds)
+    print_results(f"search (articles={args.articles})", results)
+    section = f"search.n{args.articles}"
+    ok = check_baseline(
+        section, results, args.baseline, args.threshold, args.save_baseline, args.min_delta
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
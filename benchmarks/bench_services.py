@@ -0,0 +1,181 @@
+"""서비스/직렬화 마이크로 벤치마크
+
+- 서비스 메서드별 호출 시간 (업스트림은 Mock 제공자, 저장소는 수집 작업 1회로 채움)
+- APIResponse 응답 생성: FastAPI response_model 경로 vs trusted_response
+- StockItem / NewsItem 모델 생성 (실제 응답 크기의 리스트, 검증 생성 vs trusted 생성)
+- 항목당 메모리 할당량 (tracemalloc)
+
+실행: python -m benchmarks.bench_services [--iterations N] [--save-baseline] [--threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app.api.v1.news import router as news_router
+from app.models.news import NewsItem
+from app.models.schemas import APIResponse
+from app.models.stocks import StockItem
+from app.models.trusted import trusted
+from app.services.ai_service import AIService
+from app.services.market_service import SEGMENTS, MarketService
+from app.services.news_service import NewsService
+from app.services.stocks_service import StocksService
+from benchmarks.harness import (
+    Result,
+    add_baseline_arguments,
+    best_of,
+    check_baseline,
+    measure,
+    print_results,
+)
+
+LIST_SIZES = (6, 20, 100)
+
+
+async def _prepare() -> None:
+    for seg in SEGMENTS:
+        await MarketService.refresh(seg)
+    await StocksService.refresh("KR")
+    await StocksService.refresh("US")
+    await NewsService.refresh()
+    await AIService.get_market_briefing()
+
+
+async def _measure(name: str, func, iterations: int, rounds: int) -> Result:
+    return best_of([await measure(name, func, iterations) for _ in range(rounds)])
+
+
+async def bench_services(iterations: int, rounds: int) -> list[Result]:
+    cases = {
+        "market.summary": lambda: MarketService.get_market_summary("KR"),
+        "market.sectors": lambda: MarketService.get_market_sectors("KR"),
+        "market.flow": lambda: MarketService.get_market_flow("KR"),
+        "stocks.popular(limit=6)": lambda: StocksService.get_popular_stocks("KR", 6),
+        "stocks.surging(limit=6)": lambda: StocksService.get_surging_stocks(6, True),
+        "news.list(limit=20)": lambda: NewsService.get_news_list(limit=20),
+        "news.list(limit=100)": lambda: NewsService.get_news_list(limit=100),
+        "news.search(limit=20)": lambda: NewsService.search_news("증시 뉴스", limit=20),
+        "news.breaking": lambda: NewsService.get_breaking_news(5),
+        "news.detail": lambda: NewsService.get_news_detail("news-0001"),
+        "ai.briefing": AIService.get_market_briefing,
+    }
+    return [await _measure(name, func, iterations, rounds) for name, func in cases.items()]
+
+
+async def bench_serialization(iterations: int, rounds: int) -> list[Result]:
+    news = (await NewsService.get_news_list(limit=100)).items
+    stocks = (await StocksService.get_popular_stocks("US", 6)).stocks
+    news_rows = [item.model_dump() for item in news]
+    stock_rows = [item.model_dump() for item in stocks]
+
+    response_field = next(
+        route.response_field for route in news_router.routes if route.path == "/news/breaking"
+    )
+
+    results = []
+    for size in LIST_SIZES:
+        stock_batch = (stock_rows * (size // len(stock_rows) + 1))[:size]
+        news_batch = (news_rows * (size // len(news_rows) + 1))[:size]
+
+        async def build_stocks(batch=stock_batch):
+            return [StockItem(**row) for row in batch]
+
+        async def build_news(batch=news_batch):
+            return [NewsItem(**row) for row in batch]
+
+        async def build_stocks_trusted(batch=stock_batch):
+            return [trusted(StockItem, **row) for row in batch]
+
+        async def build_news_trusted(batch=news_batch):
+            return [trusted(NewsItem, **row) for row in batch]
+
+        news_models = await build_news()
+
+        async def fastapi_response(items=news_models):
+            # 라우트가 APIResponse를 반환할 때 FastAPI가 하는 처리 (dict 변환 → 재검증 → JSON)
+            content = await serialize_response(
+                field=response_field,
+                response_content=APIResponse.success_response(items),
+                is_coroutine=True,
+            )
+            return JSONResponse(content).body
+
+        async def trusted_response(items=news_models):
+            return APIResponse.trusted_response(items).body
+
+        results.append(await _measure(f"StockItem x{size}", build_stocks, iterations, rounds))
+        results.append(
+            await _measure(f"StockItem trusted x{size}", build_stocks_trusted, iterations, rounds)
+        )
+        results.append(await _measure(f"NewsItem x{size}", build_news, iterations, rounds))
+        results.append(
+            await _measure(f"NewsItem trusted x{size}", build_news_trusted, iterations, rounds)
+        )
+        results.append(
+            await _measure(
+                f"fastapi response_model NewsItem x{size}", fastapi_response, iterations, rounds
+            )
+        )
+        results.append(
+            await _measure(
+                f"trusted_response NewsItem x{size}", trusted_response, iterations, rounds
+            )
+        )
+    return results
+
+
+def _allocated(build: Callable[[], list[Any]], repeat: int = 200) -> float:
+    """build 결과 리스트가 붙잡고 있는 항목당 바이트 (리스트 자체 제외)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        batches = [build() for _ in range(repeat)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    items = sum(len(batch) for batch in batches)
+    overhead = sum(sys.getsizeof(batch) for batch in batches)
+    return (after - before - overhead) / items
+
+
+async def print_allocation() -> None:
+    """모델 생성 방식별 항목당 할당량 (기준선 비교 없음)"""
+    news_rows = [item.model_dump() for item in (await NewsService.get_news_list(limit=20)).items]
+    stock_rows = [item.model_dump() for item in (await StocksService.get_popular_stocks("US", 6)).stocks]
+    cases = {
+        "StockItem": lambda: [StockItem(**row) for row in stock_rows],
+        "StockItem trusted": lambda: [trusted(StockItem, **row) for row in stock_rows],
+        "NewsItem": lambda: [NewsItem(**row) for row in news_rows],
+        "NewsItem trusted": lambda: [trusted(NewsItem, **row) for row in news_rows],
+    }
+    print("\n[allocation]")
+    print(f"{'name':<44}{'bytes/item':>12}")
+    for name, build in cases.items():
+        print(f"{name:<44}{_allocated(build):>12.0f}")
+
+
+async def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    add_baseline_arguments(parser)
+    args = parser.parse_args(argv)
+
+    await _prepare()
+    results = await bench_services(args.iterations, args.rounds)
+    results += await bench_serialization(args.iterations, args.rounds)
+    print_results("micro", results)
+    await print_allocation()
+    ok = check_baseline(
+        "micro", results, args.baseline, args.threshold, args.save_baseline, args.min_delta
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,168 @@
+"""벤치마크 공통 도구 (측정, 백분위수, 기준선 비교)"""
+
+import argparse
+import json
+import os
+import platform
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Optional
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# 회귀로 판정하는 최소 p50 증가량 (us). 수 us짜리 측정은 타이머/스케줄링 노이즈만으로도
+# 비율 허용치를 넘으므로 절대 증가량도 함께 본다 (p99는 2배)
+MIN_DELTA_US = 1.0
+
+
+@dataclass
+class Result:
+    """측정 결과 (지연 시간 단위: us)"""
+
+    name: str
+    iterations: int
+    p50: float
+    p99: float
+    mean: float
+    throughput: float  # 초당 처리 수
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값의 q 백분위수 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(name: str, samples: list[float], elapsed: float) -> Result:
+    """초 단위 샘플 → Result"""
+    ordered = sorted(samples)
+    return Result(
+        name=name,
+        iterations=len(samples),
+        p50=percentile(ordered, 50) * 1e6,
+        p99=percentile(ordered, 99) * 1e6,
+        mean=sum(samples) / len(samples) * 1e6 if samples else 0.0,
+        throughput=len(samples) / elapsed if elapsed else 0.0,
+    )
+
+
+def best_of(rounds: list[Result]) -> Result:
+    """여러 회차 중 지표별 최솟값 (노이즈 완화)"""
+    return Result(
+        name=rounds[0].name,
+        iterations=sum(r.iterations for r in rounds),
+        p50=min(r.p50 for r in rounds),
+        p99=min(r.p99 for r in rounds),
+        mean=min(r.mean for r in rounds),
+        throughput=max(r.throughput for r in rounds),
+    )
+
+
+async def measure(
+    name: str, func: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 20
+) -> Result:
+    """비동기 함수를 순차 실행하며 호출별 지연 시간 측정"""
+    for _ in range(warmup):
+        await func()
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - t0)
+    return summarize(name, samples, time.perf_counter() - started)
+
+
+def print_results(title: str, results: list[Result]) -> None:
+    print(f"\n[{title}]")
+    print(f"{'name':<44}{'n':>8}{'p50(us)':>11}{'p99(us)':>11}{'mean(us)':>11}{'ops/s':>12}")
+    for r in results:
+        print(
+            f"{r.name:<44}{r.iterations:>8}{r.p50:>11.1f}{r.p99:>11.1f}"
+            f"{r.mean:>11.1f}{r.throughput:>12.0f}"
+        )
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser, threshold: float = 0.25) -> None:
+    parser.add_argument("--rounds", type=int, default=3, help="반복 회차 (지표별 최솟값 사용)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준선 파일 경로")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="비교 없이 현재 결과를 기준선으로 저장"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=threshold,
+        help=f"허용 회귀 비율 (기본 {threshold}: p50이 기준선보다 {threshold * 100:.0f}%% 넘게 느려지면 실패)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=MIN_DELTA_US,
+        help=f"회귀로 보는 최소 p50 증가량 us (기본 {MIN_DELTA_US}, p99는 2배)",
+    )
+
+
+def check_baseline(
+    section: str,
+    results: list[Result],
+    path: str,
+    threshold: float,
+    save: bool,
+    min_delta: float = MIN_DELTA_US,
+) -> bool:
+    """기준선과 비교 (회귀가 없으면 True)
+
+    기준선 파일에 해당 섹션이 없거나 save면 현재 결과를 기록하고 통과한다.
+    비율(threshold)과 절대 증가량(min_delta us)을 모두 넘어야 회귀로 본다.
+    p99는 변동이 커서 p50의 2배 허용치를 적용한다.
+    """
+    baseline = _load(path)
+    previous: Optional[dict[str, Any]] = baseline.get("sections", {}).get(section)
+    if save or previous is None:
+        baseline.setdefault("sections", {})[section] = {r.name: asdict(r) for r in results}
+        baseline["machine"] = {"python": platform.python_version(), "platform": platform.platform()}
+        _save(path, baseline)
+        print(f"\n기준선 저장: {path} [{section}]")
+        return True
+
+    regressions = []
+    for r in results:
+        base = previous.get(r.name)
+        if base is None:
+            continue
+        for metric, limit, delta in (
+            ("p50", threshold, min_delta),
+            ("p99", threshold * 2, min_delta * 2),
+        ):
+            before, after = base[metric], getattr(r, metric)
+            if before > 0 and after > before * (1 + limit) and after - before > delta:
+                regressions.append(
+                    f"{r.name} {metric}: {before:.1f}us → {after:.1f}us "
+                    f"(+{(after / before - 1) * 100:.0f}%, 허용 {limit * 100:.0f}%)"
+                )
+
+    if regressions:
+        print(f"\n회귀 감지 [{section}]:")
+        for line in regressions:
+            print(f"  - {line}")
+        return False
+    print(
+        f"\n기준선 대비 회귀 없음 [{section}] (허용 {threshold * 100:.0f}%, 최소 {min_delta:.1f}us)"
+    )
+    return True
+
+
+def _load(path: str) -> dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save(path: str, data: dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
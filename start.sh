@@ -1,8 +1,22 @@
 #!/bin/sh
 # Railway 배포용 시작 스크립트
 # PORT 환경변수를 읽어서 uvicorn 실행
+# WEB_CONCURRENCY가 2 이상이면 gunicorn pre-fork 멀티 워커로 실행
+# (종료된 워커는 gunicorn이 재시작하고, 마켓 스냅샷 writer 역할은 다른 워커가 이어받음)
 
 PORT=${PORT:-8000}
+WORKERS=${WEB_CONCURRENCY:-1}
+
+if [ "$WORKERS" -gt 1 ]; then
+    echo "Starting server on port $PORT with $WORKERS workers"
+    exec gunicorn app.main:app \
+        --worker-class uvicorn.workers.UvicornWorker \
+        --workers "$WORKERS" \
+        --bind "0.0.0.0:$PORT" \
+        --graceful-timeout 30 \
+        --max-requests 10000 \
+        --max-requests-jitter 1000
+fi
+
 echo "Starting server on port $PORT"
 exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT"
-
@@ -0,0 +1,134 @@
+"""요청 수락 제어 (클라이언트 키, 배치 하위 요청)"""
+
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.admission import AdmissionController, AdmissionMiddleware, ConcurrencyLimiter
+from app.core.broadcast import EventStreamResponse
+
+pytestmark = pytest.mark.anyio
+
+
+def _controller(
+    trust_forwarded: bool = True,
+    rate_burst: float = 40.0,
+    rate_limit: float = 1.0,
+    default_concurrency: int = 1,
+    trusted_proxies: frozenset[str] = frozenset({"127.0.0.1"}),
+) -> AdmissionController:
+    return AdmissionController(
+        heavy_routes={"/api/v1/batch": None},
+        heavy_concurrency=1,
+        heavy_queue=0,
+        default_concurrency=default_concurrency,
+        default_queue=0,
+        queue_timeout=0.1,
+        shed_threshold=100,
+        rate_limit=rate_limit,
+        rate_burst=rate_burst,
+        max_clients=100,
+        trust_forwarded=trust_forwarded,
+        trusted_proxies=trusted_proxies,
+    )
+
+
+def _scope(path: str = "/api/v1/stocks/surging", client: str = "127.0.0.1", forwarded: str = ""):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return {
+        "type": "http",
+        "path": path,
+        "query_string": b"",
+        "headers": headers,
+        "client": (client, 1234),
+    }
+
+
+def test_forwarded_for_ignored_unless_enabled():
+    controller = _controller(trust_forwarded=False)
+    assert controller.client_key(_scope(forwarded="1.2.3.4")) == "127.0.0.1"
+
+
+def test_forwarded_for_ignored_from_untrusted_peer():
+    controller = _controller()
+    assert controller.client_key(_scope(client="10.0.0.5", forwarded="1.2.3.4")) == "10.0.0.5"
+
+
+def test_forwarded_for_uses_nearest_untrusted_address():
+    controller = _controller()
+    scope = _scope(forwarded="6.6.6.6, 5.5.5.5, 127.0.0.1")
+    assert controller.client_key(scope) == "5.5.5.5"
+
+
+def test_forwarded_for_trusts_proxy_ranges():
+    controller = _controller(trusted_proxies=frozenset({"100.64.0.0/10"}))
+    scope = _scope(client="100.64.3.2", forwarded="6.6.6.6, 5.5.5.5, 100.100.0.1")
+    assert controller.client_key(scope) == "5.5.5.5"
+    assert controller.client_key(_scope(client="10.0.0.5", forwarded="1.2.3.4")) == "10.0.0.5"
+
+
+def test_rate_limit_without_trusted_proxies_warns(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.core.admission"):
+        _controller(trust_forwarded=False)
+        assert len(caplog.records) == 1
+        _controller(rate_limit=0.0, trust_forwarded=False)
+        _controller()
+    assert len(caplog.records) == 1
+
+
+async def test_enter_charges_client_given_for_sub_requests():
+    controller = _controller(rate_burst=2.0)
+    sub_request = _scope(client="")
+    for _ in range(2):
+        limiter, rejection = await controller.enter(sub_request, "5.5.5.5")
+        assert rejection is None and isinstance(limiter, ConcurrencyLimiter)
+        limiter.release()
+
+    limiter, rejection = await controller.enter(sub_request, "5.5.5.5")
+    assert limiter is None and rejection is not None and rejection.status == 429
+    assert "5.5.5.5" in controller._buckets and "" not in controller._buckets
+
+
+async def test_enter_rejects_when_route_slots_are_full():
+    controller = _controller()
+    limiter, rejection = await controller.enter(_scope())
+    assert rejection is None and limiter is controller.default
+
+    _, rejection = await controller.enter(_scope())
+    assert rejection is not None and rejection.status == 503 and rejection.code == "OVERLOADED"
+    limiter.release()
+    assert controller.in_flight == 0
+
+
+def _app(controller: AdmissionController) -> FastAPI:
+    app = FastAPI()
+
+    async def _events():
+        yield b"data: 1\n\n"
+
+    @app.get("/api/v1/events", response_class=EventStreamResponse)
+    async def events() -> EventStreamResponse:
+        return EventStreamResponse(_events())
+
+    @app.get("/api/v1/live/stream")
+    async def not_a_stream():
+        return {"ok": True}
+
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+    return app
+
+
+async def test_middleware_exempts_routes_marked_as_event_streams():
+    # 슬롯이 없으므로 스트리밍 라우트만 통과
+    app = _app(_controller(default_concurrency=0, rate_burst=100.0))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        stream = await client.get("/api/v1/events")
+        assert stream.status_code == 200
+        assert stream.headers["content-type"].startswith("text/event-stream")
+
+        # 경로가 /stream으로 끝나도 SSE 라우트가 아니면 슬롯이 필요
+        response = await client.get("/api/v1/live/stream")
+        assert response.status_code == 503
@@ -0,0 +1,120 @@
+"""마켓 브리핑 토큰 스트리밍 (가짜 토큰 생성기)"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.shared_cache import TieredCache
+from app.main import app
+from app.models.ai import MarketBriefingResponse
+from app.services import ai_service
+from app.services.ai_service import AIService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def fresh_briefing(monkeypatch):
+    """브리핑 상태/캐시 초기화, OpenAI 대신 가짜 토큰 생성기 사용"""
+    monkeypatch.setattr(ai_service, "_state", ai_service._BriefingState())
+    monkeypatch.setattr(
+        ai_service,
+        "_cache",
+        TieredCache(
+            "briefing-test",
+            ttl=60.0,
+            stale_ttl=0.0,
+            encode=ai_service.to_json,
+            decode=ai_service._decode_briefing,
+            lock_ttl=1.0,
+            max_entries=4,
+        ),
+    )
+    monkeypatch.setattr(settings, "openai_api_key", None)
+    monkeypatch.setattr(settings, "briefing_fake_token_delay", 0.001)
+
+
+def _mock_text() -> str:
+    mock = ai_service._mock_briefing()
+    return json.dumps(mock.model_dump(exclude={"generated_at"}), ensure_ascii=False)
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for frame in body.split("\n\n"):
+        if not frame:
+            continue
+        event_line, data_line = frame.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line[6:])))
+    return events
+
+
+async def test_fake_tokens_spell_mock_briefing_in_order():
+    tokens = [token async for token in ai_service._fake_tokens()]
+    assert len(tokens) > 1
+    assert all(0 < len(token) <= ai_service._FAKE_TOKEN_SIZE for token in tokens)
+    assert "".join(tokens) == _mock_text()
+
+
+async def test_stream_yields_tokens_then_briefing():
+    events = [event async for event in AIService.stream_market_briefing()]
+
+    *tokens, final = events
+    assert all(isinstance(token, str) for token in tokens)
+    assert "".join(tokens) == _mock_text()
+    assert isinstance(final, MarketBriefingResponse)
+    assert final.summary == ai_service._mock_briefing().summary
+
+    # 완성된 브리핑이 있으면 토큰 없이 브리핑만 반환
+    again = [event async for event in AIService.stream_market_briefing()]
+    assert again == [final]
+
+
+async def test_late_joiner_replays_tokens_from_start():
+    first = AIService.stream_market_briefing()
+    head = [await first.__anext__() for _ in range(3)]
+
+    late = [event async for event in AIService.stream_market_briefing()]
+    rest = [event async for event in first]
+
+    assert ai_service._state.generations == 1
+    assert late[:3] == head
+    assert "".join(late[:-1]) == _mock_text()
+    assert late[-1] == rest[-1]
+    assert head + rest[:-1] == late[:-1]
+
+
+async def test_sse_route_emits_token_and_briefing_events():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/ai/market-briefing/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    names = [name for name, _ in events]
+    assert names[-1] == "briefing" and set(names[:-1]) == {"token"}
+    assert "".join(data["delta"] for _, data in events[:-1]) == _mock_text()
+    assert events[-1][1]["key_points"] == ai_service._mock_briefing().key_points
+
+
+async def test_sse_route_emits_error_event_when_generation_fails(monkeypatch):
+    async def failing_tokens():
+        yield '{"briefing": '
+        await asyncio.sleep(0)
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(ai_service, "_fake_tokens", failing_tokens)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/ai/market-briefing/stream")
+
+    events = _events(response.text)
+    assert events[0] == ("token", {"delta": '{"briefing": '})
+    assert events[-1] == ("error", {"message": "model unavailable"})
+    assert "briefing" not in [name for name, _ in events]
+    # 실패한 생성은 정리되어 다음 요청이 새로 생성
+    assert ai_service._state.inflight is None and ai_service._state.current is None
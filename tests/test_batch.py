@@ -0,0 +1,118 @@
+"""배치 API (하위 요청별 결과, 처리 시간 제한, 수락 제어)"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.api.v1 import batch as batch_module
+from app.core.admission import AdmissionController
+from app.core.config import settings
+from app.main import app
+from app.models.news import NewsDetail
+from app.services import news_service as news_service_module
+from app.services.news_service import NewsService
+from app.services.news_store import NewsStore
+
+pytestmark = pytest.mark.anyio
+
+
+def _detail(news_id: str, published: float) -> NewsDetail:
+    return NewsDetail(
+        id=news_id,
+        title=f"기사 {news_id}",
+        content="본문",
+        summary=news_id,
+        source="연합",
+        category="증시",
+        published_at=datetime.fromtimestamp(published, timezone.utc).isoformat(),
+        url=f"https://example.com/{news_id}",
+    )
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch) -> NewsStore:
+    now = datetime.now(timezone.utc).timestamp()
+    store = NewsStore(retention_seconds=3600, breaking_size=10)
+    for i in range(3):
+        store.upsert(_detail(f"n{i}", now - 100 + i))
+    monkeypatch.setattr(news_service_module, "news_store", store)
+    return store
+
+
+async def _batch(*paths: str) -> list[dict]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/api/v1/batch", json={"paths": list(paths)})
+    assert response.status_code == 200
+    results = response.json()["data"]["results"]
+    assert [result["path"] for result in results] == list(paths)
+    return results
+
+
+async def test_mixed_success_and_not_found():
+    results = await _batch("/news/list?limit=2", "/nope", "/news/n1", "/news/missing")
+    assert [result["status"] for result in results] == [200, 404, 200, 404]
+    assert [item["id"] for item in results[0]["body"]["data"]["items"]] == ["n2", "n1"]
+    assert results[1]["body"]["error"]["code"] == "NOT_FOUND"
+    assert results[2]["body"]["data"]["id"] == "n1"
+    assert results[3]["body"]["error"]["code"] == "HTTP_ERROR"
+
+
+async def test_per_item_errors_do_not_fail_the_batch():
+    results = await _batch(
+        "/news/list?limit=0",
+        "/news/list?cursor=!!!",
+        "https://example.com/api/v1/news/list",
+        "/news/breaking/stream",
+        "/market/summary/stream?seg=KR",
+        "/news/list?limit=1",
+    )
+    assert [result["status"] for result in results] == [422, 400, 400, 400, 400, 200]
+    assert results[0]["body"]["error"]["code"] == "VALIDATION_ERROR"
+    assert results[1]["body"]["error"]["message"] == "잘못된 커서입니다"
+
+
+async def test_deadline_cancels_pending_items(monkeypatch):
+    cancelled = asyncio.Event()
+
+    async def slow_detail(news_id: str) -> NewsDetail:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        raise AssertionError("unreachable")
+
+    monkeypatch.setattr(settings, "batch_timeout", 0.05)
+    monkeypatch.setattr(NewsService, "get_news_detail", staticmethod(slow_detail))
+    results = await _batch("/news/list?limit=1", "/news/n1")
+
+    assert [result["status"] for result in results] == [200, 504]
+    assert results[1]["body"]["error"]["code"] == "TIMEOUT"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert batch_module.admission.in_flight == 0
+
+
+async def test_sub_requests_are_counted_by_admission(monkeypatch):
+    controller = AdmissionController(
+        heavy_routes={},
+        heavy_concurrency=1,
+        heavy_queue=0,
+        default_concurrency=10,
+        default_queue=0,
+        queue_timeout=0.1,
+        shed_threshold=100,
+        rate_limit=0.001,
+        rate_burst=2.0,
+        max_clients=100,
+        trust_forwarded=False,
+    )
+    monkeypatch.setattr(settings, "admission_enabled", True)
+    monkeypatch.setattr(batch_module, "admission", controller)
+
+    results = await _batch("/news/n0", "/news/n1", "/news/n2")
+    # 버킷 2개를 하위 요청이 하나씩 소모하고 세 번째는 거절
+    assert sorted(result["status"] for result in results) == [200, 200, 429]
+    assert len(controller._buckets) == 1 and controller.in_flight == 0
@@ -0,0 +1,100 @@
+"""SSE 브로드캐스트 허브 (팬아웃, 버전 중복 제거, 느린 구독자, 연결 종료 정리)"""
+
+import asyncio
+
+import pytest
+
+from app.core.broadcast import HEARTBEAT_FRAME, BroadcastHub, sse_frame
+
+pytestmark = pytest.mark.anyio
+
+
+def _drain(sub) -> list:
+    frames = []
+    while not sub.queue.empty():
+        frames.append(sub.queue.get_nowait())
+    return frames
+
+
+def test_publish_fans_out_one_frame_to_every_subscriber():
+    hub = BroadcastHub(queue_size=4, heartbeat_interval=60)
+    subs = [hub.subscribe("t") for _ in range(3)]
+    other = hub.subscribe("other")
+
+    assert hub.publish("t", b'{"v":1}', version="1") == 3
+    frames = [_drain(sub) for sub in subs]
+    assert frames[0] == [sse_frame("t", b'{"v":1}')]
+    # 직렬화는 한 번만: 모든 구독자가 같은 bytes 객체를 받음
+    assert all(f[0] is frames[0][0] for f in frames)
+    assert _drain(other) == []
+
+
+def test_new_subscriber_receives_latest_frame():
+    hub = BroadcastHub(queue_size=4, heartbeat_interval=60)
+    hub.publish("t", b"1", version="1")
+    hub.publish("t", b"2", version="2")
+    assert _drain(hub.subscribe("t")) == [sse_frame("t", b"2")]
+
+
+def test_same_version_is_not_republished():
+    hub = BroadcastHub(queue_size=4, heartbeat_interval=60)
+    sub = hub.subscribe("t")
+    assert hub.publish("t", b"1", version="a") == 1
+    assert hub.publish("t", b"1", version="a") == 0
+    assert hub.publish("t", b"2", version="b") == 1
+    # version 없는 발행은 항상 전달
+    assert hub.publish("t", b"3") == 1
+    assert hub.publish("t", b"3") == 1
+    assert len(_drain(sub)) == 4
+
+
+def test_slow_subscriber_is_dropped_without_blocking_others():
+    hub = BroadcastHub(queue_size=2, heartbeat_interval=60)
+    slow = hub.subscribe("t")
+    fast = hub.subscribe("t")
+
+    # fast만 매번 소비하고 slow는 큐(2개)를 넘기면 끊김
+    for version in range(3):
+        hub.publish("t", str(version).encode(), version=str(version))
+        assert _drain(fast) == [sse_frame("t", str(version).encode())]
+
+    assert hub.evictions == 1 and slow.closed
+    assert hub.subscriber_count("t") == 1
+    # 끊긴 구독자의 대기 프레임은 버리고 종료 신호만 남음
+    assert _drain(slow) == [None]
+    assert hub.publish("t", b"3", version="3") == 1
+
+
+async def test_stream_ends_after_eviction():
+    hub = BroadcastHub(queue_size=1, heartbeat_interval=60)
+    sub = hub.subscribe("t")
+    hub.publish("t", b"1", version="1")
+    hub.publish("t", b"2", version="2")
+    assert [frame async for frame in hub.stream(sub)] == []
+    assert hub.subscriber_count() == 0
+
+
+async def test_disconnect_unsubscribes():
+    hub = BroadcastHub(queue_size=4, heartbeat_interval=60)
+    sub = hub.subscribe("t")
+    hub.publish("t", b"1", version="1")
+    stream = hub.stream(sub)
+    assert await stream.__anext__() == sse_frame("t", b"1")
+    assert hub.subscriber_count("t") == 1
+
+    # 클라이언트 연결 종료 = 스트림 제너레이터 종료
+    await stream.aclose()
+    assert hub.subscriber_count() == 0 and "t" not in hub._topics
+    assert hub.publish("t", b"2", version="2") == 0
+
+
+async def test_heartbeat_and_stop_close_all_subscribers():
+    hub = BroadcastHub(queue_size=4, heartbeat_interval=0.01)
+    sub = hub.subscribe("t")
+    hub.start()
+    try:
+        assert await asyncio.wait_for(sub.queue.get(), 1) == HEARTBEAT_FRAME
+    finally:
+        await hub.stop()
+    assert sub.closed and hub.subscriber_count() == 0
+    assert [frame async for frame in hub.stream(sub)] == []
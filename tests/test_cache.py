@@ -0,0 +1,177 @@
+"""인메모리 SWR 캐시 (적중, stale 갱신, 조회 합치기, 갱신 실패, LRU, 무효화)"""
+
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SWRCache
+
+pytestmark = pytest.mark.anyio
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+class _Loader:
+    """호출 횟수를 세고, gate가 열릴 때까지 대기하는 loader"""
+
+    def __init__(self, *values) -> None:
+        self.values = list(values)
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.gate.wait()
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_hit_within_ttl(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a", "b")
+    assert await cache.get("k", loader) == "a"
+    clock.now += 9
+    assert await cache.get("k", loader) == "a"
+    assert loader.calls == 1
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+
+
+async def test_stale_value_served_and_refreshed_once(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a", "b")
+    await cache.get("k", loader)
+
+    clock.now += 15
+    loader.gate.clear()
+    assert await cache.get("k", loader) == "a"
+    assert await cache.get("k", loader) == "a"
+    await _settle()
+    assert loader.calls == 2  # 두 번째 stale 조회는 갱신을 다시 시작하지 않음
+
+    loader.gate.set()
+    await _settle()
+    assert cache.peek("k") == "b"
+    assert cache.stats()["stale_hits"] == 2 and cache.stats()["refreshes"] == 2
+
+
+async def test_expired_beyond_stale_ttl_waits_for_loader(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a", "b")
+    await cache.get("k", loader)
+    clock.now += 31
+    assert await cache.get("k", loader) == "b"
+    assert cache.stats()["misses"] == 2
+
+
+async def test_concurrent_misses_share_one_load(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a")
+    loader.gate.clear()
+    waiters = [asyncio.create_task(cache.get("k", loader)) for _ in range(5)]
+    await _settle()
+    loader.gate.set()
+    assert await asyncio.gather(*waiters) == ["a"] * 5
+    assert loader.calls == 1 and cache.stats()["coalesced"] == 4
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_load(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a")
+    loader.gate.clear()
+    first = asyncio.create_task(cache.get("k", loader))
+    second = asyncio.create_task(cache.get("k", loader))
+    await _settle()
+    first.cancel()
+    loader.gate.set()
+    assert await second == "a"
+    assert cache.peek("k") == "a"
+
+
+async def test_background_refresh_error_keeps_stale_value(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a", RuntimeError("upstream down"), "c")
+    await cache.get("k", loader)
+
+    clock.now += 15
+    assert await cache.get("k", loader) == "a"
+    await _settle()
+    assert cache.stats()["refresh_errors"] == 1
+    assert cache.peek("k") == "a" and not cache._inflight
+
+    # 다음 stale 조회에서 다시 갱신
+    assert await cache.get("k", loader) == "a"
+    await _settle()
+    assert cache.peek("k") == "c"
+
+
+async def test_miss_error_propagates_to_waiters(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    with pytest.raises(RuntimeError):
+        await cache.get("k", _Loader(RuntimeError("boom")))
+    assert cache.peek("k") is None and cache.stats()["refresh_errors"] == 1
+
+
+async def test_lru_evicts_least_recently_used(clock):
+    removed = []
+    cache = SWRCache("test", ttl=10, stale_ttl=20, max_entries=2)
+    cache._on_removed = removed.append  # type: ignore[method-assign]
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert await cache.get("a", _Loader()) == 1  # a를 최근 사용으로
+    cache.set("c", 3)
+
+    assert cache.peek("b") is None and cache.peek("a") == 1 and cache.peek("c") == 3
+    assert removed == ["b"] and cache.stats()["evictions"] == 1
+
+
+async def test_invalidate_discards_inflight_refresh(clock):
+    updates = []
+    cache = SWRCache("test", ttl=10, stale_ttl=20, on_update=lambda k, v: updates.append(v))
+    loader = _Loader("a", "old", "new")
+    await cache.get("k", loader)
+
+    clock.now += 15
+    loader.gate.clear()
+    assert await cache.get("k", loader) == "a"  # 백그라운드 갱신 시작
+    cache.invalidate("k")
+    loader.gate.set()
+    await _settle()
+    # 무효화 전에 시작한 갱신 결과로 다시 채워지지 않음
+    assert cache.peek("k") is None and updates == ["a"]
+
+    assert await cache.get("k", loader) == "new"
+    assert cache.peek("k") == "new"
+
+
+async def test_invalidate_all_keeps_result_for_existing_waiters(clock):
+    cache = SWRCache("test", ttl=10, stale_ttl=20)
+    loader = _Loader("a")
+    loader.gate.clear()
+    waiter = asyncio.create_task(cache.get("k", loader))
+    await _settle()
+    cache.invalidate()
+    loader.gate.set()
+    assert await waiter == "a"
+    assert cache.peek("k") is None and not cache._inflight
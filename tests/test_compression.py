@@ -0,0 +1,94 @@
+"""응답 압축 (사전 압축 gzip 이어 붙이기, 인코딩 협상, ETag 일관성)"""
+
+import gzip
+import json
+import os
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, choose_encoding, deflate_segment
+from app.core.config import settings
+from app.core.etag import ConditionalGetRoute
+from app.core.responses import PreEncodedJSONResponse, payload_encoder
+
+pytestmark = pytest.mark.anyio
+
+DATA = {"items": [{"id": f"n{i}", "title": f"기사 제목 {i}"} for i in range(200)]}
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(route_class=ConditionalGetRoute)
+
+    @router.get("/data")
+    async def data() -> PreEncodedJSONResponse:
+        return PreEncodedJSONResponse(payload_encoder.encode(DATA))
+
+    app.include_router(router)
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
+    return app
+
+
+async def _get(headers: dict[str, str]) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/data", headers=headers)
+
+
+@pytest.mark.parametrize(
+    ("prefix", "body", "suffix"),
+    [
+        (b'{"data":', b'{"a":1}', b"}"),
+        (b"", os.urandom(50_000), b'"}}'),
+        (b"[", json.dumps(DATA, ensure_ascii=False).encode() * 20, b""),
+    ],
+)
+def test_gzip_spliced_round_trip(prefix, body, suffix):
+    spliced = compression.gzip_spliced(prefix, body, deflate_segment(body), suffix)
+    assert gzip.decompress(spliced) == prefix + body + suffix
+
+
+def test_choose_encoding():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip, deflate, br", allow_brotli=False) == "gzip"
+    assert choose_encoding("br;q=0, gzip;q=0.5") == "gzip"
+    assert choose_encoding("identity") is None
+    assert choose_encoding("*;q=0") is None
+
+
+async def test_gzip_response_decodes_to_json_body():
+    hits = compression.stats.precompressed_hits
+    response = await _get({"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert compression.stats.precompressed_hits == hits + 1
+    body = response.json()
+    assert body["success"] is True and body["data"] == DATA
+
+
+async def test_cached_gzip_preferred_when_brotli_also_accepted():
+    hits = compression.stats.precompressed_hits
+    response = await _get({"Accept-Encoding": "br, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert compression.stats.precompressed_hits == hits + 1
+    assert response.json()["data"] == DATA
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli 미설치")
+async def test_brotli_only_compressed_by_middleware():
+    response = await _get({"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.json()["data"] == DATA
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip", "br"])
+async def test_same_etag_on_200_and_304(accept_encoding):
+    response = await _get({"Accept-Encoding": accept_encoding})
+    etag = response.headers["etag"]
+    assert response.status_code == 200 and etag.startswith('W/"')
+
+    not_modified = await _get({"Accept-Encoding": accept_encoding, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
@@ -0,0 +1,129 @@
+"""커서 페이지네이션 (커서 인코딩, 뉴스 목록 next_cursor 순회)"""
+
+import base64
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.core.cursor import decode_cursor, encode_cursor
+from app.main import app
+from app.models.news import NewsDetail
+from app.services import news_service as news_service_module
+from app.services.news_store import NewsStore
+
+pytestmark = pytest.mark.anyio
+
+
+def _detail(news_id: str, published: float, category: str = "증시") -> NewsDetail:
+    return NewsDetail(
+        id=news_id,
+        title=f"기사 {news_id}",
+        content="본문",
+        summary="요약",
+        source="연합",
+        category=category,
+        published_at=datetime.fromtimestamp(published, timezone.utc).isoformat(),
+        url=f"https://example.com/{news_id}",
+    )
+
+
+@pytest.fixture
+def store(monkeypatch) -> NewsStore:
+    store = NewsStore(retention_seconds=3600, breaking_size=10)
+    monkeypatch.setattr(news_service_module, "news_store", store)
+    return store
+
+
+async def _get(client: httpx.AsyncClient, **params) -> httpx.Response:
+    return await client.get("/api/v1/news/list", params=params)
+
+
+async def _walk(client: httpx.AsyncClient, **params) -> list[list[str]]:
+    pages = []
+    cursor = None
+    while True:
+        query = dict(params, cursor=cursor) if cursor is not None else params
+        response = await _get(client, **query)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        pages.append([item["id"] for item in data["items"]])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            assert not data["has_more"]
+            return pages
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(1700000000.5, "뉴스-1")
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == (1700000000.5, "뉴스-1")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!",
+        "not-base64",
+        base64.urlsafe_b64encode(b"{}").decode(),
+        encode_cursor(1.0),
+        encode_cursor(1.0, "a", "b"),
+    ],
+)
+def test_decode_rejects_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
+
+
+async def test_news_list_walks_every_page_in_order(store, client):
+    now = datetime.now(timezone.utc).timestamp()
+    # 발행 시각이 같은 기사는 ID 역순으로 이어짐
+    for i in range(11):
+        store.upsert(_detail(f"n{i:02d}", now - 100 + i // 3))
+
+    pages = await _walk(client, limit=4)
+    assert [len(page) for page in pages] == [4, 4, 3]
+    ids = [news_id for page in pages for news_id in page]
+    assert ids == sorted(ids, reverse=True)
+    assert sorted(ids) == [f"n{i:02d}" for i in range(11)]
+
+
+async def test_news_list_cursor_ignores_newer_inserts(store, client):
+    now = datetime.now(timezone.utc).timestamp()
+    for i in range(6):
+        store.upsert(_detail(f"n{i}", now - 100 + i))
+
+    first = (await _get(client, limit=3)).json()["data"]
+    assert [item["id"] for item in first["items"]] == ["n5", "n4", "n3"]
+    # 페이지 사이에 새 기사가 들어와도 다음 페이지가 밀리지 않음
+    store.upsert(_detail("n6", now - 10))
+    second = (await _get(client, limit=3, cursor=first["next_cursor"])).json()["data"]
+    assert [item["id"] for item in second["items"]] == ["n2", "n1", "n0"]
+    assert second["next_cursor"] is None
+
+
+async def test_news_list_cursor_per_category(store, client):
+    now = datetime.now(timezone.utc).timestamp()
+    for i in range(5):
+        store.upsert(_detail(f"s{i}", now - 100 + i, "증시"))
+        store.upsert(_detail(f"c{i}", now - 100 + i, "코인"))
+
+    pages = await _walk(client, category="코인", limit=2)
+    assert pages == [["c4", "c3"], ["c2", "c1"], ["c0"]]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["!!!", encode_cursor("어제", "n1"), encode_cursor(1.0, 2), encode_cursor(1.0)],
+)
+async def test_news_list_rejects_invalid_cursor(store, client, cursor):
+    response = await _get(client, cursor=cursor)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "잘못된 커서입니다"
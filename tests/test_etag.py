@@ -0,0 +1,81 @@
+"""ETag 조건부 GET (If-None-Match 비교, 304 응답)"""
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from app.core.etag import ConditionalGetRoute, compute_etag, etag_matches
+from app.models.schemas import APIResponse
+
+pytestmark = pytest.mark.anyio
+
+DATA = {"price": 100, "updated_at": "2024-01-01T09:00:00Z"}
+ETAG = compute_etag(DATA)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(route_class=ConditionalGetRoute)
+
+    @router.get("/data")
+    async def data() -> APIResponse:
+        return APIResponse.encoded_response(DATA)
+
+    @router.get("/missing")
+    async def missing() -> APIResponse:
+        return APIResponse.error_response("NOT_FOUND", "없음")
+
+    app.include_router(router)
+    return app
+
+
+async def _get(path: str = "/data", **headers: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+
+
+def test_etag_ignores_volatile_fields():
+    assert compute_etag({**DATA, "updated_at": "2024-01-02T09:00:00Z"}) == ETAG
+    assert compute_etag({**DATA, "price": 101}) != ETAG
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        (ETAG, True),
+        ("W/" + ETAG, True),
+        ("*", True),
+        (f'"other", W/{ETAG}', True),
+        (f'"a","b",  {ETAG}  ', True),
+        ('"other", W/"another"', False),
+        (ETAG[:-1], False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(ETAG, header) is expected
+
+
+async def test_returns_304_when_etag_matches():
+    first = await _get()
+    assert first.status_code == 200 and first.headers["etag"] == "W/" + ETAG
+    assert first.headers["cache-control"] == "no-cache"
+
+    for header in (first.headers["etag"], ETAG, "*", f'"stale", {first.headers["etag"]}'):
+        response = await _get(if_none_match=header)
+        assert response.status_code == 304 and response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+
+
+async def test_returns_body_when_etag_differs():
+    response = await _get(if_none_match='"stale", W/"older"')
+    assert response.status_code == 200
+    assert response.json()["data"] == DATA
+
+
+async def test_failure_response_has_no_etag():
+    response = await _get("/missing", if_none_match="*")
+    assert response.status_code == 200 and "etag" not in response.headers
+    assert response.json()["success"] is False
@@ -0,0 +1,146 @@
+"""뉴스 검색 역색인 (토큰화, 포스팅 교집합, 커서, 압축)"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.news import NewsDetail
+from app.services import news_index as news_index_module
+from app.services import news_service as news_service_module
+from app.services import news_store as news_store_module
+from app.services.news_index import SearchIndex, tokenize
+from app.services.news_service import NewsService
+from app.services.news_store import NewsStore
+
+pytestmark = pytest.mark.anyio
+
+
+def _detail(news_id: str, published: float, title: str, summary: str = "") -> NewsDetail:
+    return NewsDetail(
+        id=news_id,
+        title=title,
+        content="본문",
+        summary=summary,
+        source="연합",
+        category="증시",
+        published_at=datetime.fromtimestamp(published, timezone.utc).isoformat(),
+        url=f"https://example.com/{news_id}",
+    )
+
+
+def _index(*docs: tuple[str, float, str]) -> SearchIndex:
+    index = SearchIndex(half_life=3600)
+    for news_id, ts, title in docs:
+        index.add(news_id, ts, "증시", title, ())
+    return index
+
+
+def test_tokenize_bigrams_hangul_and_keeps_latin_words():
+    assert tokenize("삼성전자 HBM3E") == ["삼성", "성전", "전자", "hbm3e"]
+    # 색인용 토큰에는 글자 단위(유니그램)도 포함
+    assert tokenize("금값", unigrams=True) == ["금값", "금", "값"]
+    # 한 글자 구간은 그대로 한 토큰
+    assert tokenize("금 ETF") == ["금", "etf"]
+    assert tokenize("ＡＩ 반도체") == ["ai", "반도", "도체"]
+
+
+def test_search_intersects_postings():
+    index = _index(
+        ("a", 100.0, "삼성전자 반도체 투자"),
+        ("b", 200.0, "SK하이닉스 반도체 호황"),
+        ("c", 300.0, "삼성전자 배당 확대"),
+    )
+    keys, total, has_more = index.search("삼성전자 반도체", None, 10)
+    assert [news_id for _, news_id in keys] == ["a"] and total == 1 and not has_more
+
+    keys, total, _ = index.search("반도체", None, 10)
+    assert [news_id for _, news_id in keys] == ["b", "a"] and total == 2
+    assert index.search("반도체 배당", None, 10) == ([], 0, False)
+    assert index.search("없는검색어", None, 10) == ([], 0, False)
+    with pytest.raises(ValueError):
+        index.search("!!!", None, 10)
+
+
+def test_single_character_query_matches_unigrams():
+    index = _index(
+        ("a", 100.0, "금 가격 사상 최고"),
+        ("b", 200.0, "금값 급등"),
+        ("c", 300.0, "은 가격 약세"),
+    )
+    keys, total, _ = index.search("금", None, 10)
+    assert [news_id for _, news_id in keys] == ["b", "a"] and total == 2
+
+
+def test_cursor_continues_after_last_key_without_gaps():
+    index = _index(*((f"n{i:02d}", 100.0 + i // 2, f"코스피 마감 {i}") for i in range(9)))
+    seen = []
+    after = None
+    while True:
+        keys, total, has_more = index.search("코스피", None, 4, after)
+        assert total == 9
+        seen.extend(keys)
+        if not has_more:
+            break
+        after = keys[-1]
+    # 같은 점수(발행 시각)는 ID 역순으로 이어지고 중복/누락 없음
+    assert seen == sorted(seen, reverse=True)
+    assert sorted(news_id for _, news_id in seen) == [f"n{i:02d}" for i in range(9)]
+
+
+def test_compact_drops_removed_docs_and_keeps_results(monkeypatch):
+    monkeypatch.setattr(news_index_module, "_COMPACT_MIN", 2)
+    index = _index(*((f"n{i}", 100.0 + i, f"환율 {i}" if i % 2 else "환율 상승") for i in range(6)))
+    for news_id in ("n0", "n2", "n4"):
+        index.remove(news_id)
+    assert index._dead == 3
+
+    # 삭제가 살아 있는 문서 수를 넘으면 압축되어 문서 번호를 다시 매김
+    index.remove("n1")
+    assert index._dead == 0 and index._ids == ["n3", "n5"]
+    assert "상승" not in index._postings and "1" not in index._postings
+    keys, total, _ = index.search("환율", None, 10)
+    assert [news_id for _, news_id in keys] == ["n5", "n3"] and total == 2
+
+    index.add("n6", 200.0, "증시", "환율 상승", ())
+    keys, _, _ = index.search("환율 상승", None, 10)
+    assert [news_id for _, news_id in keys] == ["n6"]
+
+
+def test_store_compacts_index_after_eviction(monkeypatch):
+    monkeypatch.setattr(news_index_module, "_COMPACT_MIN", 2)
+    now = datetime.now(timezone.utc).timestamp()
+    store = NewsStore(retention_seconds=3600, breaking_size=10)
+    for i in range(3):
+        store.upsert(_detail(f"old{i}", now - 3000 + i, f"유가 하락 {i}"))
+    store.upsert(_detail("new", now - 10, "유가 반등"))
+
+    monkeypatch.setattr(news_store_module.time, "time", lambda: now + 1000)
+    store.prune()
+    assert store._index._ids == ["new"] and store._index._dead == 0
+    items, total, _ = store.search("유가", "전체", 10)
+    assert [item.id for item in items] == ["new"] and total == 1
+
+
+async def test_search_news_pages_korean_queries(monkeypatch):
+    now = datetime.now(timezone.utc).timestamp()
+    store = NewsStore(retention_seconds=3600, breaking_size=10)
+    for i in range(5):
+        store.upsert(_detail(f"gold{i}", now - 100 + i, f"금 시세 {i}", "안전자산 선호"))
+    store.upsert(_detail("silver", now - 50, "은 시세", "안전자산 선호"))
+    monkeypatch.setattr(news_service_module, "news_store", store)
+
+    pages = []
+    cursor = None
+    while True:
+        response = await NewsService.search_news("금", limit=2, cursor=cursor)
+        assert response.total == 5
+        pages.append([item.id for item in response.items])
+        if response.next_cursor is None:
+            assert not response.has_more
+            break
+        cursor = response.next_cursor
+    assert pages == [["gold4", "gold3"], ["gold2", "gold1"], ["gold0"]]
+
+    response = await NewsService.search_news("안전자산", limit=10)
+    assert response.total == 6 and response.next_cursor is None
+    assert response.items[0].id == "silver"
@@ -0,0 +1,128 @@
+"""뉴스 저장소 (유사 기사 병합, 카테고리 타임라인, 보관 기간 정리)"""
+
+from datetime import datetime, timezone
+
+from app.models.news import NewsDetail
+from app.services import news_store as news_store_module
+from app.services.news_store import NewsStore
+
+TITLE = "삼성전자 3분기 영업이익 10조원 돌파 반도체 업황 회복"
+SUMMARY = "삼성전자가 3분기 잠정 실적에서 영업이익 10조원을 넘기며 반도체 업황 회복을 확인했다"
+
+
+def _detail(news_id: str, published: float, source: str, is_breaking: bool = False) -> NewsDetail:
+    return NewsDetail(
+        id=news_id,
+        title=TITLE,
+        content="본문",
+        summary=SUMMARY,
+        source=source,
+        category="증시",
+        published_at=datetime.fromtimestamp(published, timezone.utc).isoformat(),
+        url=f"https://{source}.example/{news_id}",
+        is_breaking=is_breaking,
+    )
+
+
+def _store() -> NewsStore:
+    return NewsStore(retention_seconds=3600, breaking_size=10, dedupe_threshold=0.9)
+
+
+def test_duplicate_merges_into_canonical():
+    now = datetime.now(timezone.utc).timestamp()
+    store = _store()
+    assert store.upsert(_detail("a", now - 60, "연합"))
+    assert store.upsert(_detail("b", now - 30, "뉴시스"))
+
+    assert len(store) == 1 and store.duplicates == 1
+    merged = store.get("b")
+    assert merged is not None and merged.id == "a"
+    assert [source.id for source in merged.alternate_sources] == ["b"]
+    # 다시 수집된 중복 기사는 무시
+    assert not store.upsert(_detail("b", now - 30, "뉴시스"))
+
+
+def test_breaking_duplicate_marks_canonical_breaking():
+    now = datetime.now(timezone.utc).timestamp()
+    store = _store()
+    store.upsert(_detail("a", now - 60, "연합"))
+    store.upsert(_detail("b", now - 30, "뉴시스", is_breaking=True))
+
+    assert store.get("a").is_breaking  # type: ignore[union-attr]
+    assert [item.id for item in store.breaking(10)] == ["a"]
+
+
+def test_duplicate_kept_when_canonical_cannot_be_updated(monkeypatch):
+    now = datetime.now(timezone.utc).timestamp()
+    store = _store()
+    store.upsert(_detail("a", now - 3500, "연합"))
+
+    # 대표 기사가 보관 기간을 지난 뒤 도착한 중복 기사는 병합 대신 별도로 저장
+    monkeypatch.setattr(news_store_module.time, "time", lambda: now + 200)
+    assert store.upsert(_detail("b", now + 100, "뉴시스"))
+    assert store.duplicates == 0
+    assert store.get("b").id == "b"  # type: ignore[union-attr]
+    assert "b" not in store._aliases
+
+
+def _article(news_id: str, published: float, category: str, is_breaking: bool = False):
+    # 유사 기사 병합에 걸리지 않도록 기사마다 다른 제목/요약
+    return _detail(news_id, published, "연합", is_breaking).model_copy(
+        update={"title": f"{category} 기사 {news_id}", "summary": news_id, "category": category}
+    )
+
+
+def test_category_timelines_follow_updates():
+    now = datetime.now(timezone.utc).timestamp()
+    store = _store()
+    store.upsert(_article("a", now - 30, "증시"))
+    store.upsert(_article("b", now - 20, "코인"))
+    store.upsert(_article("c", now - 10, "증시"))
+
+    assert [item.id for item in store.page("전체", 10)[0]] == ["c", "b", "a"]
+    assert [item.id for item in store.page("증시", 10)[0]] == ["c", "a"]
+    assert store.page("해외", 10) == ([], 0, False)
+
+    # 카테고리/발행 시각이 바뀌면 이전 타임라인에서 빠지고 새 위치로 이동
+    store.upsert(_article("a", now - 5, "코인"))
+    assert [item.id for item in store.page("전체", 10)[0]] == ["a", "c", "b"]
+    assert [item.id for item in store.page("증시", 10)[0]] == ["c"]
+    assert [item.id for item in store.page("코인", 10)[0]] == ["a", "b"]
+
+
+def test_retention_evicts_old_articles_and_their_indexes(monkeypatch):
+    now = datetime.now(timezone.utc).timestamp()
+    store = NewsStore(retention_seconds=3600, breaking_size=2, dedupe_threshold=0.9)
+    store.upsert(_article("old", now - 3000, "증시", is_breaking=True))
+    store.upsert(_article("dup-src", now - 2900, "코인"))
+    duplicate = _article("dup-src", now - 2800, "코인").model_copy(update={"id": "dup"})
+    store.upsert(duplicate)
+    store.upsert(_article("new", now - 10, "증시"))
+    assert store._aliases == {"dup": "dup-src"}
+
+    # 보관 기간을 넘긴 기사 제거 (보관 기간 밖 기사는 처음부터 받지 않음)
+    monkeypatch.setattr(news_store_module.time, "time", lambda: now + 1000)
+    assert not store.upsert(_article("stale", now - 3000, "증시"))
+    store.prune()
+
+    assert len(store) == 1 and store.get("old") is None
+    assert [item.id for item in store.page("전체", 10)[0]] == ["new"]
+    assert store.page("코인", 10) == ([], 0, False)
+    assert store._keys.keys() == store._items.keys() == {"new"}
+    assert store.breaking(10) == []
+    assert store.get("dup") is None and not store._aliases
+    assert store.search("증시 기사", "전체", 10)[1] == 1
+    assert store.search("코인", "전체", 10)[1] == 0
+    assert len(store._dedupe) == 1  # type: ignore[arg-type]
+
+
+def test_breaking_keeps_latest_within_capacity():
+    now = datetime.now(timezone.utc).timestamp()
+    store = NewsStore(retention_seconds=3600, breaking_size=2)
+    for i in range(3):
+        store.upsert(_article(f"b{i}", now - 30 + i, "증시", is_breaking=True))
+    assert [item.id for item in store.breaking(10)] == ["b2", "b1"]
+
+    # 속보 해제된 기사는 속보 목록에서 제외
+    store.upsert(_article("b2", now - 28, "증시"))
+    assert [item.id for item in store.breaking(10)] == ["b1"]
@@ -0,0 +1,74 @@
+"""점수 순위 skip list (정렬 리스트 오라클과 무작위 비교)"""
+
+import random
+
+import pytest
+
+from app.services import ranking as ranking_module
+from app.services.ranking import RankedSet
+
+WINDOW = 5
+
+
+def _oracle_order(scores: dict[str, float]) -> list[str]:
+    return [member for _, member in sorted((-score, member) for member, score in scores.items())]
+
+
+def _check(ranked: RankedSet, scores: dict[str, float]) -> None:
+    order = _oracle_order(scores)
+    assert len(ranked) == len(order)
+    assert ranked.top(len(order) + 1) == order
+    assert ranked.top(WINDOW) == order[:WINDOW]
+    for index, member in enumerate(order):
+        assert ranked.rank(member) == index
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_operations_match_sorted_list(seed, monkeypatch):
+    rng = random.Random(seed)
+    # skip list 레벨 선택도 시드에 고정해 실패를 재현할 수 있게 함
+    monkeypatch.setattr(ranking_module.random, "random", rng.random)
+    ranked = RankedSet(window=WINDOW)
+    scores: dict[str, float] = {}
+    members = [f"m{i:02d}" for i in range(40)]
+
+    for _ in range(400):
+        member = rng.choice(members)
+        before = _oracle_order(scores)[:WINDOW]
+        version = ranked.version
+        if member in scores and rng.random() < 0.25:
+            in_window = member in before
+            assert ranked.remove(member)
+            del scores[member]
+            assert (ranked.version > version) == in_window
+        else:
+            # 좁은 점수 범위로 동점(ID 순 정렬)과 같은 점수 재반영을 자주 만든다
+            score = float(rng.randint(-5, 5))
+            touched = rng.random() < 0.5
+            unchanged = scores.get(member) == score
+            scores[member] = score
+            after = _oracle_order(scores)[:WINDOW]
+            changed = ranked.update(member, score, touched)
+            assert changed == (ranked.version > version)
+            if unchanged:
+                assert changed == (touched and member in after)
+            elif before != after:
+                assert changed
+            elif member not in before and member not in after:
+                assert not changed
+        _check(ranked, scores)
+
+    assert not ranked.remove("missing") and ranked.rank("missing") == -1
+
+
+def test_drain_to_empty():
+    ranked = RankedSet(window=WINDOW)
+    scores = {f"m{i}": float(i % 3) for i in range(30)}
+    for member, score in scores.items():
+        ranked.update(member, score)
+    _check(ranked, scores)
+    for member in list(scores):
+        ranked.remove(member)
+        del scores[member]
+        _check(ranked, scores)
+    assert ranked.top(10) == []
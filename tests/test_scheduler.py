@@ -0,0 +1,128 @@
+"""주기 작업 스케줄러 (지터 범위, 실패 시 지수 백오프, 성공 후 초기화)"""
+
+import asyncio
+
+import pytest
+
+from app.core import scheduler as scheduler_module
+from app.core.scheduler import Job, JobStats, Scheduler
+
+pytestmark = pytest.mark.anyio
+
+
+def _job(interval: float = 10.0, jitter: float = 0.0, max_backoff: float = 60.0) -> Job:
+    return Job("job", lambda: asyncio.sleep(0), interval, jitter, max_backoff, JobStats())
+
+
+class _Flaky:
+    """outcomes 순서대로 실패(False)/성공(True)하는 작업"""
+
+    def __init__(self, *outcomes: bool) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        if not self.outcomes.pop(0):
+            raise RuntimeError("upstream down")
+
+
+def test_jitter_stays_within_bounds(monkeypatch):
+    job = _job(interval=10.0, jitter=0.2)
+    delays = [job.next_delay() for _ in range(2000)]
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+    # 한쪽으로 치우치지 않게 퍼짐
+    assert min(delays) < 8.5 and max(delays) > 11.5
+
+    monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: low)
+    assert job.next_delay() == pytest.approx(8.0)
+    monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: high)
+    assert job.next_delay() == pytest.approx(12.0)
+
+
+def test_backoff_doubles_per_failure_up_to_max():
+    job = _job(interval=10.0, max_backoff=60.0)
+    delays = []
+    for failures in range(5):
+        job.stats.consecutive_failures = failures
+        delays.append(job.next_delay())
+    assert delays == [10.0, 20.0, 40.0, 60.0, 60.0]
+
+
+def test_max_backoff_is_never_below_interval():
+    scheduler = Scheduler(jitter=0.0, max_backoff=5.0, shutdown_timeout=1.0)
+    scheduler.add_job("slow", _Flaky(False), interval=30.0)
+    job = scheduler._jobs["slow"]
+    job.stats.consecutive_failures = 3
+    assert job.max_backoff == 30.0 and job.next_delay() == 30.0
+
+
+async def test_failures_back_off_and_success_resets():
+    scheduler = Scheduler(jitter=0.0, max_backoff=100.0, shutdown_timeout=1.0)
+    func = _Flaky(False, False, False, True, False, True)
+    scheduler.add_job("flaky", func, interval=1.0)
+
+    delays: list[float] = []
+
+    async def record(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == 6:
+            scheduler._stopping.set()  # type: ignore[union-attr]
+        await asyncio.sleep(0)
+
+    scheduler._sleep = record  # type: ignore[method-assign]
+    scheduler.start()
+    await asyncio.wait_for(asyncio.gather(*scheduler._tasks), 1)
+
+    assert func.calls == 6
+    assert delays == [2.0, 4.0, 8.0, 1.0, 2.0, 1.0]
+    stats = scheduler.stats()["flaky"]
+    assert stats["runs"] == 6 and stats["failures"] == 4
+    assert stats["consecutive_failures"] == 0 and stats["last_success_at"] is not None
+    assert stats["last_error"] == "RuntimeError('upstream down')"
+
+
+async def test_primed_job_waits_one_interval_before_first_run():
+    scheduler = Scheduler(jitter=0.0, max_backoff=100.0, shutdown_timeout=1.0)
+    scheduler.add_job("ok", _Flaky(True, True), interval=5.0)
+    scheduler.add_job("failing", _Flaky(False, True), interval=5.0)
+    await scheduler.prime()
+    assert scheduler._jobs["ok"].primed and not scheduler._jobs["failing"].primed
+
+    first_sleep: dict[str, float] = {}
+
+    async def record(delay: float) -> None:
+        name = asyncio.current_task().get_name()  # type: ignore[union-attr]
+        first_sleep.setdefault(name, delay)
+        if len(first_sleep) == 2:
+            scheduler._stopping.set()  # type: ignore[union-attr]
+        await asyncio.sleep(0)
+
+    scheduler._sleep = record  # type: ignore[method-assign]
+    scheduler.start()
+    await asyncio.wait_for(asyncio.gather(*scheduler._tasks), 1)
+
+    # 워밍업에 성공한 작업은 한 주기 뒤, 실패한 작업은 즉시 재실행 후 정상 주기
+    assert first_sleep == {"job:ok": 5.0, "job:failing": 5.0}
+    assert scheduler.stats()["ok"]["runs"] == 1
+    assert scheduler.stats()["failing"]["runs"] == 2
+
+
+async def test_stop_cancels_jobs_running_past_shutdown_timeout():
+    scheduler = Scheduler(jitter=0.0, max_backoff=100.0, shutdown_timeout=0.05)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def hang() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    scheduler.add_job("hang", hang, interval=1.0)
+    scheduler.start()
+    await started.wait()
+    await asyncio.wait_for(scheduler.stop(), 1)
+    assert cancelled.is_set() and scheduler._tasks == []
@@ -0,0 +1,168 @@
+"""2단계 캐시 (InMemorySharedStore를 L2로 사용)"""
+
+import asyncio
+
+import pytest
+from pydantic_core import from_json, to_json
+
+from app.core.shared_cache import InMemorySharedStore, TieredCache
+
+pytestmark = pytest.mark.anyio
+
+
+def _cache(name: str = "test", ttl: float = 60.0, **kwargs) -> TieredCache:
+    return TieredCache(
+        name,
+        ttl=ttl,
+        stale_ttl=60.0,
+        encode=to_json,
+        decode=lambda key, data: from_json(data),
+        lock_ttl=1.0,
+        **kwargs,
+    )
+
+
+async def test_remote_key_map_follows_l1_entries():
+    store = InMemorySharedStore()
+    cache = _cache(max_entries=3)
+    await cache.attach(store)
+    try:
+        for i in range(10):
+            await cache.put(f"k{i}", f"v{i}")
+        assert sorted(cache._keys) == ["k7", "k8", "k9"]
+
+        cache.invalidate("k8")
+        assert sorted(cache._keys) == ["k7", "k9"]
+        cache.invalidate()
+        assert cache._keys == {}
+    finally:
+        await cache.detach()
+
+
+async def test_key_map_unused_without_l2():
+    cache = _cache(max_entries=3)
+    for i in range(5):
+        await cache.put(f"k{i}", f"v{i}")
+    assert cache._keys == {}
+
+
+async def _settle() -> None:
+    """구독 태스크가 발행된 메시지를 처리할 때까지 양보"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_in_memory_store_ttl_and_lock_tokens():
+    store = InMemorySharedStore()
+    await store.set("k", b"v", ttl=0.05)
+    assert await store.get("k") == b"v"
+    await asyncio.sleep(0.06)
+    assert await store.get("k") is None
+
+    assert await store.acquire("lock", "a", ttl=1.0)
+    assert not await store.acquire("lock", "b", ttl=1.0)
+    assert not await store.release("lock", "b")
+    assert await store.release("lock", "a")
+    assert await store.acquire("lock", "b", ttl=1.0)
+
+
+async def test_workers_share_one_upstream_load():
+    store = InMemorySharedStore()
+    first, second = _cache(), _cache()
+    await first.attach(store)
+    await second.attach(store)
+    calls = []
+    release = asyncio.Event()
+
+    async def loader():
+        calls.append(1)
+        await release.wait()
+        return "fresh"
+
+    try:
+        holder = asyncio.create_task(first.get("key", loader))
+        await _settle()
+        waiter = asyncio.create_task(second.get("key", loader))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        assert await holder == "fresh"
+        assert await waiter == "fresh"
+        assert len(calls) == 1
+        assert first.stats()["lock_acquired"] == 1
+        assert second.stats()["lock_waits"] == 1
+
+        # 새 워커는 L2 값을 바로 사용
+        third = _cache()
+        await third.attach(store)
+        assert await third.get("key", loader) == "fresh"
+        assert len(calls) == 1 and third.stats()["l2_hits"] == 1
+        await third.detach()
+    finally:
+        await first.detach()
+        await second.detach()
+
+
+async def test_waiter_loads_itself_when_lock_holder_stalls():
+    store = InMemorySharedStore()
+    cache = _cache()
+    cache.lock_ttl = 0.1
+    await cache.attach(store)
+    try:
+        # 다른 워커가 락을 잡은 채 값을 쓰지 않음
+        await store.acquire("yangbong:cache:test:lock:key", "other", ttl=5.0)
+
+        async def loader():
+            return "own"
+
+        assert await cache.get("key", loader) == "own"
+        assert cache.stats()["lock_waits"] == 1
+    finally:
+        await cache.detach()
+
+
+async def test_remote_update_refreshes_other_workers_l1():
+    store = InMemorySharedStore()
+    first, second = _cache(), _cache()
+    await first.attach(store)
+    await second.attach(store)
+    await _settle()
+    try:
+        await first.put("key", "v1")
+        assert await second.get("key", _fail_loader) == "v1"
+
+        await first.put("key", "v2")
+        await _settle()
+        assert second.peek("key") == "v2"
+        assert second.stats()["remote_updates"] == 1
+
+        # 이 워커가 쓰지 않은 키는 무시하고 다음 조회 때 L2에서 읽음
+        await first.put("other", "x")
+        await _settle()
+        assert second.peek("other") is None
+        assert await second.get("other", _fail_loader) == "x"
+    finally:
+        await first.detach()
+        await second.detach()
+
+
+async def test_lease_grants_one_worker_until_expiry():
+    store = InMemorySharedStore()
+    first, second = _cache(), _cache()
+    await first.attach(store)
+    await second.attach(store)
+    try:
+        assert await first.lease("refresh", ttl=0.05)
+        assert not await second.lease("refresh", ttl=0.05)
+        assert not await first.lease("refresh", ttl=0.05)
+        await asyncio.sleep(0.06)
+        assert await second.lease("refresh", ttl=0.05)
+    finally:
+        await first.detach()
+        await second.detach()
+
+    assert await _cache().lease("refresh", ttl=0.05)
+
+
+async def _fail_loader():
+    raise AssertionError("L2 값이 있으면 업스트림을 조회하지 않아야 함")
@@ -0,0 +1,130 @@
+"""공유 메모리 이중 버퍼 영역 (seq 프로토콜, 슬롯 전환, writer 교체)"""
+
+import multiprocessing
+import os
+
+import pytest
+
+from app.core.shm import SharedRegion, SnapshotTooLarge, WriterLock
+
+SIZE = 64 + 2 * 1024
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    return str(tmp_path / "snapshot")
+
+
+def _read(region: SharedRegion):
+    return region.read(lambda seq, data: (seq, bytes(data)))
+
+
+def test_empty_region_has_no_snapshot(path):
+    region = SharedRegion(path, SIZE)
+    assert _read(region) is None
+    region.close()
+
+
+def test_writes_alternate_slots(path):
+    writer = SharedRegion(path, SIZE)
+    reader = SharedRegion(path, SIZE)
+
+    assert writer.write(b"first") == 2
+    seq, first_view = reader.current()  # type: ignore[misc]
+    assert (seq, bytes(first_view)) == (2, b"first")
+
+    assert writer.write(b"second") == 4
+    assert _read(reader) == (4, b"second")
+    # 다음 기록은 다른 슬롯에 하므로 이전 뷰는 그대로 (seq가 2 이상 바뀌면 불안정으로 판단)
+    assert bytes(first_view) == b"first"
+    assert not reader.is_stable(2)
+    writer.write(b"third")
+    assert bytes(first_view[:5]) == b"third"
+    assert _read(reader) == (6, b"third")
+
+
+def test_read_retries_when_slot_is_overwritten(path):
+    writer = SharedRegion(path, SIZE)
+    reader = SharedRegion(path, SIZE)
+    writer.write(b"old")
+    calls = []
+
+    def read_during_writes(seq: int, data: memoryview) -> bytes:
+        calls.append(seq)
+        if len(calls) == 1:
+            # 읽는 도중 writer가 두 번 기록해 읽던 슬롯이 덮어써짐
+            writer.write(b"new-1")
+            writer.write(b"new-2")
+        return bytes(data)
+
+    assert reader.read(read_during_writes) == b"new-2"
+    assert calls == [2, 6]
+
+
+def test_torn_write_keeps_last_complete_snapshot(path):
+    writer = SharedRegion(path, SIZE)
+    reader = SharedRegion(path, SIZE)
+    writer.write(b"complete")
+    # writer가 비활성 슬롯 기록 중 종료됨 (seq 홀수, 활성 슬롯은 그대로)
+    _, _, boot, seq, slot, *lengths = writer._header()
+    writer._write_header(seq + 1, slot, lengths)
+    writer.view[writer._slot_offset(1 - slot)] = 0xFF
+
+    assert _read(reader) == (seq + 1, b"complete")
+
+    successor = SharedRegion(path, SIZE)
+    assert successor.write(b"next") == seq + 2
+    assert _read(reader) == (seq + 2, b"next")
+
+
+def test_snapshot_too_large(path):
+    region = SharedRegion(path, SIZE)
+    with pytest.raises(SnapshotTooLarge):
+        region.write(b"x" * (region.slot_size + 1))
+    assert _read(region) is None
+    region.write(b"x" * region.slot_size)
+    assert len(_read(region)[1]) == region.slot_size  # type: ignore[index]
+
+
+def test_previous_boot_is_ignored(path):
+    old = SharedRegion(path, SIZE, boot=1)
+    old.write(b"previous run")
+
+    reader = SharedRegion(path, SIZE, boot=2)
+    assert _read(reader) is None
+
+    writer = SharedRegion(path, SIZE, boot=2)
+    assert writer.write(b"this run") == 2
+    assert _read(reader) == (2, b"this run")
+    assert _read(old) is None
+
+
+def _crashing_writer(path: str, ready) -> None:
+    lock = WriterLock(path + ".lock")
+    assert lock.try_acquire()
+    region = SharedRegion(path, SIZE)
+    region.write(b"from crashed writer")
+    _, _, _, seq, slot, *lengths = region._header()
+    region._write_header(seq + 1, slot, lengths)
+    ready.set()
+    os._exit(1)
+
+
+def test_writer_takeover_after_crash(path):
+    lock = WriterLock(path + ".lock")
+    ctx = multiprocessing.get_context("fork")
+    ready = ctx.Event()
+    child = ctx.Process(target=_crashing_writer, args=(path, ready))
+    child.start()
+    assert ready.wait(10)
+    child.join(10)
+    assert child.exitcode == 1
+
+    # 종료된 프로세스의 락은 OS가 해제하고, 남은 완전한 스냅샷은 계속 읽힘
+    assert lock.try_acquire()
+    region = SharedRegion(path, SIZE)
+    assert _read(region)[1] == b"from crashed writer"  # type: ignore[index]
+    region.write(b"from new writer")
+    assert _read(region) == (4, b"from new writer")
+    assert not WriterLock(path + ".lock").try_acquire()
+    lock.release()
@@ -0,0 +1,204 @@
+"""비동기 Supabase 접근 계층 (InMemorySupabase, AsyncSupabaseClient, SupabaseREST)"""
+
+import json
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.supabase_async import (
+    AsyncSupabaseClient,
+    InMemorySupabase,
+    SupabaseError,
+    SupabaseREST,
+    _matches,
+    get_async_supabase,
+)
+
+pytestmark = pytest.mark.anyio
+
+NEWS = [
+    {"id": "n1", "category": "증시", "published_at": "2024-01-01T09:00:00Z", "views": 3},
+    {"id": "n2", "category": "경제", "published_at": "2024-01-02T09:00:00Z", "views": 1},
+    {"id": "n3", "category": "증시", "published_at": "2024-01-03T09:00:00Z", "views": 2},
+]
+
+
+@pytest.fixture
+def db() -> InMemorySupabase:
+    return InMemorySupabase({"news": NEWS})
+
+
+@pytest.fixture
+def restore_client():
+    previous = AsyncSupabaseClient.get_client()
+    yield
+    AsyncSupabaseClient.use(previous)
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("eq.2024-01-02T09:00:00Z", True),
+        ("neq.2024-01-02T09:00:00Z", False),
+        ("gt.2024-01-01", True),
+        ("gte.2024-01-02T09:00:00Z", True),
+        ("lt.2024-01-02T09:00:00Z", False),
+        ("lte.2024-01-02T09:00:00Z", True),
+        ("in.(2024-01-01T09:00:00Z,2024-01-02T09:00:00Z)", True),
+        ("in.(2024-01-03T09:00:00Z)", False),
+    ],
+)
+def test_matches_operators(expression, expected):
+    assert _matches(NEWS[1], {"published_at": expression}) is expected
+
+
+def test_matches_requires_every_filter():
+    assert _matches(NEWS[0], None)
+    assert _matches(NEWS[0], {"category": "eq.증시", "views": "eq.3"})
+    assert not _matches(NEWS[0], {"category": "eq.증시", "views": "eq.2"})
+
+
+def test_matches_compares_by_column_type():
+    row = {"views": 10, "score": 2.5, "pinned": True, "deleted_at": None}
+    # 숫자는 수치 비교 (문자열 비교면 "10" < "9")
+    assert _matches(row, {"views": "gt.9"})
+    assert _matches(row, {"views": "in.(9,10)", "score": "lt.10"})
+    assert _matches(row, {"pinned": "eq.true", "deleted_at": "is.null"})
+    assert not _matches(row, {"pinned": "is.false"})
+    # null은 비교 연산에서 일치하지 않음
+    assert not _matches(row, {"deleted_at": "eq.None"})
+    assert not _matches(row, {"missing": "neq.1"})
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"views": "like.*1*"}, {"views": "gt.many"}, {"pinned": "eq.yes"}, {"views": "is.1"}],
+)
+def test_matches_rejects_unsupported_filters(filters):
+    row = {"views": 10, "pinned": True}
+    with pytest.raises(SupabaseError) as error:
+        _matches(row, filters)
+    assert error.value.status_code == 400
+
+
+async def test_select_orders_numbers_numerically_and_nulls_last():
+    db = InMemorySupabase(
+        {"stocks": [{"id": "a", "rank": 9}, {"id": "b", "rank": None}, {"id": "c", "rank": 10}]}
+    )
+    assert [row["id"] for row in await db.select("stocks", order="rank.asc")] == ["a", "c", "b"]
+    assert [row["id"] for row in await db.select("stocks", order="rank.desc")] == ["b", "c", "a"]
+
+
+async def test_select_filters_orders_and_pages(db):
+    rows = await db.select("news", filters={"category": "eq.증시"}, order="published_at.desc")
+    assert [row["id"] for row in rows] == ["n3", "n1"]
+
+    rows = await db.select("news", columns="id, views", order="category.asc,views.desc")
+    assert rows == [
+        {"id": "n2", "views": 1},
+        {"id": "n1", "views": 3},
+        {"id": "n3", "views": 2},
+    ]
+
+    rows = await db.select("news", order="published_at.asc", limit=1, offset=1)
+    assert [row["id"] for row in rows] == ["n2"]
+    assert await db.select("missing") == []
+
+
+async def test_rows_are_copied(db):
+    rows = await db.select("news")
+    rows[0]["views"] = 100
+    assert (await db.select("news", filters={"id": "eq.n1"}))[0]["views"] == 3
+    assert NEWS[0]["views"] == 3
+
+
+async def test_insert_upsert_update_delete(db):
+    await db.insert("news", [{"id": "n4", "category": "코인"}])
+    with pytest.raises(SupabaseError) as error:
+        await db.insert("news", [{"id": "n4", "category": "해외"}])
+    assert error.value.status_code == 409
+
+    await db.insert("news", [{"id": "n4", "category": "해외"}], upsert=True)
+    assert (await db.select("news", filters={"id": "eq.n4"}))[0]["category"] == "해외"
+
+    await db.insert("tags", [{"name": "ai"}], on_conflict="name")
+    await db.insert("tags", [{"name": "ai", "count": 2}], upsert=True, on_conflict="name")
+    assert await db.select("tags") == [{"name": "ai", "count": 2}]
+
+    updated = await db.update("news", {"views": 0}, {"category": "eq.증시"})
+    assert sorted(row["id"] for row in updated) == ["n1", "n3"]
+    assert all(row["views"] == 0 for row in await db.select("news", filters={"id": "in.(n1,n3)"}))
+
+    deleted = await db.delete("news", {"published_at": "lt.2024-01-02"})
+    assert [row["id"] for row in deleted] == ["n1"]
+    assert [row["id"] for row in await db.select("news", order="id.asc")] == ["n2", "n3", "n4"]
+
+
+async def test_client_singleton_use_and_close(db, restore_client):
+    AsyncSupabaseClient.use(db)
+    assert get_async_supabase() is db
+    assert await AsyncSupabaseClient.open() is db
+
+    await AsyncSupabaseClient.close()
+    assert get_async_supabase() is None
+
+
+async def test_open_without_settings_returns_none(monkeypatch, restore_client):
+    AsyncSupabaseClient.use(None)
+    monkeypatch.setattr(settings, "supabase_url", None)
+    assert await AsyncSupabaseClient.open() is None
+    assert get_async_supabase() is None
+
+
+async def test_rest_client_sends_postgrest_requests():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "DELETE":
+            return httpx.Response(404, text="not found")
+        if request.method == "PATCH":
+            return httpx.Response(204)
+        return httpx.Response(200, json=[{"id": "n1"}])
+
+    client = SupabaseREST(
+        "https://db.example/",
+        "secret",
+        max_connections=2,
+        max_keepalive=2,
+        timeout=1.0,
+        max_concurrency=2,
+        transport=httpx.MockTransport(handler),
+    )
+    with pytest.raises(RuntimeError):
+        await client.select("news")
+
+    await client.open()
+    try:
+        rows = await client.select(
+            "news", filters={"category": "eq.증시"}, order="published_at.desc", limit=5
+        )
+        assert rows == [{"id": "n1"}]
+        await client.insert("news", [{"id": "n1"}], upsert=True, on_conflict="id")
+        assert await client.update("news", {"views": 1}, {"id": "eq.n1"}) == []
+        with pytest.raises(SupabaseError) as error:
+            await client.delete("news", {"id": "eq.n9"})
+        assert error.value.status_code == 404
+    finally:
+        await client.close()
+
+    select, insert, update, _ = requests
+    assert select.url.path == "/rest/v1/news"
+    assert dict(select.url.params) == {
+        "select": "*",
+        "category": "eq.증시",
+        "order": "published_at.desc",
+        "limit": "5",
+    }
+    assert select.headers["apikey"] == "secret"
+    assert select.headers["authorization"] == "Bearer secret"
+    assert insert.headers["prefer"] == "return=representation,resolution=merge-duplicates"
+    assert dict(insert.url.params) == {"on_conflict": "id"}
+    assert json.loads(insert.content) == [{"id": "n1"}]
+    assert update.method == "PATCH" and dict(update.url.params) == {"id": "eq.n1"}
@@ -0,0 +1,130 @@
+"""업스트림 클라이언트 서킷 브레이커 (가짜 업스트림 앱 사용)"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.providers.fake_upstream import create_app
+from app.providers.upstream import CircuitOpenError, UpstreamClient, UpstreamError
+
+pytestmark = pytest.mark.anyio
+
+BASE_URL = "http://upstream.test"
+HOST = "upstream.test"
+RESET = 0.05
+
+
+def _client(transport: httpx.AsyncBaseTransport) -> UpstreamClient:
+    return UpstreamClient(
+        max_connections=10,
+        max_per_host=10,
+        connect_timeout=1.0,
+        read_timeout=5.0,
+        retries=0,
+        retry_budget_ratio=0.0,
+        breaker_threshold=2,
+        breaker_reset=RESET,
+        transport=transport,
+    )
+
+
+async def _open_circuit(client: UpstreamClient) -> None:
+    for _ in range(2):
+        with pytest.raises(UpstreamError):
+            await client.get_json(f"{BASE_URL}/market/summary", {"seg": "KR"})
+    assert client.breaker(HOST).state == "open"
+
+
+async def test_breaker_opens_and_recovers_after_trial():
+    fake = create_app(failure_rate=1.0)
+    client = _client(httpx.ASGITransport(app=fake))
+    await client.open()
+    try:
+        await _open_circuit(client)
+        with pytest.raises(CircuitOpenError):
+            await client.get_json(f"{BASE_URL}/market/summary")
+
+        fake.state.failure_rate = 0.0
+        await asyncio.sleep(RESET)
+        data = await client.get_json(f"{BASE_URL}/market/summary", {"seg": "KR"})
+        assert data["items"]
+        assert client.breaker(HOST).state == "closed"
+    finally:
+        await client.close()
+
+
+async def test_failed_trial_reopens_circuit():
+    client = _client(httpx.ASGITransport(app=create_app(failure_rate=1.0)))
+    await client.open()
+    try:
+        await _open_circuit(client)
+        await asyncio.sleep(RESET)
+        with pytest.raises(UpstreamError):
+            await client.get_json(f"{BASE_URL}/market/summary")
+        assert client.breaker(HOST).state == "open"
+        with pytest.raises(CircuitOpenError):
+            await client.get_json(f"{BASE_URL}/market/summary")
+    finally:
+        await client.close()
+
+
+async def test_cancelled_trial_releases_half_open_slot():
+    fake = create_app(failure_rate=1.0)
+    client = _client(httpx.ASGITransport(app=fake))
+    await client.open()
+    try:
+        await _open_circuit(client)
+        fake.state.failure_rate = 0.0
+        fake.state.latency = 10.0
+        await asyncio.sleep(RESET)
+
+        trial = asyncio.create_task(client.get_json(f"{BASE_URL}/market/summary"))
+        await asyncio.sleep(0.01)
+        breaker = client.breaker(HOST)
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            await client.get_json(f"{BASE_URL}/market/summary")
+
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        fake.state.latency = 0.0
+        data = await client.get_json(f"{BASE_URL}/market/summary", {"seg": "KR"})
+        assert data["items"]
+        assert breaker.state == "closed"
+    finally:
+        await client.close()
+
+
+async def test_decoding_error_counts_as_failed_trial():
+    fake = create_app(failure_rate=1.0)
+    fake_transport = httpx.ASGITransport(app=fake)
+    broken = {"body": False}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if broken["body"]:
+            # gzip 헤더와 맞지 않는 본문 → httpx.DecodingError
+            return httpx.Response(200, headers={"content-encoding": "gzip"}, content=b"not gzip")
+        return await fake_transport.handle_async_request(request)
+
+    client = _client(httpx.MockTransport(handler))
+    await client.open()
+    try:
+        await _open_circuit(client)
+        broken["body"] = True
+        await asyncio.sleep(RESET)
+        with pytest.raises(UpstreamError):
+            await client.get_json(f"{BASE_URL}/market/summary")
+        breaker = client.breaker(HOST)
+        assert breaker.state == "open"
+
+        broken["body"] = False
+        fake.state.failure_rate = 0.0
+        await asyncio.sleep(RESET)
+        body = await client.get_json(f"{BASE_URL}/market/summary", {"seg": "KR"})
+        assert body["items"]
+        assert breaker.state == "closed"
+    finally:
+        await client.close()